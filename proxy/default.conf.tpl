@@ -1,8 +1,34 @@
 server {
     listen ${LISTEN_PORT};
 
-    location /static {
-        alias /vol/static;
+    location /static/static/ {
+        alias /vol/static/static/;
+    }
+
+    # Mídia privada: acessível apenas pelo X-Accel-Redirect da rota
+    # autenticada. Os nomes são o hash do conteúdo, então a resposta é
+    # imutável; o Cache-Control vem da aplicação.
+    location /protected-media/ {
+        internal;
+        alias /vol/static/media/;
+    }
+
+    # Upload em partes: o nginx recebe cada parte inteira antes de repassar
+    # ao uwsgi, então uma conexão lenta não ocupa um worker da aplicação.
+    location /api/recipe/image-uploads/ {
+        uwsgi_pass              ${APP_HOST}:${APP_PORT};
+        include                 /etc/nginx/uwsgi_params;
+        uwsgi_request_buffering on;
+        client_max_body_size    2M;
+        client_body_buffer_size 1M;
+    }
+
+    # Rotas assíncronas de leitura, servidas pelo uvicorn (ASGI).
+    location /api/async/ {
+        proxy_pass              http://${ASGI_HOST}:${ASGI_PORT};
+        proxy_set_header        Host $host;
+        proxy_set_header        X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_http_version      1.1;
     }
 
     location / {
@@ -0,0 +1,29 @@
+"""
+Rotas assíncronas de leitura (api/async/), servidas pelo ASGI.
+
+Espelham as rotas de leitura de receitas, Tags, ingredientes e do
+usuário autenticado; as escritas continuam nas rotas síncronas.
+"""
+from django.urls import path
+
+from core.async_views import async_read_view
+from recipe import views as recipe_views
+from user import views as user_views
+
+urlpatterns = [
+    path('recipe/recipes/', async_read_view(
+        recipe_views.RecipeViewSet.as_view({'get': 'list'})),
+        name='async-recipe-list'),
+    path('recipe/recipes/<int:pk>/', async_read_view(
+        recipe_views.RecipeViewSet.as_view({'get': 'retrieve'})),
+        name='async-recipe-detail'),
+    path('recipe/tags/', async_read_view(
+        recipe_views.TagViewSet.as_view({'get': 'list'})),
+        name='async-tag-list'),
+    path('recipe/ingredients/', async_read_view(
+        recipe_views.IngredientViewSet.as_view({'get': 'list'})),
+        name='async-ingredient-list'),
+    path('user/me/', async_read_view(
+        user_views.ManageUserView.as_view()),
+        name='async-user-me'),
+]
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'core',
     'rest_framework',
     'rest_framework.authtoken',
@@ -52,14 +53,19 @@ INSTALLED_APPS = [
     'recipe',
 ]
 
+# Sessão, CSRF, autenticação e mensagens de core.middleware não executam
+# nas rotas com estes prefixos, autenticadas apenas por token.
+TOKEN_ROUTE_PREFIXES = ('/api/',)
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    'core.middleware.CsrfViewMiddleware',
+    'core.middleware.AuthenticationMiddleware',
+    'core.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.QueryBudgetMiddleware',
 ]
 
 ROOT_URLCONF = 'app.urls'
@@ -86,13 +92,30 @@ WSGI_APPLICATION = 'app.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
+# Conexões persistentes por DB_CONN_MAX_AGE segundos em cada thread. Com
+# DB_POOL_MAX_SIZE as conexões vêm do pool do processo (core.db), com
+# health check (pre-ping) no checkout, e voltam a ele ao fim de cada
+# requisição.
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 0))
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'core.db' if DB_POOL_MAX_SIZE
+        else 'django.db.backends.postgresql',
         'HOST': os.environ.get('DB_HOST'),
         'NAME': os.environ.get('DB_NAME'),
         'USER': os.environ.get('DB_USER'),
         'PASSWORD': os.environ.get('DB_PASS'),
+        'CONN_MAX_AGE': 0 if DB_POOL_MAX_SIZE
+        else int(os.environ.get('DB_CONN_MAX_AGE', 0)),
+        'POOL': {
+            'MAX_SIZE': DB_POOL_MAX_SIZE,
+            'TIMEOUT': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+            'IDLE_TIMEOUT': float(
+                os.environ.get('DB_POOL_IDLE_TIMEOUT', 300)
+            ),
+            'PRE_PING': bool(int(os.environ.get('DB_POOL_PRE_PING', 1))),
+        },
     }
 }
 
@@ -134,11 +157,20 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/3.2/howto/static-files/
 
 STATIC_URL = '/static/static/'
-MEDIA_URL = '/static/media/'
+# A mídia é privada: servida pela rota autenticada recipe:media, que com
+# MEDIA_ACCEL_REDIRECT delega a transferência ao nginx (X-Accel-Redirect).
+MEDIA_URL = '/api/recipe/media/'
 
 MEDIA_ROOT = '/vol/web/media'
 STATIC_ROOT = '/vol/web/static'
 
+MEDIA_ACCEL_REDIRECT = bool(int(os.environ.get('MEDIA_ACCEL_REDIRECT', 0)))
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+# Os nomes dos arquivos são o hash do conteúdo: podem ser cacheados sempre.
+MEDIA_CACHE_MAX_AGE = int(
+    os.environ.get('MEDIA_CACHE_MAX_AGE', 365 * 24 * 60 * 60)
+)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
@@ -147,10 +179,96 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'core.User'
 
 
+# JSON das respostas e requisições com orjson (core.renderers e
+# core.parsers); sem o orjson instalado usa o json da stdlib.
+API_FAST_JSON = bool(int(os.environ.get('API_FAST_JSON', 1)))
+
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer' if API_FAST_JSON
+        else 'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser' if API_FAST_JSON
+        else 'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Sem CACHE_LOCATION o cache é local ao processo, suficiente apenas com
+# um único worker (desenvolvimento e testes).
+if os.environ.get('CACHE_LOCATION'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': os.environ.get('CACHE_LOCATION'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Cache token -> usuário de cada worker (user.authentication).
+AUTH_TOKEN_CACHE_SIZE = int(os.environ.get('AUTH_TOKEN_CACHE_SIZE', 10000))
+AUTH_TOKEN_CACHE_TTL = int(os.environ.get('AUTH_TOKEN_CACHE_TTL', 300))
+
+# Validade, em segundos, dos access e refresh tokens (user.tokens).
+ACCESS_TOKEN_TTL = int(os.environ.get('ACCESS_TOKEN_TTL', 300))
+REFRESH_TOKEN_TTL = int(
+    os.environ.get('REFRESH_TOKEN_TTL', 30 * 24 * 60 * 60)
+)
+
+RECIPE_PAGE_SIZE = int(os.environ.get('RECIPE_PAGE_SIZE', 50))
+RECIPE_MAX_PAGE_SIZE = int(os.environ.get('RECIPE_MAX_PAGE_SIZE', 500))
+RECIPE_BULK_MAX_OPERATIONS = int(
+    os.environ.get('RECIPE_BULK_MAX_OPERATIONS', 1000)
+)
+RECIPE_EXPORT_CHUNK_SIZE = int(
+    os.environ.get('RECIPE_EXPORT_CHUNK_SIZE', 2000)
+)
+RECIPE_IMPORT_BATCH_SIZE = int(
+    os.environ.get('RECIPE_IMPORT_BATCH_SIZE', 1000)
+)
+RECIPE_LIST_CACHE_TIMEOUT = int(
+    os.environ.get('RECIPE_LIST_CACHE_TIMEOUT', 300)
+)
+# Variantes das imagens: threads por worker e geração síncrona (testes).
+RECIPE_IMAGE_WORKERS = int(os.environ.get('RECIPE_IMAGE_WORKERS', 2))
+RECIPE_IMAGE_VARIANTS_SYNC = bool(
+    int(os.environ.get('RECIPE_IMAGE_VARIANTS_SYNC', 0))
+)
+# Upload da imagem em partes (recipe.uploads): diretório dos arquivos
+# parciais, tamanho total, tamanho de cada parte, validade e limites de
+# dimensões conferidos pelo cabeçalho da imagem.
+RECIPE_IMAGE_UPLOAD_DIR = os.environ.get(
+    'RECIPE_IMAGE_UPLOAD_DIR', '/vol/web/uploads'
+)
+RECIPE_IMAGE_MAX_SIZE = int(
+    os.environ.get('RECIPE_IMAGE_MAX_SIZE', 20 * 1024 * 1024)
+)
+RECIPE_IMAGE_CHUNK_SIZE = int(
+    os.environ.get('RECIPE_IMAGE_CHUNK_SIZE', 1024 * 1024)
+)
+RECIPE_IMAGE_UPLOAD_TTL = int(
+    os.environ.get('RECIPE_IMAGE_UPLOAD_TTL', 24 * 60 * 60)
+)
+RECIPE_IMAGE_MAX_SIDE = int(os.environ.get('RECIPE_IMAGE_MAX_SIDE', 8000))
+RECIPE_IMAGE_MAX_PIXELS = int(
+    os.environ.get('RECIPE_IMAGE_MAX_PIXELS', 40 * 1000 * 1000)
+)
+RECIPE_ATTR_SEARCH_LIMIT = int(
+    os.environ.get('RECIPE_ATTR_SEARCH_LIMIT', 10)
+)
+RECIPE_ATTR_SEARCH_MAX_LIMIT = int(
+    os.environ.get('RECIPE_ATTR_SEARCH_MAX_LIMIT', 50)
+)
+
 SPECTACULAR_SETTINGS = {
     'COMPONENT_SPLIT_REQUEST': True,
 }
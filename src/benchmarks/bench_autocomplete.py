@@ -0,0 +1,82 @@
+"""
+Benchmark de latência do autocomplete de ingredientes.
+
+Gera BENCH_INGREDIENTS ingredientes (padrão 50 mil) para um usuário e
+mede a latência da rota com o parâmetro q, sem o cache das
+listagens. O alvo aceito é p50 de até 20 ms (ver o README). Execução:
+
+    python manage.py test benchmarks -p "bench_autocomplete.py"
+"""
+
+import os
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+INGREDIENTS = int(os.environ.get('BENCH_INGREDIENTS', 50000))
+QUERIES = ['tom', 'tomate', 'tomatte', 'cebo', 'cebola ral', 'xyz']
+BASES = [
+    'Tomate', 'Cebola', 'Alho', 'Batata', 'Cenoura', 'Arroz', 'Feijão',
+    'Farinha', 'Açúcar', 'Pimenta', 'Orégano', 'Manjericão', 'Salsa',
+    'Queijo', 'Leite', 'Manteiga', 'Ovo', 'Frango', 'Carne', 'Peixe',
+    'Camarão', 'Azeite', 'Limão', 'Laranja', 'Morango', 'Banana', 'Milho',
+    'Ervilha', 'Lentilha', 'Gengibre', 'Canela', 'Coentro', 'Uva',
+    'Abacaxi', 'Maçã', 'Grão-de-bico', 'Cebolinha', 'Vinagre', 'Sal',
+    'Cravo',
+]
+DETAILS = [
+    'picado', 'ralado', 'fresco', 'seco', 'moído', 'inteiro', 'orgânico',
+    'cozido', 'assado', 'frito', 'em pó', 'em cubos', 'fatiado',
+    'triturado', 'desidratado', 'congelado', 'defumado', 'doce', 'amargo',
+    'cru', 'italiano', 'japonês', 'caipira', 'light', 'integral',
+]
+ROUNDS = 20
+
+
+class AutocompleteBenchmark(TestCase):
+    """Mede p50/p95 do autocomplete com o índice trigram."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'bench@test.com', 'benchpass123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO core_ingredient (user_id, name, updated_at)
+                SELECT %s, base || ' ' || detail || ' ' || i, now()
+                FROM unnest(%s) AS base, unnest(%s) AS detail,
+                    generate_series(1, %s) AS i
+                """,
+                [self.user.id, BASES, DETAILS,
+                 INGREDIENTS // (len(BASES) * len(DETAILS))],
+            )
+            cursor.execute('ANALYZE core_ingredient')
+
+    def test_report(self):
+        """Imprime a latência por termo buscado."""
+        url = reverse('recipe:ingredient-list')
+        lines = [f'\n{INGREDIENTS} ingredientes (ms por requisição)',
+                 f'{"q":<20}{"p50":>8}{"p95":>8}']
+        for query in QUERIES:
+            timings = []
+            for _ in range(ROUNDS):
+                # Sem o cache das listagens: mede a consulta, não o hit.
+                cache.clear()
+                started = time.perf_counter()
+                self.client.get(url, {'q': query})
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            lines.append(
+                f'{query:<20}{statistics.median(timings):>8.1f}'
+                f'{timings[int(ROUNDS * 0.95) - 1]:>8.1f}')
+
+        print('\n'.join(lines))
@@ -0,0 +1,60 @@
+"""
+Benchmark da obtenção de conexões com o PostgreSQL.
+
+Mede ms por requisição simulada (obter a conexão, SELECT 1 e devolver)
+abrindo uma conexão nova a cada vez, como sem CONN_MAX_AGE, e com o pool
+de core.db, com e sem o pre-ping. Execução:
+
+    python manage.py test benchmarks -p "bench_db_pool.py"
+"""
+
+import time
+
+import psycopg2
+
+from django.db import connection
+from django.test import TestCase
+
+from core.db.pool import ConnectionPool
+
+REQUESTS = 300
+
+
+class ConnectionPoolBenchmark(TestCase):
+    """Compara conexões novas por requisição e o pool."""
+
+    def _connect(self):
+        return psycopg2.connect(**connection.get_connection_params())
+
+    def _ms_per_request(self, checkout, release):
+        """Retorna ms por checkout, SELECT 1 e devolução."""
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            conn = checkout()
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            release(conn)
+
+        return (time.perf_counter() - start) / REQUESTS * 1000
+
+    def _pool_ms(self, pre_ping):
+        pool = ConnectionPool('bench', max_size=1, pre_ping=pre_ping)
+        try:
+            return self._ms_per_request(
+                lambda: pool.checkout(self._connect), pool.release)
+        finally:
+            pool.close()
+
+    def test_report(self):
+        """Imprime ms/requisição e verifica o ganho do pool."""
+        results = {
+            'conexão nova': self._ms_per_request(
+                self._connect, lambda conn: conn.close()),
+            'pool, pre-ping': self._pool_ms(pre_ping=True),
+            'pool, sem pre-ping': self._pool_ms(pre_ping=False),
+        }
+
+        print(f'\nms/requisição ({REQUESTS} requisições)')
+        for name, ms in results.items():
+            print(f'{name:<22}{ms:>8.3f}')
+        self.assertLess(results['pool, pre-ping'], results['conexão nova'])
@@ -0,0 +1,105 @@
+"""
+Benchmark do renderer e do parser JSON (stdlib x orjson).
+
+Monta páginas da listagem de receitas (BENCH_JSON_ROWS receitas, padrão
+500, o RECIPE_MAX_PAGE_SIZE) e o detalhe de uma receita no formato da
+API, com 3 Tags e 3 ingredientes cada, e mede MB/s do JSONRenderer e do
+FastJSONRenderer e do JSONParser e do FastJSONParser. Execução:
+
+    python manage.py test benchmarks -p "bench_json.py"
+"""
+
+import io
+import os
+import time
+import unittest
+
+from django.test import SimpleTestCase
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer, orjson
+
+ROWS = int(os.environ.get('BENCH_JSON_ROWS', 500))
+ROUNDS = 20
+URL = 'http://localhost:8000/api/recipe/media/uploads/recipe'
+
+
+def recipe(i) -> dict:
+    """Retorna uma receita no formato do RecipeDetailSerializer."""
+    return {
+        'id': i,
+        'title': f'Bolo de cenoura com cobertura nº {i}',
+        'time_minutes': 45,
+        'price': '12.50',
+        'link': f'https://example.com/receitas/{i}',
+        'tags': [{'id': i + j, 'name': f'Sobremesa {j}'} for j in range(3)],
+        'ingredients': [
+            {'id': i + j, 'name': f'Açúcar mascavo {j}'} for j in range(3)],
+        'description': 'Misture os ingredientes e asse por 40 minutos. ' * 4,
+        'image': f'{URL}/ab/{i:064x}.jpg',
+        'image_status': 'ready',
+        'image_variants': {
+            name: {fmt: f'{URL}/variants/{name}/{i:064x}.{fmt}'
+                   for fmt in ('jpeg', 'webp')}
+            for name in ('thumb', 'medium')
+        },
+    }
+
+
+def list_page() -> dict:
+    """Retorna uma página da listagem de receitas."""
+    fields = ('id', 'title', 'time_minutes', 'price', 'link', 'tags',
+              'ingredients')
+    results = [
+        {field: data[field] for field in fields}
+        for data in map(recipe, range(1, ROWS + 1))
+    ]
+    return {
+        'count': ROWS * 10,
+        'next': 'http://localhost:8000/api/recipe/recipes/?cursor=cD0xMjM0',
+        'previous': None,
+        'results': results,
+    }
+
+
+@unittest.skipIf(orjson is None, 'orjson não instalado')
+class JSONBenchmark(SimpleTestCase):
+    """Compara MB/s do json da stdlib e do orjson."""
+
+    def _mb_per_second(self, func, size):
+        """Retorna o melhor resultado (MB/s) de ROUNDS execuções."""
+        best = 0
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            func()
+            best = max(best, size / (time.perf_counter() - start) / 1e6)
+
+        return best
+
+    def test_report(self):
+        """Imprime MB/s e verifica o ganho do orjson."""
+        lines = ['\nMB/s (melhor de %d)' % ROUNDS,
+                 f'{"payload":<32}{"stdlib":>10}{"orjson":>10}']
+        for name, data in ((f'listagem ({ROWS} receitas)', list_page()),
+                           ('detalhe', recipe(1))):
+            body = JSONRenderer().render(data)
+            self.assertEqual(FastJSONRenderer().render(data), body)
+
+            results = {}
+            for op, std, fast in (
+                    ('render', lambda: JSONRenderer().render(data),
+                     lambda: FastJSONRenderer().render(data)),
+                    ('parse', lambda: JSONParser().parse(io.BytesIO(body)),
+                     lambda: FastJSONParser().parse(io.BytesIO(body)))):
+                results[op] = (
+                    self._mb_per_second(std, len(body)),
+                    self._mb_per_second(fast, len(body)),
+                )
+                lines.append(f'{name + " " + op:<32}'
+                             f'{results[op][0]:>10.0f}{results[op][1]:>10.0f}')
+                self.assertGreater(results[op][1], results[op][0])
+
+        print('\n'.join(lines))
@@ -0,0 +1,94 @@
+"""
+Verificação dos planos das listagens por usuário.
+
+Gera BENCH_RECIPES receitas (padrão 1 milhão) e 200 Tags e ingredientes
+por usuário, distribuídos entre BENCH_USERS usuários, e verifica com
+EXPLAIN que as listagens usam índice sem nó de Sort. Execução:
+
+    python manage.py test benchmarks -p "bench_list_plans.py"
+"""
+
+import os
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from benchmarks.utils import explain
+
+RECIPES = int(os.environ.get('BENCH_RECIPES', 1000000))
+USERS = int(os.environ.get('BENCH_USERS', 200))
+ATTRS_PER_USER = 200
+
+INDEX_NODES = ('Index Scan', 'Index Only Scan', 'Bitmap Index Scan')
+
+ENDPOINTS = [
+    ('recipe:recipe-list', 'core_recipe'),
+    ('recipe:tag-list', 'core_tag'),
+    ('recipe:ingredient-list', 'core_ingredient'),
+]
+
+
+class ListPlanBenchmark(TestCase):
+    """Verifica o acesso por índice das listagens do usuário."""
+
+    def setUp(self):
+        users = get_user_model().objects.bulk_create([
+            get_user_model()(email=f'bench{i}@test.com', password='!')
+            for i in range(USERS)
+        ])
+        self.user = users[0]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        user_ids = [user.id for user in users]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO core_recipe
+                    (user_id, title, time_minutes, price, description, link,
+                     image_status, image_variants, updated_at)
+                SELECT (%s::int[])[1 + i %% %s], 'Receita ' || i, 10, 5.00,
+                    '', '', 'none', '{}', now()
+                FROM generate_series(1, %s) AS i
+                """,
+                [user_ids, USERS, RECIPES],
+            )
+            for table in ('core_tag', 'core_ingredient'):
+                cursor.execute(
+                    f"""
+                    INSERT INTO {table} (user_id, name, updated_at)
+                    SELECT user_id, 'Item ' || i, now()
+                    FROM unnest(%s::int[]) AS user_id,
+                        generate_series(1, %s) AS i
+                    """,
+                    [user_ids, ATTRS_PER_USER],
+                )
+            for table in ('core_recipe', 'core_tag', 'core_ingredient'):
+                cursor.execute(f'ANALYZE {table}')
+
+    def _list_query(self, url_name, table):
+        """Retorna o SQL da consulta principal da listagem."""
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(reverse(url_name))
+
+        return next(
+            query['sql'] for query in captured.captured_queries
+            if f'FROM "{table}"' in query['sql']
+        )
+
+    def test_report(self):
+        """Imprime os planos e verifica o uso de índice sem Sort."""
+        lines = [f'\n{RECIPES} receitas, {USERS} usuários']
+        for url_name, table in ENDPOINTS:
+            elapsed, nodes = explain(self._list_query(url_name, table))
+            lines.append(f'{url_name:<24}{elapsed:>8.1f} ms  {nodes}')
+
+            self.assertTrue(set(INDEX_NODES) & set(nodes), nodes)
+            self.assertNotIn('Sort', nodes)
+
+        print('\n'.join(lines))
@@ -0,0 +1,100 @@
+"""
+Benchmark de escritas no Update das Tags de uma receita.
+
+Compara a estratégia antiga (clear + add) com o Update por diferença
+(services.set_relations) em edições típicas. Execução:
+
+    python manage.py test benchmarks -p "bench_m2m_updates.py"
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Recipe, Tag
+from recipe import services
+
+RECIPE_SIZE = 20
+
+SCENARIOS = [
+    ('sem alteração', lambda names: names),
+    ('adiciona 1', lambda names: names + ['Nova']),
+    ('remove 1', lambda names: names[1:]),
+    ('troca 1', lambda names: names[1:] + ['Nova']),
+    ('limpa todas', lambda names: []),
+]
+
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def clear_and_add(recipe, tag_ids):
+    """Estratégia antiga: apaga e reinsere todos os vínculos."""
+    recipe.tags.clear()
+    services.add_relations('tags', [(recipe.id, t) for t in tag_ids])
+
+
+def apply_diff(recipe, tag_ids):
+    """Estratégia nova: aplica apenas a diferença."""
+    services.set_relations('tags', {recipe.id: tag_ids})
+
+
+class M2MUpdateBenchmark(TestCase):
+    """Mede statements e linhas escritas por edição típica."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'bench@test.com', 'benchpass123')
+        self.names = [f'Tag {i}' for i in range(RECIPE_SIZE)]
+        self.tags = {
+            tag.name: tag.id for tag in Tag.objects.bulk_create(
+                [Tag(user=self.user, name=name) for name in self.names + [
+                    'Nova']]
+            )
+        }
+
+    def _measure(self, strategy, new_names):
+        """Executa a estratégia e retorna (statements, linhas escritas)."""
+        recipe = Recipe.objects.create(
+            user=self.user,
+            title='Benchmark',
+            time_minutes=1,
+            price=Decimal('1.00'),
+        )
+        services.add_relations(
+            'tags', [(recipe.id, self.tags[name]) for name in self.names])
+        through = Recipe.tags.through
+        before = set(through.objects.filter(
+            recipe=recipe).values_list('id', flat=True))
+
+        with CaptureQueriesContext(connection) as captured:
+            strategy(recipe, [self.tags[name] for name in new_names])
+
+        after = set(through.objects.filter(
+            recipe=recipe).values_list('id', flat=True))
+        statements = sum(
+            query['sql'].lstrip().upper().startswith(WRITE_STATEMENTS)
+            for query in captured.captured_queries
+        )
+
+        return statements, len(before - after) + len(after - before)
+
+    def test_report(self):
+        """Imprime a comparação de escritas por cenário."""
+        lines = [
+            f'\nReceita com {RECIPE_SIZE} Tags '
+            '(statements de escrita / linhas escritas)',
+            f'{"cenário":<16}{"clear + add":>16}{"diferença":>16}',
+        ]
+        for label, edit in SCENARIOS:
+            new_names = edit(list(self.names))
+            old = self._measure(clear_and_add, new_names)
+            new = self._measure(apply_diff, new_names)
+            lines.append(
+                f'{label:<16}{"%d / %d" % old:>16}{"%d / %d" % new:>16}')
+
+            self.assertLessEqual(new[1], old[1])
+
+        print('\n'.join(lines))
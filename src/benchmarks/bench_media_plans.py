@@ -0,0 +1,119 @@
+"""
+Verificação do plano da permissão da rota de mídia.
+
+Gera BENCH_MEDIA_RECIPES receitas (padrão 100 mil) com imagem e
+variantes, distribuídas entre BENCH_USERS usuários, e verifica com
+EXPLAIN que a consulta do dono do arquivo usa índice, sem varrer as
+receitas do usuário. Compara com a busca anterior, pelo JSON das
+variantes. Execução:
+
+    python manage.py test benchmarks -p "bench_media_plans.py"
+"""
+
+import os
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from benchmarks.utils import explain
+from core.models import Recipe
+from recipe import images
+
+RECIPES = int(os.environ.get('BENCH_MEDIA_RECIPES', 100000))
+USERS = int(os.environ.get('BENCH_USERS', 100))
+
+INDEX_NODES = ('Index Scan', 'Index Only Scan', 'Bitmap Index Scan')
+
+
+@override_settings(MEDIA_ROOT='/nonexistent')
+class MediaPlanBenchmark(TestCase):
+    """Verifica o acesso por índice da permissão das imagens."""
+
+    def setUp(self):
+        users = get_user_model().objects.bulk_create([
+            get_user_model()(email=f'bench{i}@test.com', password='!')
+            for i in range(USERS)
+        ])
+        self.user = users[0]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        variants = ', '.join(
+            f"'{variant}', jsonb_build_object("
+            + ', '.join(f"'{ext}', 'uploads/recipe/' || i || '_{variant}"
+                        f".{ext}'" for ext in images.FORMATS)
+            + ')'
+            for variant in images.VARIANTS
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO core_recipe
+                    (user_id, title, time_minutes, price, description, link,
+                     image, image_status, image_variants, updated_at)
+                SELECT (%s::int[])[1 + i %% %s], 'Receita ' || i, 10, 5.00,
+                    '', '', 'uploads/recipe/' || i || '.jpg', 'ready',
+                    jsonb_build_object({variants}), now()
+                FROM generate_series(1, %s) AS i
+                """,
+                [[user.id for user in users], USERS, RECIPES],
+            )
+            cursor.execute(
+                """
+                INSERT INTO core_recipemedia (recipe_id, name)
+                SELECT id, image FROM core_recipe
+                UNION ALL
+                SELECT id, name.value
+                FROM core_recipe,
+                    jsonb_each(image_variants) AS variant,
+                    jsonb_each_text(variant.value) AS name
+                """
+            )
+            for table in ('core_recipe', 'core_recipemedia'):
+                cursor.execute(f'ANALYZE {table}')
+
+        # Arquivo da última receita gravada do usuário: a busca anterior lê
+        # todas as receitas dele antes de encontrá-lo (como no 404).
+        self.name = Recipe.objects.filter(user=self.user).values_list(
+            'image_variants', flat=True).latest('id')['thumb']['webp']
+
+    def _owner_query(self):
+        """Retorna o SQL da consulta do dono do arquivo na rota."""
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(reverse('recipe:media', args=[self.name]))
+
+        return next(
+            query['sql'] for query in captured.captured_queries
+            if 'core_recipemedia' in query['sql']
+        )
+
+    def _previous_query(self):
+        """Retorna o SQL da busca anterior, pelo JSON das variantes."""
+        lookup = Q(image=self.name)
+        for variant in images.VARIANTS:
+            for ext in images.FORMATS:
+                lookup |= Q(**{f'image_variants__{variant}__{ext}': self.name})
+        queryset = Recipe.objects.filter(lookup, user=self.user).values('id')
+        sql, params = queryset[:1].query.sql_with_params()
+
+        return connection.cursor().mogrify(sql, params).decode()
+
+    def test_report(self):
+        """Imprime os planos e verifica o uso de índice."""
+        lines = [f'\n{RECIPES} receitas, {USERS} usuários']
+        previous_ms, previous_nodes = explain(self._previous_query())
+        lines.append(f'{"anterior (JSON)":<20}{previous_ms:>8.2f} ms  '
+                     f'{previous_nodes}')
+        elapsed, nodes = explain(self._owner_query())
+        lines.append(f'{"RecipeMedia":<20}{elapsed:>8.2f} ms  {nodes}')
+        print('\n'.join(lines))
+
+        self.assertTrue(set(INDEX_NODES) & set(nodes), nodes)
+        self.assertNotIn('Seq Scan', nodes)
+        self.assertLess(elapsed, previous_ms)
@@ -0,0 +1,82 @@
+"""
+Benchmark do custo por requisição das pilhas de middlewares.
+
+Mede µs/requisição do handler do Django (middlewares, resolução da URL e
+uma view vazia) com a pilha anterior, completa em todas as rotas, e com
+a atual, em que as rotas da API pulam sessão, CSRF, autenticação e
+mensagens. A view lê request.user, como as views autenticadas. Execução:
+
+    python manage.py test benchmarks -p "bench_middleware.py"
+"""
+
+import time
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import path
+
+REQUESTS = 20000
+
+FULL_MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+
+def ping(request):
+    """View vazia; o usuário vem da sessão ou do token (aqui, nenhum)."""
+    getattr(request, 'user', None)
+    return HttpResponse(b'{}', content_type='application/json')
+
+
+urlpatterns = [
+    path('api/ping/', ping),
+    path('admin/ping/', ping),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, DEBUG=False)
+class MiddlewareBenchmark(SimpleTestCase):
+    """Compara µs/requisição das pilhas de middlewares."""
+
+    def _us_per_request(self, middleware, url):
+        """Retorna µs/requisição do handler com a pilha informada."""
+        with override_settings(MIDDLEWARE=middleware):
+            handler = BaseHandler()
+            handler.load_middleware()
+        factory = RequestFactory()
+
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = handler.get_response(factory.get(url))
+        elapsed = time.perf_counter() - start
+        self.assertEqual(response.status_code, 200)
+
+        # Custo de montar os requests, descontado do total.
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            factory.get(url)
+        elapsed -= time.perf_counter() - start
+
+        return elapsed / REQUESTS * 1e6
+
+    def test_report(self):
+        """Imprime µs/requisição e verifica o ganho nas rotas da API."""
+        results = {}
+        for name, middleware, url in (
+                ('anterior, /api/', FULL_MIDDLEWARE, '/api/ping/'),
+                ('atual, /api/', settings.MIDDLEWARE, '/api/ping/'),
+                ('atual, /admin/', settings.MIDDLEWARE, '/admin/ping/')):
+            results[name] = self._us_per_request(middleware, url)
+
+        print(f'\nµs/requisição ({REQUESTS} requisições)')
+        for name, us in results.items():
+            print(f'{name:<20}{us:>10.1f}')
+        self.assertLess(results['atual, /api/'], results['anterior, /api/'])
@@ -0,0 +1,123 @@
+"""
+Benchmark dos filtros de receitas por Tags.
+
+Gera BENCH_RECIPES receitas (padrão 1 milhão) com 3 Tags cada e compara
+o plano antigo (JOIN + DISTINCT) com os semi-joins (EXISTS) da rota.
+Execução:
+
+    python manage.py test benchmarks -p "bench_recipe_filters.py"
+"""
+
+import os
+import re
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from benchmarks.utils import explain
+from core.models import Recipe, Tag
+
+RECIPES = int(os.environ.get('BENCH_RECIPES', 1000000))
+TAGS = 50
+PAGE_SIZE = 50
+
+# Nós do plano que indicam a remoção de duplicatas do JOIN.
+DEDUPLICATION_NODES = ('Unique', 'HashAggregate', 'GroupAggregate')
+
+
+class RecipeFilterBenchmark(TestCase):
+    """Compara JOIN + DISTINCT com EXISTS nos filtros por Tags."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'bench@test.com', 'benchpass123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.tags = [
+            tag.id for tag in Tag.objects.bulk_create(
+                [Tag(user=self.user, name=f'Tag {i}') for i in range(TAGS)])
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO core_recipe
+                    (user_id, title, time_minutes, price, description, link,
+                     image_status, image_variants, updated_at)
+                SELECT %s, 'Receita ' || i, 10, 5.00, '', '', 'none', '{}',
+                    now()
+                FROM generate_series(1, %s) AS i
+                """,
+                [self.user.id, RECIPES],
+            )
+            cursor.execute(
+                """
+                INSERT INTO core_recipe_tags (recipe_id, tag_id)
+                SELECT recipe.id, (%s::int[])[1 + (recipe.id + offs) %% %s]
+                FROM core_recipe AS recipe, (VALUES (0), (7), (19)) AS o(offs)
+                WHERE recipe.user_id = %s
+                """,
+                [self.tags, TAGS, self.user.id],
+            )
+            cursor.execute('ANALYZE core_recipe')
+            cursor.execute('ANALYZE core_recipe_tags')
+
+    def _join_distinct(self, params):
+        """Plano antigo: um JOIN por condição seguido de DISTINCT."""
+        queryset = Recipe.objects.filter(user=self.user)
+        include = [int(i) for i in params['tags'].split(',') if int(i) > 0]
+        exclude = [-int(i) for i in params['tags'].split(',') if int(i) < 0]
+        if params.get('tags_mode') == 'all':
+            for tag_id in include:
+                queryset = queryset.filter(tags__id=tag_id)
+        else:
+            queryset = queryset.filter(tags__id__in=include)
+        if exclude:
+            queryset = queryset.exclude(tags__id__in=exclude)
+
+        return queryset.order_by('-id').distinct()
+
+    def _exists(self, params):
+        """Plano novo: a consulta principal da rota, sem o LIMIT."""
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(
+                reverse('recipe:recipe-list'),
+                {**params, 'page_size': PAGE_SIZE},
+            )
+
+        return re.sub(r' LIMIT \d+$', '', captured.captured_queries[0]['sql'])
+
+    def test_report(self):
+        """Imprime o tempo e a deduplicação de cada estratégia."""
+        # Cada receita recebe as Tags de índice i, i + 7 e i + 19.
+        a, b, c = self.tags[0], self.tags[7], self.tags[1]
+        scenarios = [
+            ('any de 2', {'tags': f'{a},{b}'}),
+            ('all de 2', {'tags': f'{a},{b}', 'tags_mode': 'all'}),
+            ('any - 1', {'tags': f'{a},{b},-{c}'}),
+        ]
+        lines = [
+            f'\n{RECIPES} receitas (ms: primeira página de {PAGE_SIZE} / '
+            'todas as receitas filtradas)',
+            f'{"cenário":<12}{"JOIN+DISTINCT":>20}{"EXISTS":>20}',
+        ]
+        for label, params in scenarios:
+            old = self._join_distinct(params)
+            page = old[:PAGE_SIZE + 1].query.sql_with_params()
+            old_page, _nodes = explain(*page)
+            old_all, _nodes = explain(*old.query.sql_with_params())
+
+            sql = self._exists(params)
+            new_page, _nodes = explain(f'{sql} LIMIT {PAGE_SIZE + 1}')
+            new_all, new_nodes = explain(sql)
+            lines.append(
+                f'{label:<12}{f"{old_page:.1f} / {old_all:.1f}":>20}'
+                f'{f"{new_page:.1f} / {new_all:.1f}":>20}')
+
+            self.assertFalse(set(DEDUPLICATION_NODES) & set(new_nodes))
+
+        print('\n'.join(lines))
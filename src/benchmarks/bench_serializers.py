@@ -0,0 +1,112 @@
+"""
+Benchmark da serialização da listagem de receitas.
+
+Gera BENCH_ROWS receitas (padrão 5 mil) com 3 Tags e 3 ingredientes cada
+e mede linhas/s do RecipeSerializer (ModelSerializer com prefetch) e do
+RecipeReadSerializer (dicts de values()), incluindo as queries e a
+renderização JSON. Execução:
+
+    python manage.py test benchmarks -p "bench_serializers.py"
+"""
+
+import os
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import TestCase
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from core.models import Ingredient, Recipe, Tag
+from recipe import readers
+from recipe.serializers import RecipeSerializer
+
+ROWS = int(os.environ.get('BENCH_ROWS', 5000))
+ATTRS_PER_RECIPE = 3
+ROUNDS = 3
+
+
+class SerializerBenchmark(TestCase):
+    """Compara linhas/s do ModelSerializer e do serializer rápido."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'bench@test.com', 'benchpass123')
+        self.context = {'request': APIRequestFactory().get('/')}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO core_recipe
+                    (user_id, title, time_minutes, price, description, link,
+                     image_status, image_variants, updated_at)
+                SELECT %s, 'Receita ' || i, 30, 12.50, '', '', 'none', '{}',
+                    now()
+                FROM generate_series(1, %s) AS i
+                """,
+                [self.user.id, ROWS],
+            )
+            for table, column in (('tag', 'tag_id'),
+                                  ('ingredient', 'ingredient_id')):
+                cursor.execute(
+                    f"""
+                    INSERT INTO core_{table} (user_id, name, updated_at)
+                    SELECT %s, 'Item ' || i, now()
+                    FROM generate_series(1, 50) AS i
+                    """,
+                    [self.user.id],
+                )
+                cursor.execute(
+                    f"""
+                    INSERT INTO core_recipe_{table}s (recipe_id, {column})
+                    SELECT r.id, a.id
+                    FROM core_recipe r
+                    CROSS JOIN LATERAL (
+                        SELECT id FROM core_{table}
+                        WHERE user_id = %s
+                        ORDER BY (id + r.id) %% 50 LIMIT %s
+                    ) a
+                    WHERE r.user_id = %s
+                    """,
+                    [self.user.id, ATTRS_PER_RECIPE, self.user.id],
+                )
+
+    def _model_serializer(self):
+        queryset = Recipe.objects.filter(user=self.user).prefetch_related(
+            Prefetch('tags', queryset=Tag.objects.order_by('id')),
+            Prefetch(
+                'ingredients', queryset=Ingredient.objects.order_by('id')),
+        ).order_by('-id')
+        return RecipeSerializer(queryset, many=True, context=self.context)
+
+    def _read_serializer(self):
+        queryset = Recipe.objects.filter(user=self.user).order_by(
+            '-id').values(*readers.RecipeReadSerializer.values_fields)
+        return readers.RecipeReadSerializer(
+            queryset, many=True, context=self.context)
+
+    def _rows_per_second(self, build):
+        """Retorna o melhor resultado (linhas/s) de ROUNDS execuções."""
+        best = 0
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            JSONRenderer().render(build().data)
+            best = max(best, ROWS / (time.perf_counter() - start))
+
+        return best
+
+    def test_report(self):
+        """Imprime linhas/s e verifica o ganho do serializer rápido."""
+        lines = [f'\n{ROWS} receitas, {ATTRS_PER_RECIPE} Tags e '
+                 f'ingredientes cada (linhas/s: queries, dicts e JSON)']
+        results = {}
+        for name, build in (('RecipeSerializer', self._model_serializer),
+                            ('RecipeReadSerializer', self._read_serializer)):
+            results[name] = self._rows_per_second(build)
+            lines.append(f'{name:<24}{results[name]:>12.0f}')
+
+        print('\n'.join(lines))
+        self.assertGreater(
+            results['RecipeReadSerializer'], results['RecipeSerializer'])
@@ -0,0 +1,95 @@
+"""
+Teste de carga das rotas de leitura com conexões concorrentes.
+
+Dispara requisições GET autenticadas contra uma ou mais URLs, com
+--concurrency conexões simultâneas, e imprime vazão e latências. Usado
+para comparar o uwsgi (rotas síncronas) com o ASGI (api/async/):
+
+    uwsgi --http :8000 --master --workers 4 --module app.wsgi
+    uvicorn app.asgi:application --port 8001 --workers 4
+    python benchmarks/loadtest.py --token <token> --concurrency 200 \\
+        http://localhost:8000/api/recipe/recipes/ \\
+        http://localhost:8001/api/async/recipe/recipes/
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from urllib.parse import urlsplit
+
+
+async def fetch(url, headers) -> int:
+    """Executa um GET (uma conexão por requisição) e retorna o status."""
+    parts = urlsplit(url)
+    reader, writer = await asyncio.open_connection(
+        parts.hostname, parts.port or 80)
+    path = parts.path + (f'?{parts.query}' if parts.query else '')
+    lines = [f'GET {path} HTTP/1.1', f'Host: {parts.netloc}',
+             'Connection: close'] + headers
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode())
+    await writer.drain()
+
+    status_line = await reader.readline()
+    while await reader.read(64 * 1024):
+        pass
+    writer.close()
+
+    return int(status_line.split()[1])
+
+
+async def run(url, headers, concurrency, total) -> dict:
+    """Executa total requisições com concurrency conexões simultâneas."""
+    latencies, errors = [], 0
+    queue = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in queue:
+            start = time.perf_counter()
+            try:
+                status = await fetch(url, headers)
+            except OSError:
+                status = 0
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'rps': total / elapsed,
+        'p50': statistics.median(latencies) * 1000,
+        'p95': latencies[int(len(latencies) * 0.95)] * 1000,
+        'p99': latencies[int(len(latencies) * 0.99)] * 1000,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--token', required=True)
+    parser.add_argument('--keyword', default='Token')
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=5000)
+    args = parser.parse_args()
+
+    headers = [f'Authorization: {args.keyword} {args.token}']
+    print(f'{args.concurrency} conexões, {args.requests} requisições')
+    for url in args.urls:
+        result = asyncio.run(
+            run(url, headers, args.concurrency, args.requests))
+        print(
+            f'{url}\n  {result["rps"]:>8.1f} req/s  '
+            f'p50 {result["p50"]:.1f} ms  p95 {result["p95"]:.1f} ms  '
+            f'p99 {result["p99"]:.1f} ms  erros {result["errors"]}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+"""Funções auxiliares dos benchmarks."""
+
+import json
+
+from django.db import connection
+
+
+def explain(sql, params=None):
+    """Retorna o tempo de execução (ms) e os nós do plano da consulta."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (ANALYZE, FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes = []
+    pending = [plan[0]['Plan']]
+    while pending:
+        node = pending.pop()
+        nodes.append(node['Node Type'])
+        pending.extend(node.get('Plans', []))
+
+    return plan[0]['Execution Time'], nodes
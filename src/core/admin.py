@@ -47,3 +47,5 @@ admin.site.register(models.User, UserAdmin)
 admin.site.register(models.Recipe)
 admin.site.register(models.Tag)
 admin.site.register(models.Ingredient)
+admin.site.register(models.ImageUpload)
+admin.site.register(models.ImageBlob)
@@ -0,0 +1,43 @@
+"""
+Views assíncronas de leitura para o servidor ASGI.
+
+O Django 3.2 não tem ORM assíncrono e o DRF é síncrono: cada requisição
+executa a view DRF existente (autenticação, cache, ETag, paginação e
+serialização) em uma única passagem por uma thread do executor, sem
+bloquear o event loop. A resposta é idêntica à da rota síncrona.
+"""
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.http import HttpResponseNotAllowed
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def _run(view, request, *args, **kwargs):
+    """Executa e renderiza a view, na thread do executor."""
+    close_old_connections()
+    try:
+        response = view(request, *args, **kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+    finally:
+        # As threads do executor não recebem o request_finished do handler.
+        close_old_connections()
+
+
+def async_read_view(view):
+    """Retorna a versão assíncrona, somente leitura, da view síncrona."""
+    # Sem thread_sensitive as requisições usam threads distintas, em vez
+    # de serializar todas na thread compartilhada do asgiref.
+    run = sync_to_async(_run, thread_sensitive=False)
+
+    async def async_view(request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return HttpResponseNotAllowed(SAFE_METHODS)
+
+        return await run(view, request, *args, **kwargs)
+
+    async_view.csrf_exempt = True
+    return async_view
@@ -0,0 +1,3 @@
+"""
+Backend do banco de dados com pool de conexões por processo.
+"""
@@ -0,0 +1,73 @@
+"""
+Backend PostgreSQL com pool de conexões (ENGINE 'core.db').
+
+As conexões novas são obtidas do pool do processo (core.db.pool) e o
+close, chamado pelo Django ao fim de cada requisição, as devolve. As
+opções ficam em DATABASES[alias]['POOL']: MAX_SIZE, TIMEOUT,
+IDLE_TIMEOUT e PRE_PING.
+"""
+
+import functools
+import threading
+
+from django.db.backends.postgresql import base, creation
+
+from core.db.pool import ConnectionPool
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, conn_params, options) -> ConnectionPool:
+    """Retorna o pool do alias para os parâmetros de conexão."""
+    # Os parâmetros fazem parte da chave: os testes trocam o NAME.
+    key = (alias, repr(sorted(conn_params.items())),
+           repr(sorted(options.items())))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(
+                alias,
+                max_size=options['MAX_SIZE'],
+                timeout=options.get('TIMEOUT', 30),
+                idle_timeout=options.get('IDLE_TIMEOUT', 300),
+                pre_ping=options.get('PRE_PING', True),
+            )
+
+        return _pools[key]
+
+
+def close_pools() -> None:
+    """Fecha as conexões ociosas de todos os pools do processo."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    """Criação do banco de testes, sem conexões ociosas no DROP."""
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """DatabaseWrapper do PostgreSQL com as conexões do pool."""
+    creation_class = DatabaseCreation
+
+    def get_new_connection(self, conn_params):
+        self.pool = get_pool(
+            self.alias, conn_params, self.settings_dict['POOL'])
+        connection = self.pool.checkout(
+            functools.partial(super().get_new_connection, conn_params))
+        # Na conexão reusada o super() não é chamado nesta instância.
+        self.isolation_level = self.settings_dict['OPTIONS'].get(
+            'isolation_level', connection.isolation_level)
+
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.pool.release(self.connection)
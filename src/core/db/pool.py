@@ -0,0 +1,187 @@
+"""
+Pool de conexões do PostgreSQL por processo.
+
+As conexões ociosas ficam em uma pilha (a mais recente é reusada
+primeiro, e as excedentes expiram pelo idle_timeout). Com max_size
+conexões abertas, o checkout espera até timeout segundos por uma
+devolução. Os contadores vão para core.metrics com o prefixo
+db.pool.<alias>: hit/miss (reuso), waits, wait_ms, timeouts,
+ping_failures, idle_closed, opened e closed.
+"""
+
+import os
+import threading
+import time
+
+import psycopg2
+from psycopg2 import extensions
+
+from core import metrics
+
+# Conexões herdadas de outro processo (fork do uWSGI). Não podem ser
+# fechadas no filho, pois o close encerra a sessão do pai no servidor, e
+# nem coletadas pelo GC, que também as fecha: ficam referenciadas aqui.
+_abandoned = []
+
+
+class ConnectionPool:
+    """Pool thread-safe de conexões psycopg2."""
+
+    def __init__(self, alias, max_size, timeout=30.0, idle_timeout=300.0,
+                 pre_ping=True):
+        self.alias = alias
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.pre_ping = pre_ping
+        self._condition = threading.Condition()
+        self._reset()
+
+    def _reset(self):
+        """Inicia o estado do pool no processo atual."""
+        self.pid = os.getpid()
+        self._idle = []
+        self._size = 0
+
+    def _count(self, name, value=1):
+        metrics.increment(f'db.pool.{self.alias}.{name}', value)
+
+    def _check_fork(self):
+        """Abandona as conexões herdadas do processo pai."""
+        if self.pid != os.getpid():
+            _abandoned.extend(conn for conn, _used_at in self._idle)
+            self._reset()
+
+    def _discard(self, conn):
+        """Fecha a conexão e libera a vaga no pool."""
+        self._size -= 1
+        self._count('closed')
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def _is_usable(self, conn) -> bool:
+        """Retorna se a conexão ociosa está aberta e responde."""
+        if conn.closed:
+            return False
+        if not self.pre_ping:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            if not conn.autocommit:
+                conn.rollback()
+        except psycopg2.Error:
+            return False
+
+        return True
+
+    def _pop_idle(self):
+        """Retorna a conexão ociosa mais recente, ou None; sob o lock."""
+        now = time.monotonic()
+        while self._idle:
+            conn, used_at = self._idle.pop()
+            if now - used_at <= self.idle_timeout:
+                return conn
+
+            self._count('idle_closed')
+            self._discard(conn)
+
+        return None
+
+    def _acquire(self):
+        """Retorna uma conexão ociosa ou None com a vaga reservada."""
+        started_at = None
+        with self._condition:
+            self._check_fork()
+            while True:
+                conn = self._pop_idle()
+                if conn is not None or self._size < self.max_size:
+                    break
+
+                if started_at is None:
+                    started_at = time.monotonic()
+                    self._count('waits')
+                remaining = started_at + self.timeout - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    self._count('timeouts')
+                    raise psycopg2.OperationalError(
+                        f'Connection pool {self.alias!r} exhausted '
+                        f'({self.max_size} connections, '
+                        f'{self.timeout}s timeout).')
+
+            if conn is None:
+                self._size += 1
+
+        if started_at is not None:
+            self._count(
+                'wait_ms', int((time.monotonic() - started_at) * 1000))
+
+        return conn
+
+    def checkout(self, connect):
+        """Retorna uma conexão ociosa ou nova, de connect().
+
+        Com o pool cheio, espera até timeout segundos por uma devolução.
+        """
+        while True:
+            conn = self._acquire()
+            if conn is None:
+                break
+            # Fora do lock: o ping não bloqueia os demais checkouts.
+            if self._is_usable(conn):
+                self._count('hit')
+                return conn
+
+            self._count('ping_failures')
+            with self._condition:
+                self._discard(conn)
+                self._condition.notify()
+
+        self._count('miss')
+        try:
+            conn = connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        self._count('opened')
+
+        return conn
+
+    def release(self, conn):
+        """Devolve a conexão ao pool, desfazendo a transação aberta."""
+        with self._condition:
+            if self.pid != os.getpid():
+                # Obtida no processo pai: não pertence ao pool do filho.
+                self._check_fork()
+                _abandoned.append(conn)
+                return
+
+            status = (extensions.TRANSACTION_STATUS_UNKNOWN if conn.closed
+                      else conn.get_transaction_status())
+            if status not in (extensions.TRANSACTION_STATUS_IDLE,
+                              extensions.TRANSACTION_STATUS_INTRANS,
+                              extensions.TRANSACTION_STATUS_INERROR):
+                # Conexão perdida, ou com um comando em execução.
+                self._discard(conn)
+            else:
+                try:
+                    if status != extensions.TRANSACTION_STATUS_IDLE:
+                        conn.rollback()
+                except psycopg2.Error:
+                    self._discard(conn)
+                else:
+                    self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+    def close(self):
+        """Fecha as conexões ociosas do processo atual."""
+        with self._condition:
+            self._check_fork()
+            while self._idle:
+                conn, _used_at = self._idle.pop()
+                self._discard(conn)
@@ -0,0 +1,61 @@
+"""
+Cache LRU com expiração (TTL) em memória do processo.
+"""
+
+import threading
+import time
+
+from collections import OrderedDict
+
+MISSING = object()
+
+
+class LRUCache:
+    """Cache limitado a maxsize itens, cada um válido por ttl segundos.
+
+    Ao exceder maxsize remove o item usado há mais tempo. É seguro entre
+    threads do mesmo processo.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Retorna o valor de key ou default se ausente ou expirado."""
+        with self._lock:
+            item = self._items.get(key, MISSING)
+            if item is MISSING:
+                return default
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return default
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        """Guarda value em key, removendo o item mais antigo se cheio."""
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key) -> None:
+        """Remove key do cache, se presente."""
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove todos os itens."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
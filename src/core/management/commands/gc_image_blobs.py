@@ -0,0 +1,100 @@
+"""
+Comando para remover os arquivos de mídia sem referências.
+"""
+import os
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import ImageBlob, Recipe
+
+
+class Command(BaseCommand):
+    """Remove os blobs sem referências há mais de --grace segundos"""
+    help = 'Remove os arquivos de mídia sem referências (refcount 0).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace',
+            type=int,
+            default=60 * 60,
+            help='Idade mínima, em segundos, dos arquivos removidos.',
+        )
+        parser.add_argument(
+            '--orphans',
+            action='store_true',
+            help='Remove também os arquivos sem registro de blob.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas lista os arquivos que seriam removidos.',
+        )
+
+    def _is_recent(self, storage, name, cutoff) -> bool:
+        """Retorna se o arquivo foi gravado ou reusado após cutoff."""
+        try:
+            return os.path.getmtime(storage.path(name)) >= cutoff.timestamp()
+        except FileNotFoundError:
+            return False
+
+    def _delete_unreferenced(self, storage, cutoff, dry_run) -> int:
+        deleted = 0
+        candidates = ImageBlob.objects.filter(
+            refcount__lte=0,
+            updated_at__lt=cutoff,
+        ).values_list('pk', flat=True)
+        for pk in candidates.iterator():
+            with transaction.atomic():
+                blob = ImageBlob.objects.select_for_update(
+                    skip_locked=True,
+                ).filter(pk=pk, refcount__lte=0).first()
+                if blob is None or self._is_recent(storage, blob.name, cutoff):
+                    continue
+
+                self.stdout.write(blob.name)
+                if not dry_run:
+                    storage.delete(blob.name)
+                    blob.delete()
+                deleted += 1
+
+        return deleted
+
+    def _delete_orphans(self, storage, cutoff, dry_run) -> int:
+        directory = os.path.dirname(
+            Recipe._meta.get_field('image').generate_filename(None, 'x'))
+        root = storage.path(directory)
+        deleted = 0
+        for path, _dirs, files in os.walk(root):
+            names = [
+                os.path.relpath(os.path.join(path, file), storage.location)
+                for file in files
+            ]
+            known = set(ImageBlob.objects.filter(
+                name__in=names).values_list('name', flat=True))
+            for name in names:
+                if name in known or self._is_recent(storage, name, cutoff):
+                    continue
+
+                self.stdout.write(name)
+                if not dry_run:
+                    storage.delete(name)
+                deleted += 1
+
+        return deleted
+
+    def handle(self, *args, **options):
+        "Entrypoint dos comandos"
+        storage = Recipe._meta.get_field('image').storage
+        cutoff = timezone.now() - timedelta(seconds=options['grace'])
+
+        deleted = self._delete_unreferenced(
+            storage, cutoff, options['dry_run'])
+        if options['orphans']:
+            deleted += self._delete_orphans(
+                storage, cutoff, options['dry_run'])
+
+        self.stdout.write(f'{deleted} file(s) removed.')
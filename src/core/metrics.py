@@ -0,0 +1,46 @@
+"""
+Contadores de métricas do processo.
+
+Os valores são por processo (cada worker do uWSGI tem os seus) e são
+expostos pela rota de métricas junto com o PID.
+"""
+
+import threading
+
+from collections import Counter
+
+_lock = threading.Lock()
+_counters = Counter()
+
+
+def increment(name: str, value: int = 1) -> None:
+    """Soma value ao contador name."""
+    with _lock:
+        _counters[name] += value
+
+
+def snapshot() -> dict:
+    """Retorna uma cópia dos contadores."""
+    with _lock:
+        return dict(_counters)
+
+
+def hit_ratios() -> dict:
+    """Retorna a taxa de acerto dos pares de contadores .hit/.miss."""
+    counters = snapshot()
+    ratios = {}
+    for name, hits in counters.items():
+        if not name.endswith('.hit'):
+            continue
+
+        prefix = name[:-len('.hit')]
+        total = hits + counters.get(f'{prefix}.miss', 0)
+        ratios[prefix] = hits / total if total else 0.0
+
+    return ratios
+
+
+def reset() -> None:
+    """Zera todos os contadores."""
+    with _lock:
+        _counters.clear()
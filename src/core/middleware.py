@@ -0,0 +1,105 @@
+"""
+Middlewares do projeto.
+"""
+
+import logging
+
+from django.conf import settings
+from django.contrib.auth import middleware as auth_middleware
+from django.contrib.messages import middleware as messages_middleware
+from django.contrib.sessions import middleware as sessions_middleware
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.middleware import csrf
+from django.test.utils import CaptureQueriesContext
+
+from core.query_budget import format_queries, resolve_budget
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """Registra as views que excedem o orçamento de queries declarado.
+
+    As views declaram o orçamento com o atributo ``query_budget``, como
+    inteiro ou como dicionário por action. Ativo apenas com DEBUG.
+    """
+
+    def __init__(self, get_response):
+        if not settings.DEBUG:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.get_response(request)
+
+        budget = getattr(request, '_query_budget', None)
+        if budget is not None and len(captured) > budget:
+            logger.error(
+                'Orçamento de queries excedido em %s %s: %d de %d.\n%s',
+                request.method,
+                request.path,
+                len(captured),
+                budget,
+                format_queries(captured.captured_queries),
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Guarda o orçamento declarado pela view da requisição."""
+        view_class = getattr(view_func, 'cls', None)
+        budget = getattr(view_class, 'query_budget', None)
+        actions = getattr(view_func, 'actions', None) or {}
+
+        request._query_budget = resolve_budget(
+            budget,
+            actions.get(request.method.lower()),
+        )
+
+
+def is_token_route(request) -> bool:
+    """Retorna se a rota é autenticada apenas por token (API)."""
+    return request.path_info.startswith(settings.TOKEN_ROUTE_PREFIXES)
+
+
+class TokenRouteExemptMixin:
+    """Não executa o middleware nas rotas autenticadas só por token.
+
+    Sem cookies de sessão nessas rotas, sessão, CSRF, usuário da sessão
+    e mensagens são trabalho desperdiçado; o admin mantém todos.
+    """
+
+    def __call__(self, request):
+        if is_token_route(request):
+            return self.get_response(request)
+
+        return super().__call__(request)
+
+
+class SessionMiddleware(TokenRouteExemptMixin,
+                        sessions_middleware.SessionMiddleware):
+    """SessionMiddleware fora das rotas da API."""
+
+
+class CsrfViewMiddleware(TokenRouteExemptMixin, csrf.CsrfViewMiddleware):
+    """CsrfViewMiddleware fora das rotas da API."""
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_token_route(request):
+            return None
+
+        return super().process_view(
+            request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(TokenRouteExemptMixin,
+                               auth_middleware.AuthenticationMiddleware):
+    """AuthenticationMiddleware fora das rotas da API."""
+
+
+class MessageMiddleware(TokenRouteExemptMixin,
+                        messages_middleware.MessageMiddleware):
+    """MessageMiddleware fora das rotas da API."""
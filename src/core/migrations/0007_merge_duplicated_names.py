@@ -0,0 +1,49 @@
+# Generated by Django 3.2.25 on 2026-10-17 04:23
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicated_names(apps, schema_editor):
+    """Une Tags/Ingredients duplicados por usuário antes da constraint."""
+    Recipe = apps.get_model('core', 'Recipe')
+
+    for model_name, field_name in (('Tag', 'tags'),
+                                   ('Ingredient', 'ingredients')):
+        model = apps.get_model('core', model_name)
+        through = getattr(Recipe, field_name).through
+        fk_name = f'{model_name.lower()}_id'
+
+        duplicates = model.objects.values('user_id', 'name').annotate(
+            keep_id=Min('id'),
+            total=Count('id'),
+        ).filter(total__gt=1)
+
+        for duplicate in duplicates:
+            duplicate_ids = list(model.objects.filter(
+                user_id=duplicate['user_id'],
+                name=duplicate['name'],
+            ).exclude(id=duplicate['keep_id']).values_list('id', flat=True))
+            recipe_ids = through.objects.filter(**{
+                f'{fk_name}__in': duplicate_ids,
+            }).values_list('recipe_id', flat=True).distinct()
+
+            through.objects.bulk_create([
+                through(recipe_id=recipe_id, **{fk_name: duplicate['keep_id']})
+                for recipe_id in recipe_ids
+            ], ignore_conflicts=True)
+            model.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_recipe_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_duplicated_names,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+# Os filtros por EXISTS buscam os vínculos pelo atributo; com o índice
+# (atributo, receita) o PostgreSQL responde por index-only scan.
+INDEXES = [
+    ('core_recipe_tags', 'tag_id'),
+    ('core_recipe_ingredients', 'ingredient_id'),
+]
+
+
+def create_index(table, column):
+    return (
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_{column}_recipe_idx '
+        f'ON {table} ({column}, recipe_id);'
+    )
+
+
+def drop_index(table, column):
+    return f'DROP INDEX CONCURRENTLY IF EXISTS {table}_{column}_recipe_idx;'
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY não roda dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('core', '0010_tag_ingredient_name_trgm'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=create_index(table, column),
+            reverse_sql=drop_index(table, column),
+        )
+        for table, column in INDEXES
+    ]
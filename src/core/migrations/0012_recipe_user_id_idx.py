@@ -0,0 +1,75 @@
+# Generated by Django 3.2.25 on 2026-10-17 04:42
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.deletion
+
+MODELS = ('recipe', 'tag', 'ingredient')
+
+
+def _user_index_name(schema_editor, model):
+    """Retorna o nome do índice padrão da FK user."""
+    return schema_editor._create_index_name(
+        model._meta.db_table, ['user_id'])
+
+
+def drop_user_indexes(apps, schema_editor):
+    """Remove os índices de user_id, cobertos pelos índices compostos."""
+    for model_name in MODELS:
+        model = apps.get_model('core', model_name)
+        schema_editor.execute(
+            'DROP INDEX CONCURRENTLY IF EXISTS %s'
+            % schema_editor.quote_name(
+                _user_index_name(schema_editor, model))
+        )
+
+
+def create_user_indexes(apps, schema_editor):
+    """Recria os índices de user_id."""
+    for model_name in MODELS:
+        model = apps.get_model('core', model_name)
+        schema_editor.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS %s ON %s (user_id)' % (
+                schema_editor.quote_name(
+                    _user_index_name(schema_editor, model)),
+                schema_editor.quote_name(model._meta.db_table),
+            )
+        )
+
+
+def user_field():
+    return models.ForeignKey(
+        db_index=False,
+        on_delete=django.db.models.deletion.CASCADE,
+        to=settings.AUTH_USER_MODEL,
+    )
+
+
+class Migration(migrations.Migration):
+    # CREATE/DROP INDEX CONCURRENTLY não rodam dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('core', '0011_recipe_m2m_covering_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='recipe',
+            index=models.Index(fields=['user', '-id'], name='recipe_user_id_desc_idx'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(drop_user_indexes, create_user_indexes),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name=model_name,
+                    name='user',
+                    field=user_field(),
+                )
+                for model_name in MODELS
+            ],
+        ),
+    ]
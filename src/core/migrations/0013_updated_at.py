@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 05:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_recipe_user_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name=model_name,
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        )
+        for model_name in ('ingredient', 'recipe', 'tag')
+    ]
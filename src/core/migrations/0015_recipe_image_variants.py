@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-17 04:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_refresh_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='image_status',
+            field=models.CharField(choices=[('none', 'Sem imagem'), ('pending', 'Gerando variantes'), ('ready', 'Variantes prontas'), ('failed', 'Falha ao gerar variantes')], default='none', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='recipe',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
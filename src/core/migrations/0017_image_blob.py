@@ -0,0 +1,57 @@
+# Generated by Django 3.2.25 on 2026-10-17 05:02
+
+import core.models
+import core.storage
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def count_references(apps, schema_editor):
+    """Cria os blobs das imagens e variantes existentes."""
+    Recipe = apps.get_model('core', 'Recipe')
+    ImageBlob = apps.get_model('core', 'ImageBlob')
+
+    counts = {}
+    recipes = Recipe.objects.exclude(image='').exclude(image__isnull=True)
+    for image, variants in recipes.values_list(
+            'image', 'image_variants').iterator():
+        names = [image] + [
+            name for formats in variants.values() for name in formats.values()
+        ]
+        for name in names:
+            counts[name] = counts.get(name, 0) + 1
+
+    ImageBlob.objects.bulk_create(
+        [ImageBlob(name=name, refcount=count)
+         for name, count in counts.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_image_upload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('refcount', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='recipe',
+            name='image',
+            field=models.ImageField(null=True, storage=core.storage.ContentAddressedStorage(), upload_to=core.models.recipe_image_file_path),
+        ),
+        migrations.AddIndex(
+            model_name='imageblob',
+            index=models.Index(condition=models.Q(('refcount__lte', 0)), fields=['updated_at'], name='imageblob_unreferenced_idx'),
+        ),
+        migrations.RunPython(count_references, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+# O tsvector só é recalculado quando o título ou a descrição mudam: as
+# gravações de updated_at, imagem e variantes não passam pelo to_tsvector.
+# O save() completo também grava o search_vector da instância, que após o
+# create é None: valores diferentes do atual também são recalculados.
+CREATE_TRIGGERS = """
+DROP TRIGGER core_recipe_search_vector_update ON core_recipe;
+
+CREATE TRIGGER core_recipe_search_vector_insert
+    BEFORE INSERT ON core_recipe
+    FOR EACH ROW EXECUTE FUNCTION core_recipe_search_vector_update();
+
+CREATE TRIGGER core_recipe_search_vector_update
+    BEFORE UPDATE OF title, description, search_vector ON core_recipe
+    FOR EACH ROW
+    WHEN (OLD.title IS DISTINCT FROM NEW.title
+          OR OLD.description IS DISTINCT FROM NEW.description
+          OR OLD.search_vector IS DISTINCT FROM NEW.search_vector)
+    EXECUTE FUNCTION core_recipe_search_vector_update();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER core_recipe_search_vector_insert ON core_recipe;
+DROP TRIGGER core_recipe_search_vector_update ON core_recipe;
+
+CREATE TRIGGER core_recipe_search_vector_update
+    BEFORE INSERT OR UPDATE ON core_recipe
+    FOR EACH ROW EXECUTE FUNCTION core_recipe_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_image_blob'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 3.2.25 on 2026-10-17 05:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def add_recipe_media(apps, schema_editor):
+    """Registra a imagem e as variantes das receitas existentes."""
+    Recipe = apps.get_model('core', 'Recipe')
+    RecipeMedia = apps.get_model('core', 'RecipeMedia')
+
+    media = []
+    recipes = Recipe.objects.exclude(image='').exclude(image__isnull=True)
+    for recipe_id, image, variants in recipes.values_list(
+            'id', 'image', 'image_variants').iterator():
+        names = {image} | {
+            name for formats in variants.values() for name in formats.values()
+        }
+        media += [RecipeMedia(recipe_id=recipe_id, name=name)
+                  for name in names]
+
+    RecipeMedia.objects.bulk_create(media, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_recipe_search_vector_trigger_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecipeMedia',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('recipe', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='core.recipe')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='recipemedia',
+            index=models.Index(fields=['name', 'recipe'], name='recipe_media_name_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='recipemedia',
+            constraint=models.UniqueConstraint(fields=('recipe', 'name'), name='unique_recipe_media'),
+        ),
+        migrations.RunPython(add_recipe_media, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-17 06:25
+
+from django.db import migrations, models
+import django.db.models.expressions
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_recipe_media'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ingredient',
+            index=models.Index(django.db.models.expressions.F('user'), django.db.models.functions.comparison.Collate(django.db.models.functions.text.Upper('name'), 'C'), name='ingredient_user_prefix_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(django.db.models.expressions.F('user'), django.db.models.functions.comparison.Collate(django.db.models.functions.text.Upper('name'), 'C'), name='tag_user_prefix_idx'),
+        ),
+    ]
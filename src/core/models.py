@@ -2,13 +2,34 @@ import uuid
 import os
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Collate, Upper
+from django.utils import timezone
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin,
 )
 
+from core.storage import content_storage
+
+
+SEARCH_CONFIG = 'portuguese'
+
+IMAGE_STATUS_NONE = 'none'
+IMAGE_STATUS_PENDING = 'pending'
+IMAGE_STATUS_READY = 'ready'
+IMAGE_STATUS_FAILED = 'failed'
+IMAGE_STATUS_CHOICES = [
+    (IMAGE_STATUS_NONE, 'Sem imagem'),
+    (IMAGE_STATUS_PENDING, 'Gerando variantes'),
+    (IMAGE_STATUS_READY, 'Variantes prontas'),
+    (IMAGE_STATUS_FAILED, 'Falha ao gerar variantes'),
+]
+
 
 def recipe_image_file_path(instance, _filename):
     """Gera o caminho do arquivo para a imagem da receita."""
@@ -49,17 +70,87 @@ class User(AbstractBaseUser, PermissionsMixin):
     name = models.CharField(max_length=255)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
+    # Incrementado para revogar os access e refresh tokens do usuário.
+    token_version = models.PositiveIntegerField(default=0)
 
     objects = UserManager()
 
     USERNAME_FIELD = 'email'
 
 
+class RefreshToken(models.Model):
+    """Refresh token do usuário, guardado apenas pelo hash."""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='refresh_tokens',
+    )
+    key_hash = models.CharField(max_length=64, unique=True)
+    token_version = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f'{self.user} ({self.created_at:%Y-%m-%d %H:%M})'
+
+
+class ImageBlobManager(models.Manager):
+    """Gerenciador das referências dos arquivos de mídia."""
+
+    def _add(self, names, delta) -> None:
+        counts = {}
+        for name in filter(None, names):
+            counts[name] = counts.get(name, 0) + delta
+
+        now = timezone.now()
+        if delta > 0:
+            self.bulk_create(
+                [self.model(name=name, updated_at=now) for name in counts],
+                ignore_conflicts=True,
+            )
+        for count in set(counts.values()):
+            self.filter(name__in=[
+                name for name, value in counts.items() if value == count
+            ]).update(refcount=F('refcount') + count, updated_at=now)
+
+    def acquire(self, names) -> None:
+        """Adiciona uma referência a cada nome (repetidos contam)."""
+        self._add(names, 1)
+
+    def release(self, names) -> None:
+        """Remove uma referência de cada nome (repetidos contam)."""
+        self._add(names, -1)
+
+
+class ImageBlob(models.Model):
+    """Arquivo de mídia endereçado pelo conteúdo e suas referências."""
+    name = models.CharField(max_length=255, unique=True)
+    refcount = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    objects = ImageBlobManager()
+
+    class Meta:
+        indexes = [
+            # Candidatos do GC: blobs sem referências.
+            models.Index(
+                fields=['updated_at'],
+                name='imageblob_unreferenced_idx',
+                condition=models.Q(refcount__lte=0),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.name} ({self.refcount})'
+
+
 class Recipe(models.Model):
     """Model da rota Recipe."""
+    # Coberto pelos índices compostos iniciados por user_id (Meta).
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -68,19 +159,134 @@ class Recipe(models.Model):
     link = models.CharField(max_length=255, blank=True)
     tags = models.ManyToManyField('Tag')
     ingredients = models.ManyToManyField('Ingredient')
-    image = models.ImageField(null=True, upload_to=recipe_image_file_path)
+    # O nome final é o SHA-256 do conteúdo (core.storage).
+    image = models.ImageField(
+        null=True,
+        upload_to=recipe_image_file_path,
+        storage=content_storage,
+    )
+    # Variantes redimensionadas da imagem, geradas por recipe.images.
+    image_status = models.CharField(
+        max_length=10,
+        choices=IMAGE_STATUS_CHOICES,
+        default=IMAGE_STATUS_NONE,
+    )
+    image_variants = models.JSONField(default=dict, blank=True)
+    # Mantido pelo trigger core_recipe_search_vector_update (migration 0009).
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=['search_vector'],
+                name='recipe_search_vector_idx',
+            ),
+            # Listagem do usuário ordenada por -id (cursor da paginação).
+            models.Index(
+                fields=['user', '-id'],
+                name='recipe_user_id_desc_idx',
+            ),
+        ]
+
+    def blob_names(self) -> list:
+        """Retorna os arquivos referenciados: imagem e variantes."""
+        names = [self.image.name] if self.image else []
+        for formats in self.image_variants.values():
+            names.extend(formats.values())
+
+        return names
 
     def __str__(self):
         return self.title
 
 
+class RecipeMediaManager(models.Manager):
+    """Gerenciador dos arquivos de mídia usados pelas receitas."""
+
+    def replace(self, recipe_id, old_names, new_names) -> None:
+        """Troca os arquivos old_names da receita por new_names."""
+        old_names = set(filter(None, old_names))
+        new_names = set(filter(None, new_names))
+        if old_names - new_names:
+            self.filter(
+                recipe_id=recipe_id,
+                name__in=old_names - new_names,
+            ).delete()
+        self.bulk_create(
+            [self.model(recipe_id=recipe_id, name=name)
+             for name in new_names - old_names],
+            ignore_conflicts=True,
+        )
+
+
+class RecipeMedia(models.Model):
+    """Arquivo de mídia (imagem ou variante) usado por uma receita.
+
+    Permite conferir o dono do arquivo por índice, sem varrer o JSON das
+    variantes das receitas do usuário.
+    """
+    # Coberto pela constraint única iniciada por recipe.
+    recipe = models.ForeignKey(
+        Recipe,
+        on_delete=models.CASCADE,
+        db_index=False,
+    )
+    name = models.CharField(max_length=255)
+
+    objects = RecipeMediaManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['recipe', 'name'],
+                name='unique_recipe_media',
+            ),
+        ]
+        indexes = [
+            # Dono do arquivo: receitas pelo nome, sem ler a tabela.
+            models.Index(
+                fields=['name', 'recipe'],
+                name='recipe_media_name_idx',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+
 class Tag(models.Model):
     """Model da rota Tag."""
     name = models.CharField(max_length=255)
+    # Coberto pelos índices compostos iniciados por user_id (Meta).
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'name'],
+                name='unique_tag_user_name',
+            ),
+        ]
+        indexes = [
+            GinIndex(
+                fields=['name'],
+                name='tag_name_trgm_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
+            # Prefixo do autocomplete (name__istartswith) por usuário; com
+            # a collation C o índice serve ao LIKE e à ordem por UPPER(name).
+            models.Index(
+                F('user'),
+                Collate(Upper('name'), 'C'),
+                name='tag_user_prefix_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -89,10 +295,65 @@ class Tag(models.Model):
 class Ingredient(models.Model):
     """Modelo da rota de Ingridient."""
     name = models.CharField(max_length=255)
+    # Coberto pelos índices compostos iniciados por user_id (Meta).
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'name'],
+                name='unique_ingredient_user_name',
+            ),
+        ]
+        indexes = [
+            GinIndex(
+                fields=['name'],
+                name='ingredient_name_trgm_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
+            # Prefixo do autocomplete (name__istartswith) por usuário; com
+            # a collation C o índice serve ao LIKE e à ordem por UPPER(name).
+            models.Index(
+                F('user'),
+                Collate(Upper('name'), 'C'),
+                name='ingredient_user_prefix_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
+
+
+class ImageUpload(models.Model):
+    """Upload em partes (retomável) da imagem de uma receita."""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+    )
+    recipe = models.ForeignKey(Recipe, on_delete=models.CASCADE)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveIntegerField()
+    # Bytes já gravados e confirmados no arquivo parcial.
+    offset = models.PositiveIntegerField(default=0)
+    # SHA-256 esperado do arquivo completo, informado pelo cliente.
+    sha256 = models.CharField(max_length=64, blank=True)
+    # Dimensões lidas do cabeçalho assim que os bytes iniciais chegam.
+    width = models.PositiveIntegerField(null=True)
+    height = models.PositiveIntegerField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    @property
+    def path(self) -> str:
+        """Caminho do arquivo parcial do upload."""
+        return os.path.join(
+            settings.RECIPE_IMAGE_UPLOAD_DIR, f'{self.id}.part')
+
+    def __str__(self) -> str:
+        return f'{self.filename} ({self.offset}/{self.size})'
@@ -0,0 +1,57 @@
+"""
+Parser JSON rápido, com orjson.
+
+Aceita os mesmos corpos que o JSONParser do DRF com STRICT_JSON (sem
+NaN/infinito), com o mesmo resultado. Sem o orjson instalado, fora do
+UTF-8, com STRICT_JSON desligado, com números de 19 ou mais dígitos
+(inteiros fora de 64 bits viram float no orjson) e nos corpos que o
+orjson recusa, usa o JSONParser.
+"""
+
+import codecs
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from core.renderers import FastJSONRenderer, orjson
+
+UTF_8 = codecs.lookup('utf-8').name
+
+# Um número de 19 dígitos já passa de -2**63 e o orjson o decodificaria
+# como float. O re varre o corpo mais devagar que o orjson o decodifica;
+# em C, sem espaços e sinais, com os dígitos trocados por 0 e '[' e ','
+# por ':', o número vira ':' seguido de 19 zeros. Dígitos em textos
+# (hashes) não contam; textos como ', 1234...' só caem no JSONParser. O
+# ':' inicial cobre o corpo que é só um número.
+NUMBER_TABLE = bytes.maketrans(b'123456789[,', b'000000000::')
+NUMBER_SKIP = b' \t\r\n-'
+BIG_NUMBER = b':' + b'0' * 19
+
+
+def has_big_number(body: bytes) -> bool:
+    """Retorna se o corpo pode ter um número de 19 ou mais dígitos."""
+    return BIG_NUMBER in (b':' + body).translate(NUMBER_TABLE, NUMBER_SKIP)
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser que decodifica com o orjson, quando disponível."""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Retorna o corpo JSON decodificado, com fallback ao JSONParser."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if (orjson is None or not self.strict
+                or codecs.lookup(encoding).name != UTF_8):
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if not has_big_number(body):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                # O JSONParser dá o erro (ou aceita, como em 1e400).
+                pass
+
+        return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,66 @@
+"""
+Orçamento de queries por bloco de código ou requisição.
+"""
+
+from contextlib import ContextDecorator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Erro lançado quando um bloco excede o orçamento de queries."""
+
+
+def format_queries(captured_queries) -> str:
+    """Formata as queries capturadas para as mensagens de erro e log."""
+    return '\n'.join(
+        f'{i}. {query["sql"]}'
+        for i, query in enumerate(captured_queries, start=1)
+    )
+
+
+def resolve_budget(budget, action=None):
+    """Retorna o orçamento declarado para a action (ou None)."""
+    if isinstance(budget, dict):
+        return budget.get(action)
+
+    return budget
+
+
+class query_budget(ContextDecorator):
+    """Falha quando o bloco executa mais queries do que o orçamento.
+
+    Pode ser usado como context manager ou decorator:
+
+        with query_budget(3):
+            client.get(url)
+
+        @query_budget(3)
+        def test_list(self): ...
+    """
+
+    def __init__(self, max_queries: int, using: str = DEFAULT_DB_ALIAS):
+        self.max_queries = max_queries
+        self.using = using
+        self.captured = None
+
+    def __enter__(self):
+        self.captured = CaptureQueriesContext(connections[self.using])
+        self.captured.__enter__()
+        return self.captured
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.captured.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return False
+
+        executed = len(self.captured)
+        if executed > self.max_queries:
+            raise QueryBudgetExceeded(
+                f'{executed} queries executadas, orçamento de '
+                f'{self.max_queries}:\n'
+                f'{format_queries(self.captured.captured_queries)}'
+            )
+
+        return False
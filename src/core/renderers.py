@@ -0,0 +1,54 @@
+"""
+Renderer JSON rápido, com orjson.
+
+Na saída compacta, sem indentação, produz os mesmos bytes que o
+JSONRenderer do DRF: Decimal, datetimes, textos traduzíveis (lazy) e
+demais tipos fora do JSON passam pelo default do encoder do DRF. Há duas
+diferenças: a indentação (Browsable API) é de 2 espaços e NaN/infinito
+viram null, em vez de erro. Sem o orjson instalado, ou com opções que ele
+não suporta (ensure_ascii, separadores não compactos), usa o
+JSONRenderer.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+
+def orjson_options(indent=None) -> int:
+    """Retorna as opções do orjson equivalentes ao encoder do DRF."""
+    # Datetimes no formato do DRF ('Z' no UTC) e chaves não str, como no
+    # json da stdlib. O orjson só indenta com 2 espaços.
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    if indent:
+        options |= orjson.OPT_INDENT_2
+    return options
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer que serializa com o orjson, quando disponível."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Renderiza data em JSON, com fallback para o JSONRenderer."""
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson_options(indent),
+            )
+        except TypeError:
+            # Ex.: inteiros maiores que 64 bits; o json da stdlib decide.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Como o JSONRenderer: seguro para embutir em <script>.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+            b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,67 @@
+"""
+Storage de mídia endereçado pelo conteúdo.
+
+Cada arquivo é gravado com o SHA-256 do conteúdo como nome, no diretório
+pedido (upload_to): bytes idênticos são gravados uma única vez. As
+referências de cada arquivo são contadas em ImageBlob e os arquivos sem
+referências são removidos pelo comando gc_image_blobs.
+"""
+
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+def blob_name(directory, digest, ext) -> str:
+    """Retorna o nome do arquivo do conteúdo com o hash digest."""
+    return os.path.join(directory, digest[:2], f'{digest}{ext.lower()}')
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage que nomeia os arquivos pelo SHA-256."""
+
+    def _save(self, name, content):
+        """Grava o conteúdo, calculando o hash na mesma leitura.
+
+        O conteúdo vai para um arquivo temporário e é movido para o nome
+        final; se o arquivo já existir, o temporário é descartado.
+        """
+        directory, basename = os.path.split(name)
+        tmp_dir = self.path(directory)
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        hasher = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    hasher.update(chunk)
+                    file.write(chunk)
+
+            name = blob_name(
+                directory, hasher.hexdigest(), os.path.splitext(basename)[1])
+            full_path = self.path(name)
+            if os.path.exists(full_path):
+                # Renova o mtime: o GC não remove arquivos recém-usados.
+                os.utime(full_path)
+                return name
+
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            if self.file_permissions_mode is not None:
+                os.chmod(tmp_path, self.file_permissions_mode)
+            # Atômico: gravações concorrentes do mesmo conteúdo são iguais.
+            os.replace(tmp_path, full_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return name
+
+
+content_storage = ContentAddressedStorage()
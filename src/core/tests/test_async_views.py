@@ -0,0 +1,94 @@
+"""Testa as rotas assíncronas de leitura."""
+
+import json
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, TransactionTestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from core.models import Ingredient, Recipe, Tag
+from user.authentication import invalidate
+
+
+class AsyncReadViewTests(TransactionTestCase):
+    """Testes para as rotas de api/async/.
+
+    As views executam em outras threads (outras conexões), por isso os
+    dados precisam estar gravados: TransactionTestCase.
+    """
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'password@123'
+        )
+        self.addCleanup(invalidate, self.user.id)
+        token = Token.objects.create(user=self.user)
+        # O AsyncClient do Django 3.2 recebe os cabeçalhos sem o HTTP_.
+        self.headers = {'Authorization': f'Token {token.key}'}
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        self.recipe = Recipe.objects.create(
+            user=self.user,
+            title='Receita',
+            time_minutes=10,
+            price=5,
+        )
+        self.recipe.tags.add(Tag.objects.create(user=self.user, name='Tag'))
+        self.recipe.ingredients.add(
+            Ingredient.objects.create(user=self.user, name='Sal'))
+
+    def _async_request(self, method, url, **extra):
+        async def request():
+            return await getattr(AsyncClient(), method)(url, **extra)
+
+        return async_to_sync(request)()
+
+    def _async_get(self, url, **extra):
+        return self._async_request('get', url, **self.headers, **extra)
+
+    def test_same_response_as_sync_routes(self):
+        """Testa as respostas iguais às das rotas síncronas."""
+        routes = [
+            ('async-recipe-list', 'recipe:recipe-list', []),
+            ('async-recipe-detail', 'recipe:recipe-detail',
+             [self.recipe.id]),
+            ('async-tag-list', 'recipe:tag-list', []),
+            ('async-ingredient-list', 'recipe:ingredient-list', []),
+            ('async-user-me', 'user:me', []),
+        ]
+        for async_name, sync_name, args in routes:
+            with self.subTest(async_name):
+                res = self._async_get(reverse(async_name, args=args))
+                expected = self.client.get(reverse(sync_name, args=args))
+
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+                self.assertEqual(json.loads(res.content), expected.json())
+
+    def test_conditional_request(self):
+        """Testa o 304 com o ETag da rota assíncrona."""
+        url = reverse('async-recipe-detail', args=[self.recipe.id])
+        etag = self._async_get(url)['ETag']
+
+        res = self._async_get(url, **{'If-None-Match': etag})
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_auth_required(self):
+        """Testa que as rotas assíncronas exigem autenticação."""
+        res = self._async_request('get', reverse('async-recipe-list'))
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_write_not_allowed(self):
+        """Testa que as rotas assíncronas são somente leitura."""
+        res = self._async_request(
+            'post', reverse('async-recipe-list'), **self.headers)
+
+        self.assertEqual(res.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -0,0 +1,153 @@
+"""
+  Testes do pool de conexões do PostgreSQL
+"""
+
+import threading
+
+from unittest.mock import patch
+
+import psycopg2
+
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.db.utils import OperationalError
+from django.test import TestCase
+
+from core import metrics
+from core.db import base
+from core.db.pool import ConnectionPool, _abandoned
+
+
+class ConnectionPoolTests(TestCase):
+    """Testes do ConnectionPool com conexões reais."""
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.pool = ConnectionPool('test', max_size=2, timeout=0.1)
+        self.addCleanup(self.pool.close)
+
+    def _connect(self):
+        conn = psycopg2.connect(**connection.get_connection_params())
+        # Fechadas no fim: as em uso bloqueariam o DROP do banco de testes.
+        self.addCleanup(conn.close)
+        return conn
+
+    def _counters(self) -> dict:
+        prefix = 'db.pool.test.'
+        return {
+            name[len(prefix):]: value
+            for name, value in metrics.snapshot().items()
+            if name.startswith(prefix)
+        }
+
+    def test_reuses_released_connection(self):
+        """Testa o reuso da conexão devolvida, com as métricas."""
+        conn = self.pool.checkout(self._connect)
+        self.pool.release(conn)
+
+        self.assertIs(self.pool.checkout(self._connect), conn)
+        self.assertEqual(self._counters()['hit'], 1)
+        self.assertEqual(self._counters()['miss'], 1)
+        self.assertEqual(metrics.hit_ratios()['db.pool.test'], 0.5)
+
+    def test_release_rolls_back(self):
+        """Testa o rollback da transação aberta na devolução."""
+        conn = self.pool.checkout(self._connect)
+        with conn.cursor() as cursor:
+            cursor.execute('CREATE TEMP TABLE pool_test (id int)')
+        self.pool.release(conn)
+
+        conn = self.pool.checkout(self._connect)
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('pool_test')")
+            self.assertIsNone(cursor.fetchone()[0])
+
+    def test_waits_for_release(self):
+        """Testa a espera por uma conexão devolvida com o pool cheio."""
+        self.pool.timeout = 5
+        first = self.pool.checkout(self._connect)
+        self.pool.checkout(self._connect)
+
+        timer = threading.Timer(0.05, self.pool.release, [first])
+        timer.start()
+        self.addCleanup(timer.join)
+
+        self.assertIs(self.pool.checkout(self._connect), first)
+        self.assertEqual(self._counters()['waits'], 1)
+        self.assertIn('wait_ms', self._counters())
+
+    def test_timeout_when_exhausted(self):
+        """Testa o erro após o timeout com o pool cheio."""
+        self.pool.checkout(self._connect)
+        self.pool.checkout(self._connect)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            self.pool.checkout(self._connect)
+        self.assertEqual(self._counters()['timeouts'], 1)
+
+    def test_pre_ping_discards_dead_connection(self):
+        """Testa a troca da conexão encerrada pelo servidor."""
+        conn = self.pool.checkout(self._connect)
+        self.pool.release(conn)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_terminate_backend(%s)',
+                [conn.get_backend_pid()],
+            )
+
+        new_conn = self.pool.checkout(self._connect)
+
+        self.assertIsNot(new_conn, conn)
+        self.assertEqual(self._counters()['ping_failures'], 1)
+
+    def test_idle_timeout(self):
+        """Testa o fechamento das conexões ociosas expiradas."""
+        self.pool.idle_timeout = 0
+        conn = self.pool.checkout(self._connect)
+        self.pool.release(conn)
+
+        self.assertIsNot(self.pool.checkout(self._connect), conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(self._counters()['idle_closed'], 1)
+
+    def test_fork_abandons_inherited_connections(self):
+        """Testa que o filho não reusa nem fecha as conexões do pai."""
+        conn = self.pool.checkout(self._connect)
+        self.pool.release(conn)
+
+        with patch('core.db.pool.os.getpid', return_value=-1):
+            new_conn = self.pool.checkout(self._connect)
+
+        self.assertIsNot(new_conn, conn)
+        self.assertFalse(conn.closed)
+        self.assertIn(conn, _abandoned)
+        _abandoned.remove(conn)
+
+
+class PooledDatabaseWrapperTests(TestCase):
+    """Testes do backend core.db."""
+
+    def test_close_returns_connection_to_pool(self):
+        """Testa o reuso da conexão entre dois connect/close."""
+        settings_dict = {
+            **connection.settings_dict,
+            'ENGINE': 'core.db',
+            'POOL': {'MAX_SIZE': 1, 'TIMEOUT': 0.1},
+        }
+        # O alias precisa existir em connections (sinais do postgres).
+        wrapper = base.DatabaseWrapper(settings_dict, alias=DEFAULT_DB_ALIAS)
+        other = base.DatabaseWrapper(settings_dict, alias=DEFAULT_DB_ALIAS)
+        self.addCleanup(base.close_pools)
+        self.addCleanup(other.close)
+
+        with wrapper.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        raw = wrapper.connection
+        wrapper.close()
+
+        with other.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        self.assertIs(other.connection, raw)
+
+        with self.assertRaises(OperationalError):
+            wrapper.ensure_connection()
@@ -0,0 +1,53 @@
+"""
+  Testes do cache LRU com expiração
+"""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from core.lru import LRUCache
+
+
+class LRUCacheTests(SimpleTestCase):
+    """Testes do LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Testa a remoção do item usado há mais tempo."""
+        lru = LRUCache(maxsize=2, ttl=60)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')
+
+        lru.set('c', 3)
+
+        self.assertEqual(lru.get('a'), 1)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(len(lru), 2)
+
+    @patch('core.lru.time.monotonic')
+    def test_expires_after_ttl(self, patched_monotonic):
+        """Testa a expiração do item após o TTL."""
+        patched_monotonic.return_value = 100
+        lru = LRUCache(maxsize=2, ttl=60)
+        lru.set('a', 1)
+
+        patched_monotonic.return_value = 159
+        self.assertEqual(lru.get('a'), 1)
+
+        patched_monotonic.return_value = 160
+        self.assertIsNone(lru.get('a'))
+        self.assertEqual(len(lru), 0)
+
+    def test_pop_and_clear(self):
+        """Testa a remoção de um item e de todos."""
+        lru = LRUCache(maxsize=3, ttl=60)
+        lru.set('a', 1)
+        lru.set('b', 2)
+
+        lru.pop('a')
+        lru.pop('inexistente')
+
+        self.assertIsNone(lru.get('a'))
+        lru.clear()
+        self.assertEqual(len(lru), 0)
@@ -0,0 +1,48 @@
+"""
+  Testes da rota de métricas
+"""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core import metrics
+
+METRICS_URL = reverse('core:metrics')
+
+
+class MetricsApiTests(TestCase):
+    """Testes da rota de métricas."""
+
+    def setUp(self):
+        self.client = APIClient()
+        metrics.reset()
+
+    def test_staff_required(self):
+        """Testa a rota restrita à equipe."""
+        _user = get_user_model().objects.create_user(
+            'user@test.com', 'testpass123')
+        self.client.force_authenticate(_user)
+
+        res = self.client.get(METRICS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_retrieve_counters(self):
+        """Testa o retorno dos contadores do processo."""
+        _admin = get_user_model().objects.create_superuser(
+            'admin@test.com', 'testpass123')
+        self.client.force_authenticate(_admin)
+        metrics.increment('test.counter', 2)
+        metrics.increment('test.cache.hit', 3)
+        metrics.increment('test.cache.miss')
+
+        res = self.client.get(METRICS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['counters']['test.counter'], 2)
+        self.assertEqual(res.data['hit_ratios'], {'test.cache': 0.75})
+        self.assertIn('pid', res.data)
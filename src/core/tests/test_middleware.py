@@ -0,0 +1,65 @@
+"""
+  Testes dos middlewares de sessão fora das rotas da API
+"""
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from core.middleware import (
+    AuthenticationMiddleware,
+    CsrfViewMiddleware,
+    MessageMiddleware,
+    SessionMiddleware,
+)
+
+
+class TokenRouteMiddlewareTests(TestCase):
+    """Testes dos middlewares isentos nas rotas autenticadas por token."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _run(self, path):
+        """Executa a pilha de sessão e retorna o request e a resposta."""
+        handler = MessageMiddleware(lambda request: HttpResponse())
+        for middleware in (AuthenticationMiddleware, CsrfViewMiddleware,
+                           SessionMiddleware):
+            handler = middleware(handler)
+        request = self.factory.get(path)
+
+        return request, handler(request)
+
+    def test_api_route_skips_session_stack(self):
+        """Testa a rota da API sem sessão, usuário e mensagens."""
+        request, _response = self._run('/api/recipe/recipes/')
+
+        for attr in ('session', 'user', '_messages'):
+            self.assertFalse(hasattr(request, attr))
+        self.assertIsNone(CsrfViewMiddleware(HttpResponse).process_view(
+            self.factory.post('/api/user/create/'), lambda r: None, (), {}))
+
+    def test_other_routes_keep_session_stack(self):
+        """Testa o admin com sessão, usuário e mensagens."""
+        request, _response = self._run('/admin/')
+
+        for attr in ('session', 'user', '_messages'):
+            self.assertTrue(hasattr(request, attr))
+
+    def test_api_response_without_cookies(self):
+        """Testa a resposta da API sem cookies e com X-Frame-Options."""
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(
+            'user@test.com', 'password@123'))
+
+        for accept in ('application/json', 'text/html'):
+            with self.subTest(accept):
+                res = client.get(
+                    reverse('recipe:tag-list'), HTTP_ACCEPT=accept)
+
+                self.assertEqual(res.status_code, 200)
+                self.assertFalse(res.cookies)
+                self.assertEqual(res['X-Frame-Options'], 'DENY')
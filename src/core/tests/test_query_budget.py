@@ -0,0 +1,100 @@
+"""
+  Testes do orçamento de queries
+"""
+
+from unittest.mock import Mock, patch
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from core.middleware import QueryBudgetMiddleware
+from core.query_budget import QueryBudgetExceeded, query_budget
+
+
+def run_queries(count):
+    """Executa a quantidade informada de queries."""
+    for _ in range(count):
+        list(get_user_model().objects.all())
+
+
+def budget_view(budget, actions=None):
+    """Cria uma view falsa com o orçamento declarado."""
+    view = Mock()
+    view.cls.query_budget = budget
+    view.actions = actions
+    return view
+
+
+class QueryBudgetTests(TestCase):
+    """Testes do context manager/decorator query_budget."""
+
+    def test_within_budget(self):
+        """Testa um bloco dentro do orçamento."""
+        with query_budget(2) as captured:
+            run_queries(2)
+
+        self.assertEqual(len(captured), 2)
+
+    def test_over_budget_raises(self):
+        """Testa um bloco acima do orçamento com falha."""
+        with self.assertRaises(QueryBudgetExceeded) as ctx:
+            with query_budget(1):
+                run_queries(2)
+
+        self.assertIn('2 queries', str(ctx.exception))
+
+    def test_decorator(self):
+        """Testa o uso como decorator."""
+        @query_budget(1)
+        def decorated():
+            run_queries(2)
+
+        with self.assertRaises(QueryBudgetExceeded):
+            decorated()
+
+
+class QueryBudgetMiddlewareTests(TestCase):
+    """Testes do middleware de orçamento de queries."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _middleware(self, queries):
+        """Cria o middleware com uma view que executa N queries."""
+        def get_response(request):
+            run_queries(queries)
+            return HttpResponse()
+
+        return QueryBudgetMiddleware(get_response)
+
+    def test_unused_without_debug(self):
+        """Testa o middleware desativado fora do DEBUG."""
+        with self.assertRaises(MiddlewareNotUsed):
+            QueryBudgetMiddleware(lambda request: HttpResponse())
+
+    @override_settings(DEBUG=True)
+    def test_logs_over_budget(self):
+        """Testa o log de uma view acima do orçamento."""
+        middleware = self._middleware(3)
+        request = self.factory.get('/api/recipe/recipes/')
+        middleware.process_view(
+            request, budget_view({'list': 2}, {'get': 'list'}), (), {})
+
+        with self.assertLogs('core.middleware', level='ERROR') as logs:
+            middleware(request)
+
+        self.assertIn('3 de 2', logs.output[0])
+
+    @override_settings(DEBUG=True)
+    @patch('core.middleware.logger')
+    def test_silent_within_budget(self, patched_logger):
+        """Testa nenhum log para views dentro do orçamento."""
+        middleware = self._middleware(1)
+        request = self.factory.get('/api/recipe/tags/')
+        middleware.process_view(request, budget_view(2), (), {})
+
+        middleware(request)
+
+        patched_logger.error.assert_not_called()
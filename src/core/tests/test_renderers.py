@@ -0,0 +1,157 @@
+"""
+  Testes do renderer e do parser JSON com orjson
+"""
+
+import datetime
+import io
+import uuid
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.models import Recipe
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+
+def payload() -> dict:
+    """Retorna dados com os tipos fora do JSON usados pela API."""
+    return {
+        'price': Decimal('12.50'),
+        'created': datetime.datetime(
+            2021, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        'naive': datetime.datetime(2021, 5, 1, 12, 30),
+        'date': datetime.date(2021, 5, 1),
+        'time': datetime.time(8, 15),
+        'duration': datetime.timedelta(minutes=90),
+        'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'message': gettext_lazy('This field is required.'),
+        'title': 'Pão de queijo \u2028\u2029 ☕',
+        1: [None, True, 1.5, ('a', 'b')],
+    }
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """Testes do FastJSONRenderer."""
+
+    def test_same_bytes_as_json_renderer(self):
+        """Testa a saída idêntica à do JSONRenderer."""
+        data = payload()
+
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent(self):
+        """Testa a indentação pedida no media type."""
+        rendered = FastJSONRenderer().render(
+            {'a': [1]}, 'application/json; indent=4')
+
+        self.assertEqual(rendered, b'{\n  "a": [\n    1\n  ]\n}')
+
+    def test_none_is_empty(self):
+        """Testa a resposta vazia sem dados."""
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_fallback_to_json_renderer(self):
+        """Testa o json da stdlib sem o orjson e em inteiros grandes."""
+        data = payload()
+        with patch('core.renderers.orjson', None):
+            self.assertEqual(
+                FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+        big = 2 ** 70
+        self.assertEqual(FastJSONRenderer().render([big]), b'[%d]' % big)
+
+
+class FastJSONParserTests(SimpleTestCase):
+    """Testes do FastJSONParser."""
+
+    def _parse(self, body, parser_class=FastJSONParser, **context):
+        return parser_class().parse(
+            io.BytesIO(body), parser_context=context)
+
+    def test_same_data_as_json_parser(self):
+        """Testa o resultado idêntico ao do JSONParser."""
+        body = '{"title": "Pão", "price": "1.50", "tags": [{"id": 1}]}'
+
+        self.assertEqual(
+            self._parse(body.encode()),
+            self._parse(body.encode(), JSONParser),
+        )
+
+    def test_invalid_json(self):
+        """Testa o ParseError com JSON inválido ou NaN."""
+        for body in (b'{"title": ', b'{"price": NaN}'):
+            with self.subTest(body):
+                with self.assertRaises(ParseError):
+                    self._parse(body)
+
+    def test_fallback_to_json_parser(self):
+        """Testa o JSONParser sem o orjson e fora do UTF-8."""
+        with patch('core.parsers.orjson', None):
+            self.assertEqual(self._parse(b'{"a": 1}'), {'a': 1})
+
+        self.assertEqual(
+            self._parse('{"a": "ç"}'.encode('latin-1'), encoding='latin-1'),
+            {'a': 'ç'},
+        )
+
+    def test_big_integers_exact(self):
+        """Testa os inteiros fora de 64 bits sem perda, como no JSONParser."""
+        for body in (b'[123456789012345678901234567890]',
+                     b'123456789012345678901234',
+                     b' -123456789012345678901234',
+                     b'[123456789012345678901234, 1]',
+                     b'{"id": -9223372036854775809}',
+                     b'[1e400]'):
+            with self.subTest(body):
+                self.assertEqual(
+                    self._parse(body), self._parse(body, JSONParser))
+
+    def test_digits_in_strings_use_orjson(self):
+        """Testa o orjson com hashes de muitos dígitos em textos."""
+        body = b'{"image": "ab/%s.jpg"}' % (b'0' * 63 + b'1')
+
+        with patch.object(JSONParser, 'parse') as parse:
+            self.assertEqual(
+                self._parse(body), {'image': 'ab/%s.jpg' % ('0' * 63 + '1')})
+        parse.assert_not_called()
+
+
+class FastJSONApiTests(TestCase):
+    """Testes da API com o renderer e o parser padrão."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'password@123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_and_read_recipe(self):
+        """Testa a criação e a leitura de receita em JSON."""
+        res = self.client.post(
+            reverse('recipe:recipe-list'),
+            {'title': 'Pão', 'time_minutes': 5, 'price': '1.50'},
+            format='json',
+        )
+        self.assertEqual(res.status_code, 201)
+        self.assertIsInstance(res.accepted_renderer, FastJSONRenderer)
+
+        recipe = Recipe.objects.get(user=self.user)
+        self.assertEqual(recipe.price, Decimal('1.50'))
+
+        res = self.client.get(
+            reverse('recipe:recipe-detail', args=[recipe.id]))
+        self.assertEqual(res.json()['price'], '1.50')
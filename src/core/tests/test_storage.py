@@ -0,0 +1,128 @@
+"""Testa o storage endereçado pelo conteúdo e o GC dos blobs."""
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+
+from PIL import Image
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.models import ImageBlob, Recipe
+from core.storage import content_storage
+
+
+def image_content(color='red'):
+    """Cria e retorna o conteúdo de uma imagem JPEG."""
+    buffer = io.BytesIO()
+    Image.new('RGB', (10, 10), color).save(buffer, 'JPEG')
+    return ContentFile(buffer.getvalue())
+
+
+class ContentAddressedStorageTests(TestCase):
+    """Testes para o storage e as referências dos blobs."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'password@123'
+        )
+
+    def _recipe(self, **params):
+        return Recipe.objects.create(
+            user=self.user,
+            title='Receita',
+            time_minutes=10,
+            price=5,
+            **params,
+        )
+
+    def _gc(self, *args):
+        call_command('gc_image_blobs', '--grace=0', *args,
+                     stdout=io.StringIO())
+
+    def test_name_is_content_hash(self):
+        """Testa o nome do arquivo pelo SHA-256 do conteúdo."""
+        content = image_content()
+        digest = hashlib.sha256(content.read()).hexdigest()
+
+        name = content_storage.save('uploads/recipe/photo.JPG', content)
+
+        self.assertEqual(name, f'uploads/recipe/{digest[:2]}/{digest}.jpg')
+
+    def test_identical_content_stored_once(self):
+        """Testa a gravação única de conteúdos idênticos."""
+        first = content_storage.save('uploads/recipe/a.jpg', image_content())
+        second = content_storage.save('uploads/recipe/b.jpg', image_content())
+        other = content_storage.save(
+            'uploads/recipe/c.jpg', image_content('blue'))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        files = [
+            file for _path, _dirs, names in os.walk(self.media_root)
+            for file in names
+        ]
+        self.assertEqual(len(files), 2)
+
+    def test_refcount_follows_recipes(self):
+        """Testa as referências ao gravar, trocar e deletar imagens."""
+        recipe = self._recipe()
+        recipe.image.save('a.jpg', image_content())
+        other = self._recipe()
+        other.image.save('b.jpg', image_content())
+        name = recipe.image.name
+
+        self.assertEqual(other.image.name, name)
+        self.assertEqual(ImageBlob.objects.get(name=name).refcount, 2)
+
+        recipe.image.save('c.jpg', image_content('blue'))
+        other.delete()
+
+        self.assertEqual(ImageBlob.objects.get(name=name).refcount, 0)
+        self.assertEqual(
+            ImageBlob.objects.get(name=recipe.image.name).refcount, 1)
+
+    def test_gc_deletes_unreferenced_blobs(self):
+        """Testa a remoção apenas dos blobs sem referências."""
+        recipe = self._recipe()
+        recipe.image.save('a.jpg', image_content())
+        old_name = recipe.image.name
+        recipe.image.save('b.jpg', image_content('blue'))
+
+        self._gc()
+
+        self.assertFalse(content_storage.exists(old_name))
+        self.assertFalse(ImageBlob.objects.filter(name=old_name).exists())
+        self.assertTrue(content_storage.exists(recipe.image.name))
+
+    def test_gc_keeps_recent_blobs(self):
+        """Testa que o GC respeita o período de carência."""
+        recipe = self._recipe()
+        recipe.image.save('a.jpg', image_content())
+        name = recipe.image.name
+        recipe.delete()
+
+        call_command('gc_image_blobs', stdout=io.StringIO())
+
+        self.assertTrue(content_storage.exists(name))
+
+    def test_gc_orphans(self):
+        """Testa a remoção dos arquivos sem registro de blob."""
+        name = content_storage.save('uploads/recipe/a.jpg', image_content())
+
+        self._gc()
+        self.assertTrue(content_storage.exists(name))
+        self._gc('--orphans')
+        self.assertFalse(content_storage.exists(name))
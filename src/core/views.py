@@ -0,0 +1,25 @@
+"""Views do core da API."""
+
+import os
+
+from drf_spectacular.utils import OpenApiTypes, extend_schema
+from rest_framework import authentication, permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core import metrics
+
+
+class MetricsView(APIView):
+    """Retorna os contadores de métricas do processo."""
+    authentication_classes = [authentication.TokenAuthentication]
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(responses=OpenApiTypes.OBJECT)
+    def get(self, request):
+        """Retorna o PID e os contadores do worker que atendeu."""
+        return Response({
+            'pid': os.getpid(),
+            'counters': metrics.snapshot(),
+            'hit_ratios': metrics.hit_ratios(),
+        })
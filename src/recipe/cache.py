@@ -0,0 +1,114 @@
+"""
+Cache das listagens por usuário.
+
+As respostas são guardadas pela chave (usuário, rota, parâmetros
+normalizados, versão dos dados do usuário). Qualquer escrita em receitas,
+Tags ou ingredientes incrementa a versão do usuário: a invalidação é O(1)
+e as respostas antigas apenas deixam de ser lidas até expirarem.
+"""
+
+import hashlib
+import time
+
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from core import metrics
+
+KEY_PREFIX = 'recipe-cache'
+
+
+def _version_key(user_id) -> str:
+    return f'{KEY_PREFIX}:version:{user_id}'
+
+
+def _modified_key(user_id) -> str:
+    return f'{KEY_PREFIX}:modified:{user_id}'
+
+
+def get_version(user_id) -> int:
+    """Retorna a versão atual dos dados do usuário."""
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        # Iniciada pelo relógio: se a versão for removida do cache, a nova
+        # é sempre maior que as anteriores e nunca reaproveita respostas.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def get_last_modified(user_id) -> int:
+    """Retorna o timestamp da última escrita nos dados do usuário."""
+    key = _modified_key(user_id)
+    modified = cache.get(key)
+    if modified is None:
+        # Sem o registro, assume-se uma escrita agora (nunca um 304 falso).
+        cache.add(key, int(time.time()), timeout=None)
+        modified = cache.get(key)
+
+    return modified
+
+
+def bump_version(user_id) -> None:
+    """Incrementa a versão dos dados do usuário."""
+    cache.set(_modified_key(user_id), int(time.time()), timeout=None)
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.add(_version_key(user_id), time.time_ns(), timeout=None)
+
+
+def invalidate(user_id) -> None:
+    """Invalida as listagens do usuário, agora e após o commit.
+
+    O segundo incremento descarta respostas montadas por leituras
+    concorrentes antes de a transação ser gravada.
+    """
+    bump_version(user_id)
+    transaction.on_commit(lambda: bump_version(user_id))
+
+
+def normalized_url(request) -> str:
+    """Retorna host, rota e parâmetros ordenados da requisição."""
+    params = urlencode(sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+    ))
+
+    return f'{request.get_host()}{request.path}?{params}'
+
+
+def list_cache_key(request) -> str:
+    """Retorna a chave da listagem para o usuário e os parâmetros."""
+    digest = hashlib.sha1(normalized_url(request).encode()).hexdigest()
+    user_id = request.user.id
+
+    return f'{KEY_PREFIX}:{user_id}:{get_version(user_id)}:{digest}'
+
+
+class CachedListMixin:
+    """Serve a action list pelo cache versionado do usuário."""
+
+    def list(self, request, *args, **kwargs):
+        """Retorna a listagem do cache ou a monta e guarda."""
+        key = list_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            metrics.increment('recipe.list_cache.hit')
+            return Response(data, headers={'X-Cache': 'HIT'})
+
+        metrics.increment('recipe.list_cache.miss')
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.RECIPE_LIST_CACHE_TIMEOUT)
+        response['X-Cache'] = 'MISS'
+
+        return response
@@ -0,0 +1,155 @@
+"""
+Requisições condicionais (ETag e Last-Modified) da rota de receitas.
+
+Os validadores são calculados sem serializar a resposta: as listagens
+usam a versão dos dados do usuário (recipe.cache) e os detalhes, o
+updated_at do objeto (e dos relacionados, get_detail_versions), buscado
+em uma única query. As escritas de detalhe verificam o If-Match com a
+linha travada, na mesma transação da escrita.
+"""
+
+import hashlib
+
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+
+from recipe.cache import get_last_modified, get_version, normalized_url
+from recipe.fieldsets import FIELDSET_PARAMS
+
+DETAIL_ACTIONS = ('retrieve', 'update', 'partial_update', 'destroy')
+
+
+class PreconditionResponse(Exception):
+    """Interrompe a view com a resposta 304 ou 412 já pronta."""
+
+    def __init__(self, response):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+def make_etag(*parts) -> str:
+    """Retorna um ETag forte a partir das partes informadas."""
+    digest = hashlib.sha1(':'.join(map(str, parts)).encode()).hexdigest()
+
+    return quote_etag(digest)
+
+
+class ConditionalMixin:
+    """Atende If-None-Match/If-Modified-Since e If-Match das actions."""
+
+    def get_list_validators(self, request):
+        """Retorna o ETag e o Last-Modified da listagem do usuário."""
+        user_id = request.user.id
+        etag = make_etag(
+            get_version(user_id),
+            normalized_url(request),
+            request.accepted_renderer.format,
+        )
+
+        return etag, get_last_modified(user_id)
+
+    def get_detail_versions(self, queryset):
+        """Retorna o updated_at e as partes do ETag do objeto, ou None."""
+        updated_at = queryset.values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+
+        return updated_at, (updated_at.isoformat(),)
+
+    def get_detail_validators(self, request, pk):
+        """Retorna o ETag e o Last-Modified do objeto, ou None."""
+        queryset = self.queryset.filter(user=request.user, pk=pk)
+        if request.method not in SAFE_METHODS:
+            # Travada até o fim da escrita (dispatch): um escritor
+            # concorrente com o mesmo ETag espera e recebe o 412.
+            queryset = queryset.select_for_update()
+        versions = self.get_detail_versions(queryset)
+        if versions is None:
+            return None
+
+        updated_at, parts = versions
+        etag = make_etag(
+            self.basename,
+            pk,
+            *parts,
+            request.accepted_renderer.format,
+            # Campos esparsos: cada seleção é uma representação.
+            *(f'{param}={request.query_params[param]}'
+              for param in FIELDSET_PARAMS if param in request.query_params),
+        )
+
+        return etag, int(updated_at.timestamp())
+
+    def _get_validators(self, request, kwargs):
+        """Retorna os validadores da action atual, se houver."""
+        if self.action == 'list':
+            return self.get_list_validators(request)
+
+        if self.action in DETAIL_ACTIONS and 'pk' in kwargs:
+            try:
+                return self.get_detail_validators(request, kwargs['pk'])
+            except (TypeError, ValueError):
+                return None
+
+        return None
+
+    def dispatch(self, request, *args, **kwargs):
+        """Executa as escritas de detalhe em uma única transação."""
+        if request.method in SAFE_METHODS or 'pk' not in kwargs:
+            return super().dispatch(request, *args, **kwargs)
+
+        with transaction.atomic():
+            return super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        """Responde 304/412 antes de executar a action, se aplicável."""
+        super().initial(request, *args, **kwargs)
+
+        self.validators = self._get_validators(request, kwargs)
+        if self.validators is None:
+            return
+
+        etag, last_modified = self.validators
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if response is not None:
+            raise PreconditionResponse(
+                self._set_validators(response, self.validators))
+
+    def _set_validators(self, response, validators):
+        """Inclui o ETag e o Last-Modified na resposta."""
+        etag, last_modified = validators
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+
+        return response
+
+    def handle_exception(self, exc):
+        """Retorna a resposta condicional sem tratá-la como erro."""
+        if isinstance(exc, PreconditionResponse):
+            return exc.response
+
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Inclui os validadores nas respostas 200.
+
+        Após uma escrita os validadores são recalculados, para que o
+        cliente possa enviar o novo ETag no próximo If-Match.
+        """
+        response = super().finalize_response(
+            request, response, *args, **kwargs)
+        validators = getattr(self, 'validators', None)
+        if validators is None or response.status_code != status.HTTP_200_OK:
+            return response
+
+        if request.method not in SAFE_METHODS:
+            validators = self._get_validators(request, kwargs)
+
+        return self._set_validators(response, validators)
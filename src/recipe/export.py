@@ -0,0 +1,113 @@
+"""Exportação em streaming (NDJSON) das receitas do usuário."""
+
+import json
+import zlib
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+from core.models import Recipe
+
+EXPORT_FIELDS = [
+    'id',
+    'title',
+    'description',
+    'time_minutes',
+    'price',
+    'link',
+    'image',
+]
+
+EXPORT_RELATIONS = {
+    'tags': 'tag',
+    'ingredients': 'ingredient',
+}
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renderer para respostas em NDJSON (um objeto JSON por linha)."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Renderiza um único objeto (ex.: erros) como uma linha."""
+        return dumps_line(data)
+
+
+def dumps_line(data) -> bytes:
+    """Serializa um objeto como uma linha NDJSON."""
+    return (json.dumps(
+        data,
+        cls=DjangoJSONEncoder,
+        ensure_ascii=False,
+        separators=(',', ':'),
+    ) + '\n').encode('utf-8')
+
+
+def _add_relations(recipes, build_url) -> list:
+    """Busca em lote as Tags e ingredientes de um bloco de receitas."""
+    by_id = {}
+    for recipe in recipes:
+        recipe['price'] = str(recipe['price'])
+        recipe['image'] = build_url(recipe['image'])
+        for field_name in EXPORT_RELATIONS:
+            recipe[field_name] = []
+        by_id[recipe['id']] = recipe
+
+    for field_name, target in EXPORT_RELATIONS.items():
+        through = Recipe._meta.get_field(field_name).remote_field.through
+        rows = through.objects.filter(
+            recipe_id__in=by_id,
+        ).order_by(f'{target}_id').values_list(
+            'recipe_id', f'{target}_id', f'{target}__name')
+        for recipe_id, attr_id, name in rows:
+            by_id[recipe_id][field_name].append({'id': attr_id, 'name': name})
+
+    return recipes
+
+
+def iter_recipes(user, build_url=None, chunk_size=None):
+    """Percorre as receitas do usuário com cursor no servidor.
+
+    As receitas são lidas em blocos de chunk_size e cada bloco busca suas
+    relações em duas queries, mantendo a memória constante.
+    """
+    chunk_size = chunk_size or settings.RECIPE_EXPORT_CHUNK_SIZE
+    image_field = Recipe._meta.get_field('image')
+
+    def default_url(name):
+        """Retorna a URL da imagem no storage (ou None)."""
+        return image_field.storage.url(name) if name else None
+
+    build_url = build_url or default_url
+    recipes = Recipe.objects.filter(user=user).order_by('id').values(
+        *EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+
+    chunk = []
+    for recipe in recipes:
+        chunk.append(recipe)
+        if len(chunk) >= chunk_size:
+            yield from _add_relations(chunk, build_url)
+            chunk = []
+
+    if chunk:
+        yield from _add_relations(chunk, build_url)
+
+
+def iter_ndjson(user, build_url=None, chunk_size=None):
+    """Gera as receitas do usuário em linhas NDJSON (bytes)."""
+    for recipe in iter_recipes(user, build_url, chunk_size):
+        yield dumps_line(recipe)
+
+
+def gzip_stream(chunks, level=6):
+    """Comprime em gzip, sob demanda, um iterável de bytes."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+
+    yield compressor.flush()
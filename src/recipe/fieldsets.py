@@ -0,0 +1,82 @@
+"""
+Campos esparsos (?fields=) e expansão das relações (?expand=).
+
+Sem os parâmetros a resposta é completa. ?fields= lista os campos da
+resposta e ?expand=, as relações incluídas (Tags e ingredientes); com
+?fields= as relações só entram se pedidas em um dos dois. O id é sempre
+incluído: é a posição do cursor da paginação. Colunas e relações não
+pedidas não são buscadas no banco.
+"""
+
+from django.utils.functional import cached_property
+from django.utils.translation import gettext as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+from drf_spectacular.utils import OpenApiParameter, OpenApiTypes
+
+FIELDSET_PARAMS = ('fields', 'expand')
+
+FIELDSET_ACTIONS = ('list', 'retrieve')
+
+FIELDSET_PARAMETERS = [
+    OpenApiParameter(
+        'fields',
+        OpenApiTypes.STR,
+        description='Campos da resposta separados por vírgula '
+                    '(o id é sempre incluído).'
+    ),
+    OpenApiParameter(
+        'expand',
+        OpenApiTypes.STR,
+        description='Relações incluídas na resposta, separadas por '
+                    'vírgula (padrão com fields: nenhuma).'
+    ),
+]
+
+
+def _split(value) -> list:
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+class DynamicFieldsMixin:
+    """Limita os campos das actions de leitura aos parâmetros da query."""
+    expandable_fields = ()
+
+    @cached_property
+    def fieldset(self):
+        """Retorna os campos pedidos, na ordem do serializer, ou None."""
+        params = self.request.query_params
+        if (self.action not in FIELDSET_ACTIONS
+                or self.request.method not in SAFE_METHODS
+                or not any(param in params for param in FIELDSET_PARAMS)):
+            return None
+
+        available = self.get_serializer_class().Meta.fields
+        if 'fields' in params:
+            fields = _split(params['fields'])
+        else:
+            fields = [name for name in available
+                      if name not in self.expandable_fields]
+        expand = _split(params.get('expand', ''))
+
+        errors = {}
+        for param, names, allowed in (
+                ('fields', fields, available),
+                ('expand', expand, self.expandable_fields)):
+            invalid = sorted(set(names) - set(allowed))
+            if invalid:
+                errors[param] = _('Campos inválidos: %s.') % ', '.join(
+                    invalid)
+        if errors:
+            raise ValidationError(errors)
+
+        requested = {'id', *fields, *expand}
+        return [name for name in available if name in requested]
+
+    def get_serializer_context(self):
+        """Inclui os campos pedidos no contexto do serializer."""
+        context = super().get_serializer_context()
+        context['fields'] = self.fieldset
+
+        return context
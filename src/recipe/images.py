@@ -0,0 +1,157 @@
+"""
+Geração das variantes (thumb, card e full) das imagens das receitas.
+
+As variantes são geradas com o Pillow fora da requisição, em um pool de
+threads do processo, após o commit do upload. Com
+RECIPE_IMAGE_VARIANTS_SYNC (testes e comandos) a geração é síncrona.
+"""
+
+import io
+import logging
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from core.models import (
+    IMAGE_STATUS_FAILED,
+    IMAGE_STATUS_READY,
+    ImageBlob,
+    Recipe,
+    RecipeMedia,
+)
+from recipe import cache
+
+logger = logging.getLogger(__name__)
+
+# Nome: (tamanho máximo, recorta para preencher o tamanho).
+VARIANTS = {
+    'thumb': ((160, 160), True),
+    'card': ((480, 360), True),
+    'full': ((1600, 1600), False),
+}
+
+FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Retorna o pool de threads do processo, criado sob demanda."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.RECIPE_IMAGE_WORKERS,
+                thread_name_prefix='recipe-images',
+            )
+
+    return _executor
+
+
+def _to_rgb(image):
+    """Converte a imagem para RGB, com fundo branco na transparência."""
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+
+    return image.convert('RGB')
+
+
+def _resize(image, size, crop):
+    """Retorna a imagem reduzida (nunca ampliada) para o tamanho."""
+    if crop:
+        size = (min(size[0], image.width), min(size[1], image.height))
+        return ImageOps.fit(image, size, Image.LANCZOS)
+
+    resized = image.copy()
+    resized.thumbnail(size, Image.LANCZOS)
+    return resized
+
+
+def render_variants(storage, name) -> dict:
+    """Gera e grava as variantes do arquivo e retorna os caminhos."""
+    with storage.open(name) as source:
+        image = _to_rgb(Image.open(source))
+
+    stem = os.path.splitext(name)[0]
+    variants = {}
+    for variant, (size, crop) in VARIANTS.items():
+        resized = _resize(image, size, crop)
+        variants[variant] = {}
+        for ext, (image_format, options) in FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, image_format, **options)
+            variants[variant][ext] = storage.save(
+                f'{stem}_{variant}.{ext}', ContentFile(buffer.getvalue()))
+
+    return variants
+
+
+def generate_variants(recipe_id, name) -> None:
+    """Gera as variantes da imagem name e atualiza a receita."""
+    if not name:
+        return
+
+    recipe = Recipe.objects.filter(pk=recipe_id, image=name).first()
+    if recipe is None:
+        # A imagem foi trocada ou a receita deletada antes do job.
+        return
+
+    try:
+        variants = render_variants(recipe.image.storage, name)
+        image_status = IMAGE_STATUS_READY
+    except Exception:
+        logger.exception('Falha ao gerar as variantes de %s', name)
+        variants = {}
+        image_status = IMAGE_STATUS_FAILED
+
+    updated = Recipe.objects.filter(pk=recipe_id, image=name).update(
+        image_status=image_status,
+        image_variants=variants,
+        updated_at=timezone.now(),
+    )
+    if updated:
+        new_names = [name for formats in variants.values()
+                     for name in formats.values()]
+        old_names = [name for formats in recipe.image_variants.values()
+                     for name in formats.values()]
+        ImageBlob.objects.acquire(new_names)
+        ImageBlob.objects.release(old_names)
+        RecipeMedia.objects.replace(recipe_id, old_names, new_names)
+        cache.invalidate(recipe.user_id)
+
+
+def _run_job(job) -> None:
+    """Executa o job no pool, liberando a conexão da thread ao final."""
+    try:
+        job()
+    finally:
+        connection.close()
+
+
+def schedule_variants(recipe) -> None:
+    """Agenda a geração das variantes da imagem atual da receita."""
+    job = partial(generate_variants, recipe.pk, recipe.image.name)
+    if settings.RECIPE_IMAGE_VARIANTS_SYNC:
+        job()
+        recipe.refresh_from_db(fields=['image_status', 'image_variants'])
+        # As variantes já foram referenciadas por generate_variants.
+        recipe._blob_names = recipe.blob_names()
+        return
+
+    transaction.on_commit(lambda: _get_executor().submit(_run_job, job))
@@ -0,0 +1,188 @@
+"""Importação em lote (CSV/NDJSON) das receitas do usuário."""
+
+import csv
+import io
+import json
+import time
+
+from itertools import islice
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from core.models import Recipe
+from recipe import cache, services
+from recipe.serializers import RecipeDetailSerializer
+
+CSV_LIST_SEPARATOR = '|'
+
+IGNORED_FIELDS = ('id', 'image')
+
+
+class RecipeImportError(Exception):
+    """Erro de importação com a linha a partir da qual retomar."""
+
+    def __init__(self, message, row, errors=None, resume_from=0):
+        super().__init__(message)
+        self.row = row
+        self.errors = errors
+        self.resume_from = resume_from
+
+
+def _text_stream(stream):
+    """Garante a leitura do arquivo como texto UTF-8, linha a linha."""
+    if isinstance(stream, io.TextIOBase):
+        return stream
+
+    return io.TextIOWrapper(stream, encoding='utf-8', newline='')
+
+
+def parse_ndjson(stream):
+    """Lê um arquivo NDJSON (mesmo formato da exportação)."""
+    for line in _text_stream(stream):
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def parse_csv(stream):
+    """Lê um CSV com cabeçalho; tags e ingredients separados por |."""
+    for row in csv.DictReader(_text_stream(stream)):
+        for field_name in services.RELATED_MODELS:
+            names = (row.get(field_name) or '').split(CSV_LIST_SEPARATOR)
+            row[field_name] = [
+                {'name': name.strip()} for name in names if name.strip()
+            ]
+        yield row
+
+
+PARSERS = {
+    'csv': parse_csv,
+    'ndjson': parse_ndjson,
+}
+
+
+def guess_format(filename: str) -> str:
+    """Retorna o formato do arquivo pela extensão (padrão NDJSON)."""
+    return 'csv' if filename.lower().endswith('.csv') else 'ndjson'
+
+
+class RecipeImporter:
+    """Carrega receitas em lotes de bulk_create.
+
+    Os nomes de Tags e ingredientes são deduplicados em memória por
+    usuário, e cada lote é gravado em uma transação própria. Em caso de
+    falha, RecipeImportError.resume_from indica a linha para retomar.
+    """
+
+    def __init__(self, user, batch_size=None):
+        self.user = user
+        self.batch_size = batch_size or settings.RECIPE_IMPORT_BATCH_SIZE
+        self.attr_ids = {field_name: {} for field_name in
+                         services.RELATED_MODELS}
+        self.committed = 0
+        self.imported = 0
+        self.started_at = None
+
+    @property
+    def rows_per_second(self) -> float:
+        """Retorna a vazão de linhas importadas por segundo."""
+        elapsed = time.monotonic() - self.started_at
+        return self.imported / elapsed if elapsed > 0 else 0.0
+
+    def run(self, rows, start=0, on_batch=None) -> int:
+        """Importa as linhas a partir de start e retorna o total gravado.
+
+        on_batch(importer) é chamado após a gravação de cada lote.
+        """
+        self.started_at = time.monotonic()
+        self.committed = start
+        rows = islice(rows, start, None)
+
+        while True:
+            try:
+                batch = list(islice(rows, self.batch_size))
+            except (ValueError, csv.Error) as error:
+                raise RecipeImportError(
+                    f'Arquivo inválido: {error}',
+                    row=self.committed + 1,
+                    resume_from=self.committed,
+                ) from error
+            if not batch:
+                break
+
+            self._load_batch(self._validate(batch))
+            self.committed += len(batch)
+            self.imported += len(batch)
+            if on_batch:
+                on_batch(self)
+
+        return self.imported
+
+    def _validate(self, batch) -> list:
+        """Valida as linhas do lote com o serializer da receita."""
+        validated = []
+        for number, row in enumerate(batch, start=self.committed + 1):
+            if not isinstance(row, dict):
+                # No NDJSON a linha pode ser uma lista, um texto ou número.
+                raise RecipeImportError(
+                    f'Linha {number} inválida: esperado um objeto.',
+                    row=number,
+                    resume_from=self.committed,
+                )
+            for field_name in IGNORED_FIELDS:
+                row.pop(field_name, None)
+
+            serializer = RecipeDetailSerializer(data=row)
+            if not serializer.is_valid():
+                raise RecipeImportError(
+                    f'Linha {number} inválida.',
+                    row=number,
+                    errors=serializer.errors,
+                    resume_from=self.committed,
+                )
+            validated.append(serializer.validated_data)
+
+        return validated
+
+    def _resolve_names(self, batch) -> None:
+        """Cria apenas os nomes ainda não vistos nesta importação."""
+        for field_name, model in services.RELATED_MODELS.items():
+            known = self.attr_ids[field_name]
+            missing = {
+                item['name']
+                for data in batch
+                for item in data.get(field_name, [])
+                if item['name'] not in known
+            }
+            known.update(services.upsert_names(model, self.user, missing))
+
+    def _load_batch(self, batch) -> None:
+        """Grava o lote validado em uma única transação."""
+        try:
+            with transaction.atomic():
+                self._resolve_names(batch)
+                recipes = Recipe.objects.bulk_create([
+                    Recipe(user=self.user, **{
+                        attr: value for attr, value in data.items()
+                        if attr not in services.RELATED_MODELS
+                    })
+                    for data in batch
+                ])
+                for field_name in services.RELATED_MODELS:
+                    known = self.attr_ids[field_name]
+                    services.add_relations(field_name, [
+                        (recipe.id, known[item['name']])
+                        for recipe, data in zip(recipes, batch)
+                        for item in data.get(field_name, [])
+                    ])
+                cache.invalidate(self.user.id)
+        except DatabaseError as error:
+            # O cache de nomes pode conter IDs revertidos pelo rollback.
+            self.attr_ids = {field_name: {} for field_name in
+                             services.RELATED_MODELS}
+            raise RecipeImportError(
+                f'Falha ao gravar o lote: {error}',
+                row=self.committed + 1,
+                resume_from=self.committed,
+            ) from error
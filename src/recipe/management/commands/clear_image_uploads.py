@@ -0,0 +1,14 @@
+"""Remove os uploads de imagem expirados"""
+
+from django.core.management.base import BaseCommand
+
+from recipe.uploads import clear_expired
+
+
+class Command(BaseCommand):
+    """Remove os uploads em partes expirados e seus arquivos parciais"""
+    help = 'Remove os uploads de imagem em partes expirados.'
+
+    def handle(self, *args, **options):
+        "Entrypoint dos comandos"
+        self.stdout.write(f'{clear_expired()} upload(s) removed.')
@@ -0,0 +1,44 @@
+"""Exporta as receitas de um usuário em NDJSON"""
+
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from recipe.export import gzip_stream, iter_ndjson
+
+
+class Command(BaseCommand):
+    """Exporta as receitas, Tags e ingredientes de um usuário"""
+    help = 'Exporta as receitas de um usuário em NDJSON (streaming).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('email', help='E-mail do usuário.')
+        parser.add_argument(
+            '-o', '--output',
+            help='Arquivo de saída (padrão: stdout).',
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='Comprime a saída em gzip.',
+        )
+
+    def handle(self, *args, **options):
+        "Entrypoint dos comandos"
+        try:
+            user = get_user_model().objects.get(
+                email=options['email'].lower())
+        except get_user_model().DoesNotExist:
+            raise CommandError('Error: User not found!')
+
+        stream = iter_ndjson(user)
+        if options['gzip']:
+            stream = gzip_stream(stream)
+
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                output.writelines(stream)
+        else:
+            sys.stdout.buffer.writelines(stream)
+            sys.stdout.buffer.flush()
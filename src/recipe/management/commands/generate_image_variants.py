@@ -0,0 +1,32 @@
+"""Gera as variantes das imagens das receitas existentes"""
+
+from django.core.management.base import BaseCommand
+
+from core.models import IMAGE_STATUS_READY, Recipe
+from recipe.images import generate_variants
+
+
+class Command(BaseCommand):
+    """Gera, de forma síncrona, as variantes pendentes das receitas"""
+    help = 'Gera as variantes das imagens das receitas sem variantes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Gera novamente também as variantes já prontas.',
+        )
+
+    def handle(self, *args, **options):
+        "Entrypoint dos comandos"
+        recipes = Recipe.objects.exclude(image='').exclude(
+            image__isnull=True).order_by('id')
+        if not options['all']:
+            recipes = recipes.exclude(image_status=IMAGE_STATUS_READY)
+
+        count = 0
+        for recipe_id, name in recipes.values_list('id', 'image').iterator():
+            generate_variants(recipe_id, name)
+            count += 1
+
+        self.stdout.write(f'{count} image(s) processed.')
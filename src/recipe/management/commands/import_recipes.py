@@ -0,0 +1,89 @@
+"""Importa receitas de um arquivo CSV ou NDJSON para um usuário"""
+
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from recipe.importer import (
+    PARSERS,
+    RecipeImporter,
+    RecipeImportError,
+    guess_format,
+)
+
+
+class Command(BaseCommand):
+    """Importa receitas em lotes, com retomada por checkpoint"""
+    help = 'Importa receitas de um arquivo CSV ou NDJSON em lotes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('email', help='E-mail do usuário.')
+        parser.add_argument('path', help='Arquivo CSV ou NDJSON.')
+        parser.add_argument(
+            '--format',
+            choices=sorted(PARSERS),
+            help='Formato do arquivo (padrão: pela extensão).',
+        )
+        parser.add_argument('--batch-size', type=int)
+        parser.add_argument(
+            '--resume-from',
+            type=int,
+            help='Número de linhas já importadas a pular.',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='Arquivo com o progresso, para retomar após falhas '
+                 '(padrão: <path>.checkpoint).',
+        )
+
+    def _read_checkpoint(self, path) -> int:
+        """Retorna as linhas já gravadas segundo o checkpoint."""
+        if not os.path.exists(path):
+            return 0
+
+        with open(path) as checkpoint:
+            return int(checkpoint.read().strip() or 0)
+
+    def handle(self, *args, **options):
+        "Entrypoint dos comandos"
+        try:
+            user = get_user_model().objects.get(
+                email=options['email'].lower())
+        except get_user_model().DoesNotExist:
+            raise CommandError('Error: User not found!')
+
+        checkpoint_path = (
+            options['checkpoint'] or f'{options["path"]}.checkpoint')
+        start = options['resume_from']
+        if start is None:
+            start = self._read_checkpoint(checkpoint_path)
+        if start:
+            self.stdout.write(self.style.WARNING(
+                f'Info: Resuming after row {start}...'))
+
+        def on_batch(importer):
+            """Salva o checkpoint e informa o progresso do lote."""
+            with open(checkpoint_path, 'w') as checkpoint:
+                checkpoint.write(str(importer.committed))
+            self.stdout.write(
+                f'Info: {importer.committed} rows committed '
+                f'({importer.rows_per_second:.0f} rows/s)')
+
+        importer = RecipeImporter(user, options['batch_size'])
+        parser = PARSERS[options['format'] or guess_format(options['path'])]
+        try:
+            with open(options['path'], 'rb') as source:
+                importer.run(parser(source), start=start, on_batch=on_batch)
+        except RecipeImportError as error:
+            raise CommandError(
+                f'Error: {error} {error.errors or ""} '
+                f'Rerun to resume after row {error.resume_from}.'
+            )
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Success: {importer.imported} rows imported '
+            f'({importer.rows_per_second:.0f} rows/s)!'))
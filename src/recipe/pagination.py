@@ -0,0 +1,20 @@
+"""Paginação para a rota de receitas da API."""
+
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class RecipeCursorPagination(CursorPagination):
+    """Paginação por cursor (keyset) das receitas, ordenada por -id."""
+    ordering = '-id'
+    page_size = settings.RECIPE_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.RECIPE_MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        """Usa a ordenação do cursor declarada pela view, se houver."""
+        ordering = getattr(view, 'cursor_ordering', None)
+        if ordering:
+            return ordering
+
+        return super().get_ordering(request, queryset, view)
@@ -0,0 +1,129 @@
+"""
+Serializers somente leitura, rápidos, da listagem e do detalhe de receitas.
+
+Montam dicts diretamente das linhas de values() e buscam as Tags e os
+ingredientes de todas as linhas em uma query por relação, sem instanciar
+models nem os fields do ModelSerializer. A saída é idêntica à do
+RecipeSerializer e do RecipeDetailSerializer (recipe/tests/test_readers).
+"""
+
+from django.utils.functional import cached_property
+from rest_framework import serializers
+
+from core.models import Recipe
+from recipe import services
+from recipe.serializers import (
+    RecipeDetailSerializer,
+    RecipeSerializer,
+    media_url_builder,
+    variant_urls,
+)
+
+
+def fetch_relations(recipe_ids, field_names) -> dict:
+    """Retorna {campo: {recipe_id: [{'id', 'name'}, ...]}} ordenado por id."""
+    relations = {}
+    for field_name in field_names:
+        model = services.RELATED_MODELS[field_name]
+        through, source, target = services.get_through(field_name)
+        rows = through.objects.filter(
+            **{f'{source}__in': recipe_ids},
+        ).order_by(target).values_list(
+            source, target, f'{model._meta.model_name}__name')
+
+        by_recipe = relations[field_name] = {}
+        for recipe_id, attr_id, name in rows:
+            by_recipe.setdefault(recipe_id, []).append(
+                {'id': attr_id, 'name': name})
+
+    return relations
+
+
+class RecipeReadListSerializer(serializers.ListSerializer):
+    """Lista das linhas, com as relações buscadas em lote."""
+
+    def to_representation(self, data):
+        rows = list(data)
+        relations = fetch_relations(
+            [row['id'] for row in rows], self.child.relation_fields)
+
+        return [self.child.to_dict(row, relations) for row in rows]
+
+
+class RecipeReadSerializer(serializers.BaseSerializer):
+    """Serializer rápido da listagem de receitas (linhas de values()).
+
+    Com os campos pedidos no contexto (recipe.fieldsets) monta apenas
+    esses campos, e as linhas trazem apenas as colunas correspondentes.
+    """
+
+    class Meta:
+        list_serializer_class = RecipeReadListSerializer
+        fields = RecipeSerializer.Meta.fields
+
+    values_fields = [name for name in Meta.fields
+                     if name not in services.RELATED_MODELS]
+
+    @classmethod
+    def get_values_fields(cls, fields=None) -> list:
+        """Retorna as colunas de values() dos campos pedidos."""
+        if fields is None:
+            return cls.values_fields
+
+        return [name for name in cls.values_fields if name in fields]
+
+    @cached_property
+    def output_fields(self) -> list:
+        """Retorna os campos pedidos, ou todos."""
+        return self.context.get('fields') or self.Meta.fields
+
+    @cached_property
+    def relation_fields(self) -> list:
+        """Retorna as relações pedidas."""
+        return [name for name in self.output_fields
+                if name in services.RELATED_MODELS]
+
+    def to_dict(self, row, relations) -> dict:
+        """Retorna a receita no formato do RecipeSerializer."""
+        recipe_id = row['id']
+        data = {
+            name: relations[name].get(recipe_id, [])
+            if name in relations else row[name]
+            for name in self.output_fields
+        }
+        if 'price' in data:
+            # numeric(5, 2): o str já tem as duas casas decimais.
+            data['price'] = str(data['price'])
+
+        return data
+
+    def to_representation(self, instance):
+        return self.to_dict(
+            instance,
+            fetch_relations([instance['id']], self.relation_fields),
+        )
+
+
+class RecipeDetailReadSerializer(RecipeReadSerializer):
+    """Serializer rápido do detalhe de receitas (linhas de values())."""
+
+    class Meta(RecipeReadSerializer.Meta):
+        fields = RecipeDetailSerializer.Meta.fields
+
+    values_fields = [name for name in Meta.fields
+                     if name not in services.RELATED_MODELS]
+
+    def to_dict(self, row, relations) -> dict:
+        """Retorna a receita no formato do RecipeDetailSerializer."""
+        build_url = media_url_builder(
+            Recipe._meta.get_field('image').storage,
+            self.context.get('request'),
+        )
+        data = super().to_dict(row, relations)
+        if 'image' in data:
+            data['image'] = build_url(row['image']) if row['image'] else None
+        if 'image_variants' in data:
+            data['image_variants'] = variant_urls(
+                row['image_variants'], build_url)
+
+        return data
@@ -1,15 +1,59 @@
 """Serializer para a rota de receitas da API"""
 
+from django.conf import settings
+from django.db import transaction
+from django.utils.functional import cached_property
+from django.utils.translation import gettext as _
 from rest_framework import serializers
 
 from core.models import (
+    IMAGE_STATUS_NONE,
+    IMAGE_STATUS_PENDING,
+    ImageUpload,
     Recipe,
     Tag,
     Ingredient
 )
+from recipe import images, services, uploads
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class BaseRecipeAttrSerializer(serializers.ModelSerializer):
+    """Serializer base para os atributos da receita."""
+
+    @cached_property
+    def fields(self):
+        """Campos do serializer, limitados aos pedidos na rota do atributo.
+
+        Aninhado em uma receita (root diferente) mantém todos os campos.
+        """
+        fields = super().fields
+        names = self.context.get('fields')
+        if names is not None and self.root in (self, self.parent):
+            for name in set(fields) - set(names):
+                fields.pop(name)
+
+        return fields
+
+    def validate_name(self, value):
+        """Valida o nome único por usuário na rota do atributo."""
+        if self.parent is not None:
+            return value
+
+        queryset = self.Meta.model.objects.filter(
+            user=self.context['request'].user,
+            name=value,
+        )
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+
+        if queryset.exists():
+            raise serializers.ValidationError(
+                _('Já existe um item com este nome.'))
+
+        return value
+
+
+class IngredientSerializer(BaseRecipeAttrSerializer):
     """Serializer para a rota de Ingredient."""
     class Meta:
         model = Ingredient
@@ -17,7 +61,7 @@ class IngredientSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(BaseRecipeAttrSerializer):
     """Serializer para a rota de Tag."""
     class Meta:
         model = Tag
@@ -36,64 +80,187 @@ class RecipeSerializer(serializers.ModelSerializer):
                   'price', 'link', 'tags', 'ingredients']
         read_only_fields = ['id']
 
-    def _get_or_create_tags(self, tags, recipe) -> None:
-        """Handler para fazer o Get ou Create das Tags."""
+    def _get_or_create_attrs(self, model, items) -> list:
+        """Handler para fazer o Get ou Create dos atributos em lote."""
         _auth_user = self.context['request'].user
-        for tag in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user=_auth_user,
-                **tag
-            )
-            recipe.tags.add(tag_obj)
-
-    def _get_or_create_ingredients(self, ingredients, recipe) -> None:
-        """Handler para fazer o Get ou Create das Recipes."""
-        _auth_user = self.context['request'].user
-        for ingredient in ingredients:
-            ingredient_obj, created = Ingredient.objects.get_or_create(
-                user=_auth_user, **ingredient)
-            recipe.ingredients.add(ingredient_obj)
+        attr_ids = services.upsert_names(
+            model, _auth_user, [item['name'] for item in items])
+
+        return list(attr_ids.values())
 
+    @transaction.atomic
     def create(self, validated_data):
         """Cria uma receita."""
         tags = validated_data.pop('tags', [])
         ingredients = validated_data.pop('ingredients', [])
         recipe = Recipe.objects.create(**validated_data)
-        self._get_or_create_tags(tags, recipe)
-        self._get_or_create_ingredients(ingredients, recipe)
+        services.add_relations('tags', [
+            (recipe.id, tag_id)
+            for tag_id in self._get_or_create_attrs(Tag, tags)
+        ])
+        services.add_relations('ingredients', [
+            (recipe.id, ingredient_id)
+            for ingredient_id in self._get_or_create_attrs(
+                Ingredient, ingredients)
+        ])
 
         return recipe
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         """Atualizada uma receita."""
         tags = validated_data.pop('tags', None)
         ingredients = validated_data.pop('ingredients', None)
         if tags is not None:
-            instance.tags.clear()
-            self._get_or_create_tags(tags, instance)
+            services.set_relations('tags', {
+                instance.id: self._get_or_create_attrs(Tag, tags),
+            })
         if ingredients is not None:
-            instance.ingredients.clear()
-            self._get_or_create_ingredients(ingredients, instance)
+            services.set_relations('ingredients', {
+                instance.id: self._get_or_create_attrs(
+                    Ingredient, ingredients),
+            })
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
 
-        instance.save()
+        # Só as colunas enviadas: o job das variantes grava image_status e
+        # image_variants em paralelo, e o save completo as sobrescreveria.
+        instance.save(update_fields=[*validated_data, 'updated_at'])
         return instance
 
 
+def media_url_builder(storage, request):
+    """Retorna a função nome -> URL (absoluta, com o request) do arquivo."""
+    if request is None:
+        return storage.url
+
+    return lambda name: request.build_absolute_uri(storage.url(name))
+
+
+def variant_urls(variants, build_url) -> dict:
+    """Retorna as URLs das variantes da imagem por nome e formato."""
+    return {
+        variant: {ext: build_url(name) for ext, name in formats.items()}
+        for variant, formats in variants.items()
+    }
+
+
+class ImageVariantsField(serializers.ReadOnlyField):
+    """URLs das variantes da imagem por nome e formato."""
+
+    def to_representation(self, value):
+        build_url = media_url_builder(
+            Recipe._meta.get_field('image').storage,
+            self.context.get('request'),
+        )
+
+        return variant_urls(value, build_url)
+
+
 class RecipeDetailSerializer(RecipeSerializer):
     """Serializer para o detalhamento das receitas."""
+    image_variants = ImageVariantsField()
 
     class Meta(RecipeSerializer.Meta):
-        fields = RecipeSerializer.Meta.fields + ['description', 'image']
+        fields = RecipeSerializer.Meta.fields + [
+            'description', 'image', 'image_status', 'image_variants']
+        read_only_fields = RecipeSerializer.Meta.read_only_fields + [
+            'image_status']
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        """Atualiza a receita e agenda as variantes da nova imagem."""
+        if 'image' not in validated_data:
+            return super().update(instance, validated_data)
+
+        # As variantes da imagem anterior deixam de valer, como no
+        # upload-image.
+        validated_data['image_status'] = (
+            IMAGE_STATUS_PENDING if validated_data['image']
+            else IMAGE_STATUS_NONE)
+        validated_data['image_variants'] = {}
+        recipe = super().update(instance, validated_data)
+        if recipe.image:
+            images.schedule_variants(recipe)
+
+        return recipe
 
 
 class RecipeImageSerializer(serializers.ModelSerializer):
     """Serializer para a rota de upload de imagens. """
+    image_variants = ImageVariantsField()
 
     class Meta:
         model = Recipe
-        fields = ['id', 'image']
-        read_only_fields = ['id']
+        fields = ['id', 'image', 'image_status', 'image_variants']
+        read_only_fields = ['id', 'image_status']
         extra_kwargs = {'image': {'required': 'True'}}
+
+    def validate_image(self, value):
+        """Valida formato e dimensões pelo cabeçalho da imagem."""
+        try:
+            uploads.check_image_header(value)
+        except uploads.UploadError as error:
+            raise serializers.ValidationError(error.detail)
+
+        return value
+
+
+class ImageUploadSerializer(serializers.ModelSerializer):
+    """Serializer para a rota de upload da imagem em partes."""
+    sha256 = serializers.RegexField(
+        r'^[0-9a-f]{64}$', required=False, allow_blank=True)
+
+    class Meta:
+        model = ImageUpload
+        fields = [
+            'id', 'recipe', 'filename', 'size', 'sha256', 'offset',
+            'width', 'height', 'expires_at',
+        ]
+        read_only_fields = [
+            'id', 'offset', 'width', 'height', 'expires_at']
+
+    def validate_recipe(self, value):
+        """Valida a receita do usuário."""
+        if value.user_id != self.context['request'].user.id:
+            raise serializers.ValidationError(_('Receita não encontrada.'))
+
+        return value
+
+    def validate_size(self, value):
+        """Valida o tamanho total dentro do limite."""
+        if not 0 < value <= settings.RECIPE_IMAGE_MAX_SIZE:
+            raise serializers.ValidationError(
+                _('Tamanho deve estar entre 1 e %d bytes.')
+                % settings.RECIPE_IMAGE_MAX_SIZE)
+
+        return value
+
+
+class RecipeBulkOperationSerializer(serializers.Serializer):
+    """Serializer para uma operação da rota de escrita em lote."""
+    op = serializers.ChoiceField(choices=['create', 'update', 'delete'])
+    id = serializers.IntegerField(required=False)
+    data = serializers.DictField(required=False, default=dict)
+
+    def validate(self, attrs):
+        """Valida o ID obrigatório para update e delete."""
+        if attrs['op'] != 'create' and 'id' not in attrs:
+            raise serializers.ValidationError(
+                {'id': _('Campo obrigatório para update e delete.')})
+
+        return attrs
+
+
+class RecipeImportSerializer(serializers.Serializer):
+    """Serializer para a rota de importação de receitas."""
+    file = serializers.FileField()
+    format = serializers.ChoiceField(
+        choices=['csv', 'ndjson'], required=False)
+    start = serializers.IntegerField(min_value=0, default=0)
+
+
+class AttrSearchSerializer(serializers.Serializer):
+    """Serializer para os parâmetros do autocomplete dos atributos."""
+    limit = serializers.IntegerField(min_value=1, required=False)
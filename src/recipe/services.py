@@ -0,0 +1,159 @@
+"""Escritas em lote (set-based) para a rota de receitas da API."""
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.models import Recipe, Tag, Ingredient
+from recipe import cache
+
+RELATED_MODELS = {
+    'tags': Tag,
+    'ingredients': Ingredient,
+}
+
+
+def upsert_names(model, user, names) -> dict:
+    """Cria os nomes inexistentes em lote e retorna o mapa nome -> id."""
+    names = set(names)
+    if not names:
+        return {}
+
+    model.objects.bulk_create(
+        [model(user=user, name=name) for name in names],
+        ignore_conflicts=True,
+    )
+
+    return dict(
+        model.objects.filter(
+            user=user,
+            name__in=names,
+        ).values_list('name', 'id')
+    )
+
+
+def get_through(field_name: str):
+    """Retorna a tabela intermediária e as colunas do campo M2M."""
+    field = Recipe._meta.get_field(field_name)
+
+    return (
+        field.remote_field.through,
+        field.m2m_column_name(),
+        field.m2m_reverse_name(),
+    )
+
+
+def add_relations(field_name: str, relations) -> None:
+    """Insere em um único statement os vínculos (receita, atributo)."""
+    through, source, target = get_through(field_name)
+
+    through.objects.bulk_create(
+        [
+            through(**{source: recipe_id, target: attr_id})
+            for recipe_id, attr_id in relations
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def set_relations(field_name: str, recipe_attr_ids: dict) -> None:
+    """Aplica apenas a diferença entre os vínculos atuais e os desejados.
+
+    Recebe o mapa receita -> IDs desejados e executa no máximo um SELECT,
+    um DELETE e um INSERT, independente do número de receitas.
+    """
+    if not recipe_attr_ids:
+        return
+
+    through, source, target = get_through(field_name)
+    current_ids = {recipe_id: set() for recipe_id in recipe_attr_ids}
+    for recipe_id, attr_id in through.objects.filter(**{
+        f'{source}__in': recipe_attr_ids,
+    }).values_list(source, target):
+        current_ids[recipe_id].add(attr_id)
+
+    removed = Q()
+    added = []
+    for recipe_id, attr_ids in recipe_attr_ids.items():
+        attr_ids = set(attr_ids)
+        removed_ids = current_ids[recipe_id] - attr_ids
+        if removed_ids:
+            removed |= Q(**{source: recipe_id, f'{target}__in': removed_ids})
+        added += [
+            (recipe_id, attr_id)
+            for attr_id in attr_ids - current_ids[recipe_id]
+        ]
+
+    if removed:
+        through.objects.filter(removed).delete()
+
+    add_relations(field_name, added)
+
+
+@transaction.atomic
+def bulk_save_recipes(user, creates, updates, delete_ids) -> list:
+    """Grava em lote as criações, atualizações e deletes de receitas.
+
+    creates é uma lista de validated_data, updates uma lista de pares
+    (receita, validated_data) e delete_ids os IDs a deletar. Retorna as
+    receitas criadas.
+    """
+    attrs = {field_name: set() for field_name in RELATED_MODELS}
+    for data in creates + [data for _, data in updates]:
+        for field_name in RELATED_MODELS:
+            attrs[field_name].update(
+                item['name'] for item in data.get(field_name, []))
+    attr_ids = {
+        field_name: upsert_names(model, user, attrs[field_name])
+        for field_name, model in RELATED_MODELS.items()
+    }
+
+    def resolve(field_name, data):
+        """Retorna os IDs dos atributos informados na operação."""
+        return [attr_ids[field_name][item['name']]
+                for item in data[field_name]]
+
+    created = Recipe.objects.bulk_create([
+        Recipe(user=user, **_recipe_fields(data)) for data in creates
+    ])
+    for field_name in RELATED_MODELS:
+        add_relations(field_name, [
+            (recipe.id, attr_id)
+            for recipe, data in zip(created, creates)
+            if field_name in data
+            for attr_id in resolve(field_name, data)
+        ])
+
+    # bulk_update não aplica o auto_now: o updated_at (ETag) é explícito.
+    updated_fields = {'updated_at'}
+    now = timezone.now()
+    for recipe, data in updates:
+        for attr, value in _recipe_fields(data).items():
+            setattr(recipe, attr, value)
+            updated_fields.add(attr)
+        recipe.updated_at = now
+    if updates:
+        Recipe.objects.bulk_update(
+            [recipe for recipe, _ in updates], updated_fields)
+    for field_name in RELATED_MODELS:
+        set_relations(field_name, {
+            recipe.id: resolve(field_name, data)
+            for recipe, data in updates
+            if field_name in data
+        })
+
+    if delete_ids:
+        Recipe.objects.filter(user=user, id__in=delete_ids).delete()
+
+    # bulk_create e bulk_update não disparam os sinais dos models.
+    cache.invalidate(user.id)
+
+    return created
+
+
+def _recipe_fields(data) -> dict:
+    """Retorna os campos próprios da receita de um validated_data."""
+    return {
+        attr: value for attr, value in data.items()
+        if attr not in RELATED_MODELS and attr != 'image'
+    }
@@ -0,0 +1,82 @@
+"""Sinais que invalidam o cache e os validadores das receitas."""
+
+from collections import Counter
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+)
+from django.utils import timezone
+
+from core.models import ImageBlob, Recipe, RecipeMedia, Tag, Ingredient
+from recipe import cache
+
+M2M_ACTIONS = ('post_add', 'post_remove', 'post_clear')
+
+
+def touch_recipes(**lookup) -> None:
+    """Atualiza o updated_at (ETag) das receitas do filtro informado."""
+    Recipe.objects.filter(**lookup).update(updated_at=timezone.now())
+
+
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Invalida o cache do dono do objeto gravado ou deletado."""
+    cache.invalidate(instance.user_id)
+
+
+def on_relations_changed(sender, instance, action, reverse, model, pk_set,
+                         **kwargs):
+    """Atualiza as receitas e o cache ao alterar Tags ou ingredientes.
+
+    O clear pelo atributo não grava nas receitas: o total de atributos no
+    ETag delas (RecipeViewSet.get_detail_versions) já muda.
+    """
+    if action not in M2M_ACTIONS:
+        return
+
+    if not reverse:
+        touch_recipes(pk=instance.pk)
+    elif pk_set:
+        touch_recipes(pk__in=pk_set)
+    cache.invalidate(instance.user_id)
+
+
+def remember_blobs(sender, instance, **kwargs):
+    """Guarda os arquivos referenciados pela receita carregada."""
+    if instance.pk is None:
+        instance._blob_names = []
+    elif not {'image', 'image_variants'} & instance.get_deferred_fields():
+        instance._blob_names = instance.blob_names()
+
+
+def update_blob_refs(sender, instance, update_fields=None, **kwargs):
+    """Atualiza as referências dos arquivos trocados na receita."""
+    old = getattr(instance, '_blob_names', None)
+    if old is None or (update_fields is not None and not {
+            'image', 'image_variants'} & set(update_fields)):
+        return
+
+    new = instance.blob_names()
+    ImageBlob.objects.acquire((Counter(new) - Counter(old)).elements())
+    ImageBlob.objects.release((Counter(old) - Counter(new)).elements())
+    RecipeMedia.objects.replace(instance.pk, old, new)
+    instance._blob_names = new
+
+
+def release_blobs(sender, instance, **kwargs):
+    """Remove as referências dos arquivos da receita deletada."""
+    ImageBlob.objects.release(instance.blob_names())
+
+
+post_init.connect(remember_blobs, sender=Recipe)
+post_save.connect(update_blob_refs, sender=Recipe)
+post_delete.connect(release_blobs, sender=Recipe)
+
+for model in (Recipe, Tag, Ingredient):
+    post_save.connect(invalidate_user_cache, sender=model)
+    post_delete.connect(invalidate_user_cache, sender=model)
+
+for through in (Recipe.tags.through, Recipe.ingredients.through):
+    m2m_changed.connect(on_relations_changed, sender=through)
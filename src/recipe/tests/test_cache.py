@@ -0,0 +1,123 @@
+"""Testa o cache versionado das listagens."""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core import metrics
+from core.models import (
+    Recipe,
+    Tag,
+)
+from recipe import services
+from recipe.cache import bump_version, get_version
+
+RECIPES_URL = reverse('recipe:recipe-list')
+TAGS_URL = reverse('recipe:tag-list')
+
+
+def create_recipe(user, **params):
+    """Cria e retorna um modelo de receita."""
+    _defaults = {
+        'title': 'Test Receita Titulo',
+        'time_minutes': 22,
+        'price': Decimal('5.25'),
+    }
+    _defaults.update(params)
+
+    return Recipe.objects.create(user=user, **_defaults)
+
+
+class ListCacheTests(TestCase):
+    """Testes do cache das listagens por usuário."""
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+        self.client.force_authenticate(self.user)
+        self.recipe = create_recipe(user=self.user)
+
+    def test_cache_hit(self):
+        """Testa a segunda listagem servida pelo cache, sem queries."""
+        first = self.client.get(RECIPES_URL)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(RECIPES_URL)
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(metrics.snapshot(), {
+            'recipe.list_cache.hit': 1,
+            'recipe.list_cache.miss': 1,
+        })
+
+    def test_normalized_query_params(self):
+        """Testa a mesma chave para parâmetros em outra ordem."""
+        self.client.get(RECIPES_URL, {'page_size': 10, 'tags_mode': 'any'})
+
+        res = self.client.get(f'{RECIPES_URL}?tags_mode=any&page_size=10')
+
+        self.assertEqual(res['X-Cache'], 'HIT')
+
+    def test_write_invalidates(self):
+        """Testa a invalidação ao gravar receitas e Tags."""
+        self.client.get(RECIPES_URL)
+
+        tag = Tag.objects.create(user=self.user, name='Jantar')
+        self.recipe.tags.add(tag)
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res['X-Cache'], 'MISS')
+        self.assertEqual(res.data['results'][0]['tags'][0]['name'], 'Jantar')
+
+        tag.name = 'Almoço'
+        tag.save()
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.data['results'][0]['tags'][0]['name'], 'Almoço')
+
+    def test_bulk_write_invalidates(self):
+        """Testa a invalidação pelas escritas em lote, sem sinais."""
+        self.client.get(TAGS_URL)
+
+        services.bulk_save_recipes(self.user, [{
+            'title': 'Nova', 'time_minutes': 1, 'price': Decimal('1.00'),
+            'tags': [{'name': 'Lote'}],
+        }], [], [])
+        res = self.client.get(TAGS_URL)
+
+        self.assertEqual(res['X-Cache'], 'MISS')
+        self.assertEqual([tag['name'] for tag in res.data], ['Lote'])
+
+    def test_cache_limited_to_user(self):
+        """Testa o cache separado por usuário."""
+        self.client.get(RECIPES_URL)
+        _other_user = get_user_model().objects.create_user(
+            'other@test.com', 'testpass123')
+        self.client.force_authenticate(_other_user)
+
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res['X-Cache'], 'MISS')
+        self.assertEqual(res.data['results'], [])
+
+    def test_version_survives_eviction(self):
+        """Testa a versão recriada maior que a removida do cache."""
+        version = get_version(self.user.id)
+        bump_version(self.user.id)
+        cache.clear()
+
+        self.assertGreater(get_version(self.user.id), version + 1)
@@ -0,0 +1,224 @@
+"""Testa as requisições condicionais (ETag e Last-Modified)."""
+
+import threading
+import time
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    Recipe,
+    Tag,
+)
+from recipe import serializers
+
+RECIPES_URL = reverse('recipe:recipe-list')
+TAGS_URL = reverse('recipe:tag-list')
+
+
+def detail_url(recipe_id):
+    """Cria e retorna uma url de receita detalhada."""
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+def create_recipe(user, **params):
+    """Cria e retorna um modelo de receita."""
+    _defaults = {
+        'title': 'Test Receita Titulo',
+        'time_minutes': 22,
+        'price': Decimal('5.25'),
+    }
+    _defaults.update(params)
+
+    return Recipe.objects.create(user=user, **_defaults)
+
+
+class ConditionalRequestTests(TestCase):
+    """Testes dos validadores das receitas, Tags e ingredientes."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+        self.client.force_authenticate(self.user)
+        self.recipe = create_recipe(user=self.user)
+
+    def test_detail_not_modified(self):
+        """Testa o 304 do detalhe com uma única query e sem corpo."""
+        res = self.client.get(detail_url(self.recipe.id))
+        etag = res['ETag']
+
+        with self.assertNumQueries(1):
+            res = self.client.get(
+                detail_url(self.recipe.id), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res['ETag'], etag)
+        self.assertEqual(res.content, b'')
+
+    def test_detail_if_modified_since(self):
+        """Testa o 304 do detalhe por If-Modified-Since."""
+        res = self.client.get(detail_url(self.recipe.id))
+
+        res = self.client.get(
+            detail_url(self.recipe.id),
+            HTTP_IF_MODIFIED_SINCE=res['Last-Modified'],
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_detail_etag_changes_on_tag_rename(self):
+        """Testa o novo ETag da receita ao renomear a sua Tag."""
+        tag = Tag.objects.create(user=self.user, name='Jantar')
+        self.recipe.tags.add(tag)
+        etag = self.client.get(detail_url(self.recipe.id))['ETag']
+
+        tag.name = 'Almoço'
+        tag.save()
+        res = self.client.get(
+            detail_url(self.recipe.id), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['tags'][0]['name'], 'Almoço')
+
+    def test_tag_change_does_not_write_recipes(self):
+        """Testa o novo ETag ao deletar a Tag, sem gravar na receita."""
+        tag = Tag.objects.create(user=self.user, name='Jantar')
+        self.recipe.tags.add(tag)
+        updated_at = Recipe.objects.get(id=self.recipe.id).updated_at
+        etag = self.client.get(detail_url(self.recipe.id))['ETag']
+
+        tag.name = 'Almoço'
+        tag.save()
+        tag.delete()
+        res = self.client.get(
+            detail_url(self.recipe.id), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['tags'], [])
+        self.assertEqual(
+            Recipe.objects.get(id=self.recipe.id).updated_at, updated_at)
+
+    def test_list_not_modified(self):
+        """Testa o 304 da listagem até uma nova escrita do usuário."""
+        etag = self.client.get(RECIPES_URL)['ETag']
+
+        res = self.client.get(RECIPES_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        create_recipe(user=self.user, title='Nova')
+        res = self.client.get(RECIPES_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+
+    def test_list_etag_depends_on_params(self):
+        """Testa ETags diferentes para parâmetros diferentes."""
+        etag = self.client.get(RECIPES_URL)['ETag']
+
+        res = self.client.get(
+            RECIPES_URL, {'page_size': 1}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_tags_list_not_modified(self):
+        """Testa o 304 da listagem de Tags."""
+        Tag.objects.create(user=self.user, name='Jantar')
+        etag = self.client.get(TAGS_URL)['ETag']
+
+        res = self.client.get(TAGS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_update_if_match(self):
+        """Testa a atualização com If-Match e o novo ETag retornado."""
+        etag = self.client.get(detail_url(self.recipe.id))['ETag']
+
+        res = self.client.patch(
+            detail_url(self.recipe.id), {'title': 'Novo'},
+            HTTP_IF_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+
+        res = self.client.patch(
+            detail_url(self.recipe.id), {'title': 'Perdido'},
+            HTTP_IF_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.title, 'Novo')
+
+    def test_delete_if_match(self):
+        """Testa o delete recusado com If-Match desatualizado."""
+        res = self.client.delete(
+            detail_url(self.recipe.id), HTTP_IF_MATCH='"desatualizado"')
+
+        self.assertEqual(res.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertTrue(Recipe.objects.filter(id=self.recipe.id).exists())
+
+
+class ConcurrentIfMatchTests(TransactionTestCase):
+    """Testes do If-Match com escritas concorrentes."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+        self.recipe = create_recipe(user=self.user)
+
+    def _patch(self, title, etag, results):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        try:
+            results[title] = client.patch(
+                detail_url(self.recipe.id), {'title': title},
+                HTTP_IF_MATCH=etag).status_code
+        finally:
+            connection.close()
+
+    def test_same_etag_one_writer_wins(self):
+        """Testa o 412 do segundo escritor com o mesmo ETag."""
+        client = APIClient()
+        client.force_authenticate(self.user)
+        etag = client.get(detail_url(self.recipe.id))['ETag']
+        in_update = threading.Event()
+        update = serializers.RecipeSerializer.update
+
+        def slow_update(serializer, instance, validated_data):
+            if validated_data['title'] == 'Primeiro':
+                # O segundo escritor chega enquanto o primeiro grava.
+                in_update.set()
+                time.sleep(0.3)
+            return update(serializer, instance, validated_data)
+
+        results = {}
+        with patch.object(serializers.RecipeSerializer, 'update',
+                          slow_update):
+            first = threading.Thread(
+                target=self._patch, args=('Primeiro', etag, results))
+            first.start()
+            in_update.wait(5)
+            self._patch('Segundo', etag, results)
+            first.join()
+
+        self.assertEqual(results['Primeiro'], status.HTTP_200_OK)
+        self.assertEqual(
+            results['Segundo'], status.HTTP_412_PRECONDITION_FAILED)
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.title, 'Primeiro')
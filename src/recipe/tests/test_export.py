@@ -0,0 +1,110 @@
+"""Testa a exportação NDJSON das receitas."""
+
+import gzip
+import json
+import tempfile
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    Recipe,
+    Tag,
+    Ingredient,
+)
+from recipe.export import iter_recipes
+
+EXPORT_URL = reverse('recipe:recipe-export')
+
+
+def create_recipe(user, **params):
+    """Cria e retorna um modelo de receita."""
+    _defaults = {
+        'title': 'Test Receita Titulo',
+        'time_minutes': 22,
+        'price': Decimal('5.25'),
+        'description': 'Test Description',
+    }
+    _defaults.update(params)
+
+    return Recipe.objects.create(user=user, **_defaults)
+
+
+def read_lines(content: bytes) -> list:
+    """Converte o conteúdo NDJSON em uma lista de objetos."""
+    return [json.loads(line) for line in content.decode().splitlines()]
+
+
+class RecipeExportTests(TestCase):
+    """Testes da exportação das receitas."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+        self.client.force_authenticate(self.user)
+        self.recipe = create_recipe(user=self.user, title='Feijoada')
+        self.recipe.tags.add(Tag.objects.create(user=self.user, name='Jantar'))
+        self.recipe.ingredients.add(
+            Ingredient.objects.create(user=self.user, name='Feijão'))
+        create_recipe(user=self.user, title='Arroz')
+
+    def test_auth_required(self):
+        """Testa autenticação requerida na exportação."""
+        res = APIClient().get(EXPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_export_ndjson(self):
+        """Testa a exportação das receitas do usuário em NDJSON."""
+        _other_user = get_user_model().objects.create_user(
+            'other@test.com', 'testpass123')
+        create_recipe(user=_other_user)
+
+        res = self.client.get(EXPORT_URL)
+        lines = read_lines(b''.join(res.streaming_content))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res['Content-Type'], 'application/x-ndjson')
+        self.assertEqual([line['title'] for line in lines],
+                         ['Feijoada', 'Arroz'])
+        self.assertEqual(lines[0]['price'], '5.25')
+        self.assertEqual(lines[0]['tags'], [
+            {'id': self.recipe.tags.get().id, 'name': 'Jantar'}])
+        self.assertEqual(lines[0]['ingredients'][0]['name'], 'Feijão')
+        self.assertEqual(lines[1]['tags'], [])
+
+    def test_export_gzip(self):
+        """Testa a exportação comprimida em gzip."""
+        res = self.client.get(EXPORT_URL, HTTP_ACCEPT_ENCODING='gzip')
+        content = gzip.decompress(b''.join(res.streaming_content))
+
+        self.assertEqual(res['Content-Encoding'], 'gzip')
+        self.assertEqual(len(read_lines(content)), 2)
+
+    def test_export_queries_per_chunk(self):
+        """Testa as relações buscadas por bloco de receitas."""
+        for i in range(4):
+            create_recipe(user=self.user, title=f'Receita {i}')
+
+        with self.assertNumQueries(5):
+            recipes = list(iter_recipes(self.user, chunk_size=3))
+
+        self.assertEqual(len(recipes), 6)
+
+    def test_export_command(self):
+        """Testa o comando de exportação para arquivo."""
+        with tempfile.NamedTemporaryFile(suffix='.ndjson') as output:
+            call_command('export_recipes', 'User@test.com', '-o', output.name)
+            lines = read_lines(output.read())
+
+        self.assertEqual(len(lines), 2)
@@ -0,0 +1,152 @@
+"""Testa os campos esparsos (?fields=) e a expansão (?expand=)."""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Ingredient, Recipe, Tag
+
+RECIPES_URL = reverse('recipe:recipe-list')
+TAGS_URL = reverse('recipe:tag-list')
+
+
+def detail_url(recipe_id):
+    """Cria e retorna uma url de receita detalhada."""
+    return reverse('recipe:recipe-detail', args=[recipe_id])
+
+
+class FieldsetTests(TestCase):
+    """Testes dos campos e relações pedidos nas rotas de leitura."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+        self.client.force_authenticate(self.user)
+        self.recipe = Recipe.objects.create(
+            user=self.user,
+            title='Bolo de cenoura',
+            time_minutes=40,
+            price=Decimal('12.50'),
+            description='Com cobertura de chocolate.',
+        )
+        self.tag = Tag.objects.create(user=self.user, name='Sobremesa')
+        self.recipe.tags.add(self.tag)
+        self.recipe.ingredients.add(
+            Ingredient.objects.create(user=self.user, name='Cenoura'))
+
+    def _get(self, url, **params):
+        """Executa o GET e retorna a resposta e as queries executadas."""
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url, params)
+
+        return res, [query['sql'] for query in queries.captured_queries]
+
+    def test_list_fields(self):
+        """Testa a listagem só com os campos e colunas pedidos."""
+        res, queries = self._get(RECIPES_URL, fields='title')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.json()['results'],
+            [{'id': self.recipe.id, 'title': 'Bolo de cenoura'}],
+        )
+        recipe_sql = [sql for sql in queries if 'FROM "core_recipe"' in sql]
+        self.assertEqual(len(recipe_sql), 1)
+        self.assertNotIn('"price"', recipe_sql[0])
+        self.assertFalse([sql for sql in queries if '_tags' in sql])
+        self.assertFalse([sql for sql in queries if '_ingredients' in sql])
+
+    def test_list_expand(self):
+        """Testa a expansão apenas das relações pedidas."""
+        res, queries = self._get(RECIPES_URL, fields='title', expand='tags')
+
+        self.assertEqual(res.json()['results'], [{
+            'id': self.recipe.id,
+            'title': 'Bolo de cenoura',
+            'tags': [{'id': self.tag.id, 'name': 'Sobremesa'}],
+        }])
+        self.assertFalse([sql for sql in queries if '_ingredients' in sql])
+
+    def test_expand_without_fields(self):
+        """Testa todas as colunas e só as relações pedidas."""
+        res = self.client.get(detail_url(self.recipe.id), {'expand': ''})
+
+        self.assertEqual(list(res.json()), [
+            'id', 'title', 'time_minutes', 'price', 'link', 'description',
+            'image', 'image_status', 'image_variants',
+        ])
+
+    def test_detail_fields_in_serializer_order(self):
+        """Testa o detalhe com os campos na ordem do serializer."""
+        res = self.client.get(
+            detail_url(self.recipe.id),
+            {'fields': 'description,price,ingredients'},
+        )
+
+        self.assertEqual(res.json(), {
+            'id': self.recipe.id,
+            'price': '12.50',
+            'ingredients': [{'id': self.recipe.ingredients.get().id,
+                             'name': 'Cenoura'}],
+            'description': 'Com cobertura de chocolate.',
+        })
+
+    def test_search_and_pagination(self):
+        """Testa os campos esparsos com busca e paginação por cursor."""
+        Recipe.objects.create(
+            user=self.user, title='Bolo de milho', time_minutes=30, price=5)
+
+        res = self.client.get(
+            RECIPES_URL, {'fields': 'title', 'search': 'bolo', 'page_size': 1})
+        next_page = self.client.get(res.json()['next'])
+
+        self.assertEqual(len(res.json()['results']), 1)
+        self.assertEqual(list(next_page.json()['results'][0]), ['id', 'title'])
+
+    def test_invalid_fields(self):
+        """Testa o erro com campos ou relações inexistentes."""
+        res = self.client.get(
+            RECIPES_URL, {'fields': 'title,user', 'expand': 'title'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(res.json()), {'fields', 'expand'})
+
+    def test_detail_etag_per_fieldset(self):
+        """Testa um ETag diferente para cada seleção de campos."""
+        url = detail_url(self.recipe.id)
+        etag = self.client.get(url)['ETag']
+
+        res = self.client.get(
+            url, {'fields': 'title'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+
+    def test_writes_ignore_fields(self):
+        """Testa a resposta completa das escritas."""
+        res = self.client.patch(
+            detail_url(self.recipe.id) + '?fields=title', {'time_minutes': 5})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('tags', res.json())
+
+    def test_tag_fields(self):
+        """Testa os campos pedidos na rota de Tag, com e sem busca."""
+        for params in ({'fields': 'id'}, {'fields': 'id', 'q': 'sobre'}):
+            with self.subTest(params):
+                res, queries = self._get(TAGS_URL, **params)
+
+                self.assertEqual(res.json(), [{'id': self.tag.id}])
+                self.assertNotIn('"updated_at"', queries[-1])
@@ -0,0 +1,227 @@
+"""Testa a geração das variantes das imagens das receitas."""
+
+import io
+import shutil
+import tempfile
+
+from unittest.mock import patch
+from PIL import Image
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    IMAGE_STATUS_FAILED,
+    IMAGE_STATUS_NONE,
+    IMAGE_STATUS_PENDING,
+    IMAGE_STATUS_READY,
+    Recipe,
+)
+from recipe import images, serializers
+
+
+def image_upload_url(recipe_id):
+    """Cria e retorna uma URL de upload para uma imagem."""
+    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+
+
+def image_file(size=(2000, 1000), mode='RGB', image_format='JPEG'):
+    """Cria e retorna um arquivo de imagem em memória."""
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format=image_format)
+    buffer.seek(0)
+    buffer.name = f'image.{image_format.lower()}'
+    return buffer
+
+
+class ImageVariantsTests(TestCase):
+    """Testes para as variantes das imagens."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'password@123'
+        )
+        self.client.force_authenticate(self.user)
+        self.recipe = Recipe.objects.create(
+            user=self.user,
+            title='Receita',
+            time_minutes=10,
+            price=5,
+        )
+
+    def _upload(self, file):
+        return self.client.post(
+            image_upload_url(self.recipe.id),
+            {'image': file},
+            format='multipart',
+        )
+
+    @override_settings(RECIPE_IMAGE_VARIANTS_SYNC=True)
+    def test_upload_generates_variants(self):
+        """Testa a geração das variantes no upload."""
+        res = self._upload(image_file())
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['image_status'], IMAGE_STATUS_READY)
+        self.recipe.refresh_from_db()
+        storage = self.recipe.image.storage
+        for variant, (size, crop) in images.VARIANTS.items():
+            for ext in images.FORMATS:
+                name = self.recipe.image_variants[variant][ext]
+                with storage.open(name) as file:
+                    width, height = Image.open(file).size
+                if crop:
+                    self.assertEqual((width, height), size)
+                else:
+                    self.assertLessEqual(max(width, height), max(size))
+                self.assertTrue(
+                    res.data['image_variants'][variant][ext].startswith(
+                        'http://testserver/'))
+
+    @override_settings(RECIPE_IMAGE_VARIANTS_SYNC=True)
+    def test_small_image_not_upscaled(self):
+        """Testa que imagens pequenas não são ampliadas."""
+        self._upload(image_file(size=(100, 80), mode='RGBA',
+                                image_format='PNG'))
+
+        self.recipe.refresh_from_db()
+        name = self.recipe.image_variants['full']['jpeg']
+        with self.recipe.image.storage.open(name) as file:
+            self.assertEqual(Image.open(file).size, (100, 80))
+
+    def test_upload_schedules_after_commit(self):
+        """Testa o status pending até o commit do upload."""
+        with patch.object(images, '_get_executor') as get_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                res = self._upload(image_file())
+
+        self.assertEqual(res.data['image_status'], IMAGE_STATUS_PENDING)
+        self.assertEqual(res.data['image_variants'], {})
+        get_executor.return_value.submit.assert_called_once()
+
+    @override_settings(RECIPE_IMAGE_VARIANTS_SYNC=True)
+    def test_failed_variants(self):
+        """Testa o status failed quando a geração falha."""
+        with patch.object(images, 'render_variants', side_effect=OSError):
+            res = self._upload(image_file())
+
+        self.assertEqual(res.data['image_status'], IMAGE_STATUS_FAILED)
+        self.assertEqual(res.data['image_variants'], {})
+
+    def test_stale_job_ignored(self):
+        """Testa que o job de uma imagem substituída não altera a receita."""
+        self.recipe.image.save('new.jpg', ContentFile(b''))
+        images.generate_variants(self.recipe.id, 'old.jpg')
+
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.image_status, IMAGE_STATUS_NONE)
+
+    def test_update_keeps_variants_generated_meanwhile(self):
+        """Testa que a edição não sobrescreve o resultado do job."""
+        with patch.object(images, '_get_executor') as get_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                self._upload(image_file())
+        _run_job, job = get_executor.return_value.submit.call_args[0]
+        update = serializers.RecipeSerializer.update
+
+        def update_after_job(serializer, instance, validated_data):
+            # O job termina entre a leitura da receita e o save.
+            job()
+            return update(serializer, instance, validated_data)
+
+        with patch.object(serializers.RecipeSerializer, 'update',
+                          update_after_job):
+            res = self.client.patch(
+                reverse('recipe:recipe-detail', args=[self.recipe.id]),
+                {'title': 'Nova receita'},
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.title, 'Nova receita')
+        self.assertEqual(self.recipe.image_status, IMAGE_STATUS_READY)
+        self.assertEqual(set(self.recipe.image_variants), set(images.VARIANTS))
+
+    def _patch_image(self, file):
+        return self.client.patch(
+            reverse('recipe:recipe-detail', args=[self.recipe.id]),
+            {'image': file},
+            format='multipart',
+        )
+
+    @override_settings(RECIPE_IMAGE_VARIANTS_SYNC=True)
+    def test_patch_image_generates_variants(self):
+        """Testa as variantes da nova imagem enviada pelo PATCH."""
+        self._upload(image_file())
+        self.recipe.refresh_from_db()
+        old_variants = self.recipe.image_variants
+
+        res = self._patch_image(image_file(size=(300, 200)))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['image_status'], IMAGE_STATUS_READY)
+        self.recipe.refresh_from_db()
+        self.assertNotEqual(
+            self.recipe.image_variants['thumb'], old_variants['thumb'])
+        name = self.recipe.image_variants['full']['jpeg']
+        with self.recipe.image.storage.open(name) as file:
+            self.assertEqual(Image.open(file).size, (300, 200))
+
+    def test_patch_image_resets_variants(self):
+        """Testa o status pending sem as variantes da imagem anterior."""
+        self.recipe.image_status = IMAGE_STATUS_READY
+        self.recipe.image_variants = {'thumb': {'jpeg': 'antiga.jpeg'}}
+        self.recipe.save()
+
+        with patch.object(images, '_get_executor') as get_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                res = self._patch_image(image_file())
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['image_status'], IMAGE_STATUS_PENDING)
+        self.assertEqual(res.data['image_variants'], {})
+        get_executor.return_value.submit.assert_called_once()
+
+    def test_command_generates_missing_variants(self):
+        """Testa o comando de geração das variantes existentes."""
+        self.recipe.image.save('image.jpg', ContentFile(
+            image_file().getvalue()))
+
+        call_command('generate_image_variants', stdout=io.StringIO())
+
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.image_status, IMAGE_STATUS_READY)
+        self.assertEqual(set(self.recipe.image_variants), set(images.VARIANTS))
+
+    def test_command_skips_recipes_without_image(self):
+        """Testa que o comando ignora receitas com a imagem nula."""
+        # Receitas anteriores à migration 0006 têm a imagem nula.
+        Recipe.objects.filter(id=self.recipe.id).update(image=None)
+        stdout = io.StringIO()
+
+        call_command('generate_image_variants', '--all', stdout=stdout)
+
+        self.assertIn('0 image(s)', stdout.getvalue())
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.image_status, IMAGE_STATUS_NONE)
+
+    def test_generate_variants_without_name(self):
+        """Testa que o job sem imagem não altera a receita."""
+        images.generate_variants(self.recipe.id, None)
+
+        self.recipe.refresh_from_db()
+        self.assertEqual(self.recipe.image_status, IMAGE_STATUS_NONE)
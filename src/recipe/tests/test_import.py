@@ -0,0 +1,190 @@
+"""Testa a importação em lote das receitas."""
+
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    Recipe,
+    Tag,
+    Ingredient,
+)
+from recipe.importer import (
+    RecipeImporter,
+    RecipeImportError,
+    parse_csv,
+    parse_ndjson,
+)
+
+IMPORT_URL = reverse('recipe:recipe-import-file')
+
+CSV_CONTENT = (
+    'title,time_minutes,price,tags,ingredients\n'
+    'Feijoada,90,30.00,Brasileira|Jantar,Feijão|Sal\n'
+    'Arroz,20,5.00,Brasileira,Sal\n'
+    'Temaki,15,14.50,Japonesa,\n'
+)
+
+
+def ndjson_rows(count, invalid_at=None):
+    """Cria e retorna linhas NDJSON de receitas."""
+    rows = []
+    for i in range(count):
+        row = {'title': f'Receita {i}', 'time_minutes': 10,
+               'price': '5.00', 'tags': [{'name': f'Tag {i % 3}'}]}
+        if i == invalid_at:
+            row.pop('price')
+        rows.append(json.dumps(row))
+
+    return ('\n'.join(rows) + '\n').encode()
+
+
+class RecipeImporterTests(TestCase):
+    """Testes do pipeline de importação."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+
+    def test_import_csv_deduplicates_names(self):
+        """Testa a importação CSV reaproveitando Tags existentes."""
+        _tag = Tag.objects.create(user=self.user, name='Brasileira')
+        rows = parse_csv(io.BytesIO(CSV_CONTENT.encode()))
+
+        imported = RecipeImporter(self.user, batch_size=2).run(rows)
+
+        self.assertEqual(imported, 3)
+        self.assertEqual(Tag.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(
+            Ingredient.objects.filter(user=self.user).count(), 2)
+        feijoada = Recipe.objects.get(title='Feijoada')
+        self.assertIn(_tag, feijoada.tags.all())
+        self.assertEqual(feijoada.ingredients.count(), 2)
+        self.assertEqual(
+            Recipe.objects.get(title='Temaki').ingredients.count(), 0)
+
+    def test_failed_batch_reports_resume_row(self):
+        """Testa a falha de um lote mantendo os lotes anteriores."""
+        rows = parse_ndjson(io.BytesIO(ndjson_rows(5, invalid_at=3)))
+
+        with self.assertRaises(RecipeImportError) as ctx:
+            RecipeImporter(self.user, batch_size=2).run(rows)
+
+        self.assertEqual(ctx.exception.row, 4)
+        self.assertEqual(ctx.exception.resume_from, 2)
+        self.assertIn('price', ctx.exception.errors)
+        self.assertEqual(Recipe.objects.filter(user=self.user).count(), 2)
+
+    def test_ndjson_row_not_object(self):
+        """Testa o erro da linha NDJSON que não é um objeto."""
+        for line in (b'[1]', b'"x"', b'3'):
+            with self.subTest(line):
+                rows = parse_ndjson(io.BytesIO(ndjson_rows(2) + line))
+
+                with self.assertRaises(RecipeImportError) as ctx:
+                    RecipeImporter(self.user, batch_size=2).run(rows)
+
+                self.assertEqual(ctx.exception.row, 3)
+                self.assertEqual(ctx.exception.resume_from, 2)
+
+
+class RecipeImportAPITests(TestCase):
+    """Testes da rota de importação de receitas."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_auth_required(self):
+        """Testa autenticação requerida na importação."""
+        res = APIClient().post(IMPORT_URL, {})
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_import_csv_upload(self):
+        """Testa o upload de um arquivo CSV."""
+        upload = SimpleUploadedFile('receitas.csv', CSV_CONTENT.encode())
+
+        res = self.client.post(IMPORT_URL, {'file': upload},
+                               format='multipart')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['imported'], 3)
+        self.assertIn('rows_per_second', res.data)
+        self.assertEqual(Recipe.objects.filter(user=self.user).count(), 3)
+
+    def test_import_resume_from_start(self):
+        """Testa a retomada da importação a partir de uma linha."""
+        upload = SimpleUploadedFile('receitas.ndjson', ndjson_rows(5))
+
+        res = self.client.post(IMPORT_URL, {'file': upload, 'start': 3},
+                               format='multipart')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['imported'], 2)
+        self.assertEqual(res.data['next_row'], 5)
+        self.assertEqual(
+            sorted(Recipe.objects.values_list('title', flat=True)),
+            ['Receita 3', 'Receita 4'],
+        )
+
+    def test_import_invalid_row(self):
+        """Testa a importação com linha inválida."""
+        upload = SimpleUploadedFile(
+            'receitas.ndjson', ndjson_rows(3, invalid_at=1))
+
+        res = self.client.post(IMPORT_URL, {'file': upload},
+                               format='multipart')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data['row'], 2)
+        self.assertEqual(res.data['resume_from'], 0)
+
+
+class ImportCommandTests(TestCase):
+    """Testes do comando import_recipes."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'testpass123',
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'receitas.ndjson')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_command_resumes_from_checkpoint(self):
+        """Testa a retomada do comando pelo checkpoint após falha."""
+        with open(self.path, 'wb') as source:
+            source.write(ndjson_rows(5, invalid_at=3))
+
+        with self.assertRaises(CommandError):
+            call_command('import_recipes', 'user@test.com', self.path,
+                         '--batch-size', '2', stdout=io.StringIO())
+
+        with open(self.path, 'wb') as source:
+            source.write(ndjson_rows(5))
+        call_command('import_recipes', 'user@test.com', self.path,
+                     '--batch-size', '2', stdout=io.StringIO())
+
+        self.assertEqual(Recipe.objects.filter(user=self.user).count(), 5)
+        self.assertFalse(os.path.exists(f'{self.path}.checkpoint'))
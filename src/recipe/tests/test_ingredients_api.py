@@ -148,3 +148,77 @@ class PrivateIngredientsApiTests(TestCase):
         res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
 
         self.assertEqual(len(res.data), 1)
+
+
+class IngredientAutocompleteTests(TestCase):
+    """Testes do autocomplete de ingredientes."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_authenticate(self.user)
+        for name in ('Tomate', 'Tomate cereja', 'Tomilho', 'Batata',
+                     'Extrato de tomate'):
+            create_ingredient(user=self.user, name=name)
+
+    def _names(self, res):
+        """Retorna os nomes dos ingredientes da resposta."""
+        return [ingredient['name'] for ingredient in res.data]
+
+    def test_autocomplete_prefix_first(self):
+        """Testa o autocomplete com prefixos antes dos similares."""
+        res = self.client.get(INGREDIENTS_URL, {'q': 'tomat'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._names(res)[:2], ['Tomate', 'Tomate cereja'])
+        self.assertNotIn('Batata', self._names(res))
+
+    def test_autocomplete_fuzzy(self):
+        """Testa o autocomplete tolerante a erros de digitação."""
+        res = self.client.get(INGREDIENTS_URL, {'q': 'tomatte'})
+
+        self.assertEqual(self._names(res)[0], 'Tomate')
+
+    def test_autocomplete_limit(self):
+        """Testa o limite de itens do autocomplete."""
+        res = self.client.get(INGREDIENTS_URL, {'q': 'tom', 'limit': 1})
+
+        self.assertEqual(self._names(res), ['Tomate'])
+
+    def test_autocomplete_limit_includes_similar(self):
+        """Testa o limite total com prefixos e similares na resposta."""
+        for name in ('Tomatada', 'Tomatão'):
+            create_ingredient(user=self.user, name=name)
+
+        res = self.client.get(INGREDIENTS_URL, {'q': 'tomate c', 'limit': 2})
+
+        self.assertEqual(
+            self._names(res), ['Tomate cereja', 'Tomate'])
+
+    def test_autocomplete_invalid_limit(self):
+        """Testa o erro 400 com limite inválido no autocomplete."""
+        for limit in ('abc', '0', '-5'):
+            with self.subTest(limit=limit):
+                res = self.client.get(
+                    INGREDIENTS_URL, {'q': 'tom', 'limit': limit})
+
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('limit', res.data)
+
+    def test_autocomplete_limited_to_user(self):
+        """Testa o autocomplete limitado ao usuário."""
+        create_ingredient(
+            user=create_user(email='user2@test.com'), name='Tomatinho')
+
+        res = self.client.get(INGREDIENTS_URL, {'q': 'tomatinho'})
+
+        self.assertNotIn('Tomatinho', self._names(res))
+
+    def test_autocomplete_escapes_regex(self):
+        """Testa o autocomplete com caracteres especiais de regex."""
+        create_ingredient(user=self.user, name='Tomate (pelado)')
+
+        res = self.client.get(INGREDIENTS_URL, {'q': 'tomate (p'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._names(res)[0], 'Tomate (pelado)')
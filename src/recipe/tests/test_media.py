@@ -0,0 +1,125 @@
+"""Testa a rota autenticada das imagens das receitas."""
+
+import io
+import shutil
+import tempfile
+
+from PIL import Image
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Recipe
+
+
+def image_content():
+    """Cria e retorna o conteúdo de uma imagem JPEG."""
+    buffer = io.BytesIO()
+    Image.new('RGB', (10, 10)).save(buffer, 'JPEG')
+    return ContentFile(buffer.getvalue())
+
+
+class RecipeMediaTests(TestCase):
+    """Testes para a rota de mídia das receitas."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'password@123'
+        )
+        self.client.force_authenticate(self.user)
+        self.recipe = Recipe.objects.create(
+            user=self.user,
+            title='Receita',
+            time_minutes=10,
+            price=5,
+        )
+        self.recipe.image.save('image.jpg', image_content())
+        self.url = self.recipe.image.url
+
+    def test_media_url(self):
+        """Testa a URL da imagem pela rota autenticada."""
+        self.assertEqual(
+            self.url,
+            reverse('recipe:media', args=[self.recipe.image.name]),
+        )
+
+    def test_serves_file_with_immutable_cache(self):
+        """Testa o arquivo e os cabeçalhos de cache imutável."""
+        res = self.client.get(self.url, HTTP_ACCEPT='image/webp')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            b''.join(res.streaming_content),
+            self.recipe.image.read(),
+        )
+        self.assertIn('immutable', res['Cache-Control'])
+        self.assertIn('private', res['Cache-Control'])
+
+    @override_settings(MEDIA_ACCEL_REDIRECT=True)
+    def test_accel_redirect(self):
+        """Testa a delegação da transferência ao nginx."""
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res['X-Accel-Redirect'],
+            f'/protected-media/{self.recipe.image.name}',
+        )
+        self.assertEqual(res['Content-Type'], 'image/jpeg')
+        self.assertEqual(res.content, b'')
+
+    def test_not_modified(self):
+        """Testa a resposta 304 com o ETag do conteúdo."""
+        etag = self.client.get(self.url)['ETag']
+
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_other_user_not_found(self):
+        """Testa que a imagem de outro usuário não é servida."""
+        other = get_user_model().objects.create_user(
+            'other@test.com', 'password@123')
+        self.client.force_authenticate(other)
+
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_auth_required(self):
+        """Testa que a rota exige autenticação."""
+        res = APIClient().get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_serves_variant(self):
+        """Testa o acesso às variantes da receita."""
+        name = Recipe._meta.get_field('image').storage.save(
+            'uploads/recipe/thumb.jpg', ContentFile(b'thumb'))
+        self.recipe.image_variants = {'thumb': {'jpeg': name}}
+        self.recipe.save()
+
+        res = self.client.get(reverse('recipe:media', args=[name]))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_replaced_image_not_found(self):
+        """Testa o 404 da imagem substituída na receita."""
+        self.recipe.image.save('new.jpg', ContentFile(b'new'))
+
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
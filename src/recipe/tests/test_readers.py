@@ -0,0 +1,136 @@
+"""Testa a paridade dos serializers rápidos com os ModelSerializers."""
+
+import io
+import json
+import shutil
+import tempfile
+
+from decimal import Decimal
+from PIL import Image
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.db.models import Prefetch
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+
+from core.models import Ingredient, Recipe, Tag
+from recipe import readers
+from recipe.serializers import RecipeDetailSerializer, RecipeSerializer
+
+RECIPES_URL = reverse('recipe:recipe-list')
+
+
+def render(data) -> bytes:
+    """Renderiza como na resposta JSON da API."""
+    return JSONRenderer().render(data)
+
+
+class ReadSerializerParityTests(TestCase):
+    """Testes de paridade da saída JSON das listagens e detalhes."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'password@123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.request = APIRequestFactory().get('/')
+
+        tags = [Tag.objects.create(user=self.user, name=f'Tag {i}')
+                for i in range(3)]
+        sal = Ingredient.objects.create(user=self.user, name='Sal')
+        self.recipes = [
+            Recipe.objects.create(
+                user=self.user,
+                title='Bolo de cenoura',
+                time_minutes=40,
+                price=Decimal('12.50'),
+                link='https://example.com/bolo',
+                description='Com cobertura de chocolate.',
+            ),
+            Recipe.objects.create(
+                user=self.user,
+                title='Água',
+                time_minutes=0,
+                price=Decimal('0'),
+            ),
+        ]
+        # Adicionadas fora de ordem: a saída é ordenada por id.
+        self.recipes[0].tags.add(tags[2], tags[0])
+        self.recipes[0].ingredients.add(sal)
+
+        buffer = io.BytesIO()
+        Image.new('RGB', (10, 10)).save(buffer, 'JPEG')
+        image = self.recipes[0].image
+        image.save('image.jpg', ContentFile(buffer.getvalue()))
+        Recipe.objects.filter(pk=self.recipes[0].pk).update(
+            image_status='ready',
+            image_variants={'thumb': {'jpeg': image.name}},
+        )
+
+    def _instances(self):
+        return Recipe.objects.filter(user=self.user).prefetch_related(
+            Prefetch('tags', queryset=Tag.objects.order_by('id')),
+            Prefetch(
+                'ingredients', queryset=Ingredient.objects.order_by('id')),
+        ).order_by('-id')
+
+    def _rows(self, serializer_class):
+        return Recipe.objects.filter(user=self.user).order_by('-id').values(
+            *serializer_class.values_fields)
+
+    def test_list_parity(self):
+        """Testa a saída idêntica da listagem."""
+        context = {'request': self.request}
+        expected = RecipeSerializer(
+            self._instances(), many=True, context=context).data
+        fast = readers.RecipeReadSerializer(
+            self._rows(readers.RecipeReadSerializer),
+            many=True,
+            context=context,
+        ).data
+
+        self.assertEqual(render(fast), render(expected))
+
+    def test_detail_parity(self):
+        """Testa a saída idêntica do detalhe, com imagem e variantes."""
+        context = {'request': self.request}
+        for recipe, row in zip(
+                self._instances(),
+                self._rows(readers.RecipeDetailReadSerializer)):
+            with self.subTest(recipe.title):
+                expected = RecipeDetailSerializer(
+                    recipe, context=context).data
+                fast = readers.RecipeDetailReadSerializer(
+                    row, context=context).data
+
+                self.assertEqual(render(fast), render(expected))
+
+    def test_api_uses_fast_serializers(self):
+        """Testa as respostas da API iguais às dos ModelSerializers."""
+        res = self.client.get(RECIPES_URL, {'search': 'bolo'})
+        results = json.loads(res.content)['results']
+        expected = RecipeSerializer(
+            self._instances().filter(pk=self.recipes[0].pk),
+            many=True,
+            context={'request': res.wsgi_request},
+        ).data
+        self.assertEqual(render(results), render(expected))
+
+        recipe = self._instances().get(pk=self.recipes[0].pk)
+        res = self.client.get(
+            reverse('recipe:recipe-detail', args=[recipe.id]))
+        expected = RecipeDetailSerializer(
+            recipe, context={'request': res.wsgi_request}).data
+        self.assertEqual(res.content, render(expected))
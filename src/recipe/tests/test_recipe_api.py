@@ -3,10 +3,13 @@
 import tempfile
 
 from decimal import Decimal
+from unittest.mock import patch
 from PIL import Image
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework import status
@@ -18,9 +21,16 @@ from core.models import (
     Ingredient,
 )
 
-from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+from core.query_budget import query_budget
+from recipe.pagination import RecipeCursorPagination
+from recipe.serializers import (
+    RecipeBulkOperationSerializer,
+    RecipeDetailSerializer,
+    RecipeSerializer,
+)
 
 RECIPES_URL = reverse('recipe:recipe-list')
+BULK_URL = reverse('recipe:recipe-bulk')
 
 
 def detail_url(recipe_id):
@@ -87,7 +97,7 @@ class PrivateRecipeAPITests(TestCase):
         recipes = Recipe.objects.all().order_by('-id')
         serializer = RecipeSerializer(recipes, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data['results'], serializer.data)
 
     def test_recipe_list_limited_to_user(self):
         """Teste retorna uma lista de receitas limitada pelo usuário."""
@@ -103,7 +113,7 @@ class PrivateRecipeAPITests(TestCase):
         recipes = Recipe.objects.filter(user=self.user)
         serializer = RecipeSerializer(recipes, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data['results'], serializer.data)
 
     def test_get_recipe_detail(self):
         """Testa retorna os detalhes da receita."""
@@ -115,6 +125,36 @@ class PrivateRecipeAPITests(TestCase):
         serializer = RecipeDetailSerializer(_recipe)
         self.assertEqual(res.data, serializer.data)
 
+    def test_list_recipes_query_budget(self):
+        """Testa o número fixo de queries na listagem de receitas."""
+        for i in range(5):
+            _recipe = create_recipe(user=self.user, title=f'Receita {i}')
+            _recipe.tags.add(
+                Tag.objects.create(user=self.user, name=f'Tag {i}'))
+            _recipe.ingredients.add(
+                Ingredient.objects.create(user=self.user, name=f'Sal {i}'))
+
+        with query_budget(3):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['results']), 5)
+
+    def test_get_recipe_detail_query_budget(self):
+        """Testa o número fixo de queries no detalhe da receita."""
+        _recipe = create_recipe(user=self.user)
+        _recipe.tags.add(Tag.objects.create(user=self.user, name='Jantar'))
+        _recipe.ingredients.add(
+            Ingredient.objects.create(user=self.user, name='Sal'))
+
+        # A receita, as duas relações e o updated_at do ETag.
+        with query_budget(4):
+            res = self.client.get(detail_url(_recipe.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['tags']), 1)
+        self.assertEqual(len(res.data['ingredients']), 1)
+
     def test_create_recipe(self):
         """Testa a criação de uma receita."""
         payload = {
@@ -270,6 +310,43 @@ class PrivateRecipeAPITests(TestCase):
             ).exists()
             self.assertTrue(exists)
 
+    def test_create_recipe_with_duplicated_tags(self):
+        """Testa a criação de receita com Tags repetidas no payload."""
+        _payload = {
+            'title': 'Feijoada',
+            'time_minutes': 90,
+            'price': Decimal('30.00'),
+            'tags': [{'name': 'Brasileira'}, {'name': 'Brasileira'}],
+        }
+
+        res = self.client.post(RECIPES_URL, _payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Tag.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(len(res.data['tags']), 1)
+
+    def test_create_recipe_queries_independent_of_size(self):
+        """Testa a criação de receita com queries independentes do
+        número de Tags e ingredientes."""
+        def create(size):
+            _payload = {
+                'title': f'Receita {size}',
+                'time_minutes': 10,
+                'price': Decimal('5.00'),
+                'tags': [{'name': f'Tag {i}'} for i in range(size)],
+                'ingredients': [
+                    {'name': f'Ingrediente {i}'} for i in range(size)
+                ],
+            }
+            with CaptureQueriesContext(connection) as captured:
+                res = self.client.post(RECIPES_URL, _payload, format='json')
+
+            self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+            return len(captured)
+
+        self.assertEqual(create(2), create(30))
+        self.assertEqual(Ingredient.objects.filter(user=self.user).count(), 30)
+
     def test_create_tag_on_update(self):
         """Testa a criação de Tag durante Update na receita."""
         _recipe = create_recipe(user=self.user)
@@ -298,6 +375,31 @@ class PrivateRecipeAPITests(TestCase):
         self.assertIn(_tag_lunch, _recipe.tags.all())
         self.assertNotIn(_tag_brekfast, _recipe.tags.all())
 
+    def test_update_recipe_tags_keeps_unchanged_rows(self):
+        """Testa o Update das Tags reescrevendo apenas a diferença."""
+        _recipe = create_recipe(user=self.user)
+        for name in ('Almoço', 'Jantar', 'Lanche'):
+            _recipe.tags.add(Tag.objects.create(user=self.user, name=name))
+        through = Recipe.tags.through
+        kept_ids = set(through.objects.filter(
+            recipe=_recipe,
+            tag__name__in=['Almoço', 'Jantar'],
+        ).values_list('id', flat=True))
+
+        _payload = {'tags': [
+            {'name': 'Almoço'}, {'name': 'Jantar'}, {'name': 'Ceia'}]}
+        url = detail_url(_recipe.id)
+        res = self.client.patch(url, _payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        rows = through.objects.filter(recipe=_recipe)
+        self.assertEqual(rows.count(), 3)
+        self.assertTrue(kept_ids <= set(rows.values_list('id', flat=True)))
+        self.assertEqual(
+            set(rows.values_list('tag__name', flat=True)),
+            {'Almoço', 'Jantar', 'Ceia'},
+        )
+
     def test_clear_recipe_tags(self):
         """Testa a remoção de todas as tags de uma receita."""
         _tag = Tag.objects.create(user=self.user, name='Brasileira')
@@ -426,9 +528,9 @@ class PrivateRecipeAPITests(TestCase):
         s2 = RecipeSerializer(r2)
         s3 = RecipeSerializer(r3)
 
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+        self.assertIn(s1.data, res.data['results'])
+        self.assertIn(s2.data, res.data['results'])
+        self.assertNotIn(s3.data, res.data['results'])
 
     def test_filter_by_ingredients(self):
         """Testa a filtragem de receitas por ingredientes."""
@@ -449,9 +551,354 @@ class PrivateRecipeAPITests(TestCase):
         s2 = RecipeSerializer(r2)
         s3 = RecipeSerializer(r3)
 
-        self.assertIn(s1.data, res.data)
-        self.assertIn(s2.data, res.data)
-        self.assertNotIn(s3.data, res.data)
+        self.assertIn(s1.data, res.data['results'])
+        self.assertIn(s2.data, res.data['results'])
+        self.assertNotIn(s3.data, res.data['results'])
+
+    def test_filter_by_all_tags(self):
+        """Testa a filtragem de receitas com todas as Tags."""
+        r1 = create_recipe(user=self.user, title='Arroz')
+        r2 = create_recipe(user=self.user, title='Feijao')
+        tag1 = Tag.objects.create(user=self.user, name='Almoço')
+        tag2 = Tag.objects.create(user=self.user, name='Jantar')
+        r1.tags.add(tag1, tag2)
+        r2.tags.add(tag1)
+
+        params = {'tags': f'{tag1.id},{tag2.id}', 'tags_mode': 'all'}
+        res = self.client.get(RECIPES_URL, params)
+
+        self.assertEqual(
+            [recipe['id'] for recipe in res.data['results']], [r1.id])
+
+    def test_filter_excluding_tags(self):
+        """Testa a exclusão de receitas por IDs negativos."""
+        r1 = create_recipe(user=self.user, title='Arroz')
+        r2 = create_recipe(user=self.user, title='Feijao')
+        r3 = create_recipe(user=self.user, title='Macarrão')
+        tag1 = Tag.objects.create(user=self.user, name='Almoço')
+        tag2 = Tag.objects.create(user=self.user, name='Picante')
+        r1.tags.add(tag1)
+        r2.tags.add(tag1, tag2)
+        r3.tags.add(tag2)
+
+        res = self.client.get(
+            RECIPES_URL, {'tags': f'{tag1.id},-{tag2.id}'})
+
+        self.assertEqual(
+            [recipe['id'] for recipe in res.data['results']], [r1.id])
+
+    def test_filter_without_duplicates(self):
+        """Testa a filtragem sem receitas repetidas e sem DISTINCT."""
+        r1 = create_recipe(user=self.user, title='Arroz')
+        tag1 = Tag.objects.create(user=self.user, name='Almoço')
+        tag2 = Tag.objects.create(user=self.user, name='Jantar')
+        r1.tags.add(tag1, tag2)
+
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(
+                RECIPES_URL, {'tags': f'{tag1.id},{tag2.id}'})
+
+        self.assertEqual(
+            [recipe['id'] for recipe in res.data['results']], [r1.id])
+        self.assertFalse(any(
+            'DISTINCT' in query['sql'] for query in captured.captured_queries
+        ))
+
+    def test_filter_invalid_mode(self):
+        """Testa o modo de filtragem inválido."""
+        res = self.client.get(RECIPES_URL, {'tags': '1', 'tags_mode': 'x'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class RecipeSearchTests(TestCase):
+    """Testes da busca textual nas receitas."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user(
+            email='user@text.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(self.user)
+
+    def _titles(self, res):
+        """Retorna os títulos das receitas de uma página."""
+        return [recipe['title'] for recipe in res.data['results']]
+
+    def test_search_stemming(self):
+        """Testa a busca com radicalização em português."""
+        create_recipe(user=self.user, title='Bolo de cenoura',
+                      description='')
+        create_recipe(user=self.user, title='Feijoada', description='')
+
+        res = self.client.get(RECIPES_URL, {'search': 'bolos'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._titles(res), ['Bolo de cenoura'])
+
+    def test_search_title_ranked_above_description(self):
+        """Testa a relevância maior para o título que a descrição."""
+        create_recipe(user=self.user, title='Torta',
+                      description='Receita com frango desfiado')
+        create_recipe(user=self.user, title='Frango assado',
+                      description='Assado no forno')
+
+        res = self.client.get(RECIPES_URL, {'search': 'frango'})
+
+        self.assertEqual(self._titles(res), ['Frango assado', 'Torta'])
+
+    def test_search_limited_to_user(self):
+        """Testa a busca limitada às receitas do usuário."""
+        _other_user = create_user(
+            email='other@test.com',
+            password='otherpass123'
+        )
+        create_recipe(user=_other_user, title='Frango assado')
+
+        res = self.client.get(RECIPES_URL, {'search': 'frango'})
+
+        self.assertEqual(self._titles(res), [])
+
+    def test_search_with_tags_and_pagination(self):
+        """Testa a busca combinada com filtro de Tags e paginação."""
+        tag = Tag.objects.create(user=self.user, name='Jantar')
+        for i in range(3):
+            recipe = create_recipe(user=self.user, title=f'Frango {i}',
+                                   description='frango ' * i)
+            recipe.tags.add(tag)
+        create_recipe(user=self.user, title='Frango sem tag')
+
+        res = self.client.get(
+            RECIPES_URL, {'search': 'frango', 'tags': tag.id, 'page_size': 2})
+        res_next = self.client.get(res.data['next'])
+
+        self.assertEqual(
+            self._titles(res) + self._titles(res_next),
+            ['Frango 2', 'Frango 1', 'Frango 0'],
+        )
+        self.assertIsNone(res_next.data['next'])
+
+    def test_search_vector_updated_on_save(self):
+        """Testa a atualização do índice textual ao editar a receita."""
+        recipe = create_recipe(user=self.user, title='Arroz')
+        recipe.title = 'Macarrão'
+        recipe.save()
+
+        res = self.client.get(RECIPES_URL, {'search': 'macarrão'})
+
+        self.assertEqual(self._titles(res), ['Macarrão'])
+
+    def test_search_vector_kept_on_other_columns(self):
+        """Testa o tsvector não recalculado ao gravar outras colunas."""
+        recipe = create_recipe(user=self.user, title='Arroz')
+        with connection.cursor() as cursor:
+            # Um marcador no lugar do tsvector, sem passar pelo trigger.
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+            cursor.execute('ALTER TABLE core_recipe DISABLE TRIGGER '
+                           'core_recipe_search_vector_update')
+            cursor.execute(
+                "UPDATE core_recipe SET search_vector = 'marcador' "
+                "WHERE id = %s", [recipe.id])
+            cursor.execute('ALTER TABLE core_recipe ENABLE TRIGGER '
+                           'core_recipe_search_vector_update')
+        recipe.refresh_from_db()
+
+        Recipe.objects.filter(id=recipe.id).update(image_status='ready')
+        recipe.save()
+
+        res = self.client.get(RECIPES_URL, {'search': 'marcador'})
+        self.assertEqual(self._titles(res), ['Arroz'])
+
+
+class RecipePaginationTests(TestCase):
+    """Testes da paginação por cursor das receitas."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user(
+            email='user@text.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(self.user)
+        self.recipes = [
+            create_recipe(user=self.user, title=f'Receita {i}')
+            for i in range(5)
+        ]
+
+    def _ids(self, res):
+        """Retorna os IDs das receitas de uma página."""
+        return [recipe['id'] for recipe in res.data['results']]
+
+    def test_paginate_all_pages(self):
+        """Testa a navegação por todas as páginas pelo cursor."""
+        expected = [recipe.id for recipe in reversed(self.recipes)]
+
+        res = self.client.get(RECIPES_URL, {'page_size': 2})
+        ids = self._ids(res)
+        while res.data['next']:
+            res = self.client.get(res.data['next'])
+            ids += self._ids(res)
+
+        self.assertEqual(ids, expected)
+
+    def test_next_page_keeps_filters(self):
+        """Testa a paginação combinada com o filtro de tags."""
+        tag = Tag.objects.create(user=self.user, name='Jantar')
+        for recipe in self.recipes[:3]:
+            recipe.tags.add(tag)
+
+        res = self.client.get(RECIPES_URL, {'tags': tag.id, 'page_size': 2})
+        res_next = self.client.get(res.data['next'])
+
+        self.assertEqual(
+            self._ids(res) + self._ids(res_next),
+            [recipe.id for recipe in reversed(self.recipes[:3])],
+        )
+        self.assertIsNone(res_next.data['next'])
+
+    @patch.object(RecipeCursorPagination, 'max_page_size', 3)
+    def test_max_page_size(self):
+        """Testa o limite máximo de itens por página."""
+        res = self.client.get(RECIPES_URL, {'page_size': 100})
+
+        self.assertEqual(len(res.data['results']), 3)
+
+    def test_invalid_cursor(self):
+        """Testa a requisição com cursor inválido."""
+        res = self.client.get(RECIPES_URL, {'cursor': 'invalido'})
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class RecipeBulkAPITests(TestCase):
+    """Testes da rota de escrita em lote das receitas."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user(
+            email='user@text.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(self.user)
+
+    def _create_payload(self, title, **params):
+        """Cria e retorna uma operação de criação do lote."""
+        data = {
+            'title': title,
+            'time_minutes': 10,
+            'price': '5.00',
+        }
+        data.update(params)
+        return {'op': 'create', 'data': data}
+
+    def test_bulk_create_update_delete(self):
+        """Testa o lote com criação, atualização e delete."""
+        _updated = create_recipe(user=self.user, title='Antiga')
+        _deleted = create_recipe(user=self.user)
+        _payload = [
+            self._create_payload('Nova', tags=[{'name': 'Jantar'}]),
+            {'op': 'update', 'id': _updated.id, 'data': {
+                'title': 'Atualizada',
+                'ingredients': [{'name': 'Sal'}],
+            }},
+            {'op': 'delete', 'id': _deleted.id},
+        ]
+
+        res = self.client.post(BULK_URL, _payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result['status'] for result in res.data],
+            ['created', 'updated', 'deleted'],
+        )
+        _created = Recipe.objects.get(id=res.data[0]['id'])
+        self.assertEqual(_created.user, self.user)
+        self.assertEqual(
+            list(_created.tags.values_list('name', flat=True)), ['Jantar'])
+        _updated.refresh_from_db()
+        self.assertEqual(_updated.title, 'Atualizada')
+        self.assertEqual(
+            list(_updated.ingredients.values_list('name', flat=True)),
+            ['Sal'],
+        )
+        self.assertFalse(Recipe.objects.filter(id=_deleted.id).exists())
+
+    def test_bulk_invalid_item_rolls_back(self):
+        """Testa o lote com item inválido sem gravar nenhuma operação."""
+        _recipe = create_recipe(user=self.user)
+        _payload = [
+            self._create_payload('Nova'),
+            {'op': 'create', 'data': {'title': 'Sem preço'}},
+            {'op': 'delete', 'id': _recipe.id},
+        ]
+
+        res = self.client.post(BULK_URL, _payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [result['status'] for result in res.data],
+            ['skipped', 'invalid', 'skipped'],
+        )
+        self.assertIn('price', res.data[1]['errors'])
+        self.assertEqual(Recipe.objects.filter(user=self.user).count(), 1)
+
+    def test_bulk_other_user_recipe_error(self):
+        """Testa o lote com receita de outro usuário com falha."""
+        _other_user = create_user(
+            email='other@test.com',
+            password='otherpass123'
+        )
+        _recipe = create_recipe(user=_other_user)
+        _payload = [{'op': 'delete', 'id': _recipe.id}]
+
+        res = self.client.post(BULK_URL, _payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('id', res.data[0]['errors'])
+        self.assertTrue(Recipe.objects.filter(id=_recipe.id).exists())
+
+    @patch('recipe.views.settings.RECIPE_BULK_MAX_OPERATIONS', 1)
+    def test_bulk_max_operations(self):
+        """Testa o limite de operações por lote."""
+        _payload = [self._create_payload('A'), self._create_payload('B')]
+
+        with patch.object(RecipeBulkOperationSerializer,
+                          'validate') as validate:
+            res = self.client.post(BULK_URL, _payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        validate.assert_not_called()
+        self.assertFalse(Recipe.objects.exists())
+
+    def test_bulk_requires_list(self):
+        """Testa o erro 400 com um lote que não é uma lista."""
+        res = self.client.post(
+            BULK_URL, self._create_payload('A'), format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Recipe.objects.exists())
+
+    def test_bulk_queries_independent_of_size(self):
+        """Testa o lote com queries independentes do número de itens."""
+        def run(size):
+            _recipes = [create_recipe(user=self.user) for _ in range(size)]
+            _payload = [
+                self._create_payload(
+                    f'Receita {i}', tags=[{'name': f'Tag {i}'}])
+                for i in range(size)
+            ] + [
+                {'op': 'update', 'id': recipe.id, 'data': {
+                    'title': 'Atualizada', 'tags': [{'name': 'Tag 0'}]}}
+                for recipe in _recipes
+            ]
+            with CaptureQueriesContext(connection) as captured:
+                res = self.client.post(BULK_URL, _payload, format='json')
+
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            return len(captured)
+
+        self.assertEqual(run(2), run(20))
 
 
 class ImageUploadTests(TestCase):
@@ -89,6 +89,18 @@ class PrivateTagsApiTests(TestCase):
         tag.refresh_from_db()
         self.assertEqual(tag.name, payload['name'])
 
+    def test_update_tag_duplicated_name_error(self):
+        """Testa a atualização de uma tag para um nome existente."""
+        Tag.objects.create(user=self.user, name='Dessert')
+        tag = Tag.objects.create(user=self.user, name='Dinner')
+
+        url = detail_url(tag.id)
+        res = self.client.patch(url, {'name': 'Dessert'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        tag.refresh_from_db()
+        self.assertEqual(tag.name, 'Dinner')
+
     def test_delete_tag(self):
         """Testa o delete de uma tag existente."""
         tag = Tag.objects.create(user=self.user, name='Delete Tag')
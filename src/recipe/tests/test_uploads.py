@@ -0,0 +1,215 @@
+"""Testa o upload da imagem da receita em partes."""
+
+import hashlib
+import io
+import shutil
+import tempfile
+
+from PIL import Image
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import IMAGE_STATUS_PENDING, ImageUpload, Recipe
+from recipe import uploads
+
+UPLOADS_URL = reverse('recipe:imageupload-list')
+
+
+def upload_url(upload_id):
+    """Cria e retorna a URL de um upload."""
+    return reverse('recipe:imageupload-detail', args=[upload_id])
+
+
+def finalize_url(upload_id):
+    """Cria e retorna a URL de finalização de um upload."""
+    return reverse('recipe:imageupload-finalize', args=[upload_id])
+
+
+def image_bytes(size=(300, 200), image_format='PNG'):
+    """Cria e retorna os bytes de uma imagem."""
+    buffer = io.BytesIO()
+    Image.effect_noise(size, 64).convert('RGB').save(buffer, image_format)
+    return buffer.getvalue()
+
+
+@override_settings(RECIPE_IMAGE_CHUNK_SIZE=64 * 1024)
+class ImageUploadTests(TestCase):
+    """Testes para o upload da imagem em partes."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        settings = override_settings(
+            MEDIA_ROOT=self.tmp_dir,
+            RECIPE_IMAGE_UPLOAD_DIR=self.tmp_dir + '/uploads',
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(uploads._hashers.clear)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            'user@test.com',
+            'password@123'
+        )
+        self.client.force_authenticate(self.user)
+        self.recipe = Recipe.objects.create(
+            user=self.user,
+            title='Receita',
+            time_minutes=10,
+            price=5,
+        )
+
+    def _create(self, data, **payload):
+        _payload = {
+            'recipe': self.recipe.id,
+            'filename': 'image.png',
+            'size': len(data),
+            **payload,
+        }
+        return self.client.post(UPLOADS_URL, _payload, format='json')
+
+    def _append(self, upload_id, chunk, offset):
+        return self.client.patch(
+            upload_url(upload_id),
+            chunk,
+            content_type='application/offset+octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def _send(self, upload_id, data, start=0, chunk_size=64 * 1024):
+        for offset in range(start, len(data), chunk_size):
+            res = self._append(
+                upload_id, data[offset:offset + chunk_size], offset)
+            self.assertEqual(res.status_code, status.HTTP_200_OK, res.data)
+
+    def test_chunked_upload(self):
+        """Testa o upload completo em partes."""
+        data = image_bytes()
+        res = self._create(
+            data, sha256=hashlib.sha256(data).hexdigest())
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        upload_id = res.data['id']
+
+        self._send(upload_id, data)
+        res = self.client.post(finalize_url(upload_id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['image_status'], IMAGE_STATUS_PENDING)
+        self.recipe.refresh_from_db()
+        with self.recipe.image.open('rb') as file:
+            self.assertEqual(file.read(), data)
+        self.assertFalse(ImageUpload.objects.exists())
+
+    def test_extension_from_image_format(self):
+        """Testa a extensão do formato da imagem, não a do cliente."""
+        for filename in ('image.html', 'image.svg', 'image'):
+            with self.subTest(filename):
+                data = image_bytes()
+                upload_id = self._create(data, filename=filename).data['id']
+                self._send(upload_id, data)
+
+                res = self.client.post(finalize_url(upload_id))
+
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+                self.recipe.refresh_from_db()
+                self.assertTrue(self.recipe.image.name.endswith('.png'))
+
+    def test_resume_from_current_offset(self):
+        """Testa a retomada pelo offset após perder o hash em memória."""
+        data = image_bytes()
+        upload_id = self._create(
+            data, sha256=hashlib.sha256(data).hexdigest()).data['id']
+        self._append(upload_id, data[:64 * 1024], 0)
+        uploads._hashers.clear()
+
+        res = self.client.get(upload_url(upload_id))
+        self.assertEqual(res['Upload-Offset'], str(64 * 1024))
+        self._send(upload_id, data, start=64 * 1024)
+
+        res = self.client.post(finalize_url(upload_id))
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.data)
+
+    def test_offset_mismatch(self):
+        """Testa a recusa de parte fora do offset atual."""
+        data = image_bytes()
+        upload_id = self._create(data).data['id']
+
+        res = self._append(upload_id, data[:100], 50)
+
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+
+    def test_chunk_too_large(self):
+        """Testa a recusa de parte acima do limite."""
+        data = image_bytes(size=(600, 600))
+        upload_id = self._create(data).data['id']
+
+        res = self._append(upload_id, data[:64 * 1024 + 1], 0)
+
+        self.assertEqual(
+            res.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    @override_settings(RECIPE_IMAGE_MAX_PIXELS=100 * 100)
+    def test_dimensions_checked_from_header(self):
+        """Testa a recusa pelas dimensões antes do arquivo completo."""
+        data = image_bytes(size=(600, 600))
+        upload_id = self._create(data).data['id']
+
+        res = self._append(upload_id, data[:1024], 0)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ImageUpload.objects.filter(pk=upload_id).exists())
+
+    def test_checksum_mismatch(self):
+        """Testa a recusa do arquivo com SHA-256 diferente."""
+        data = image_bytes()
+        upload_id = self._create(data, sha256='0' * 64).data['id']
+        self._send(upload_id, data)
+
+        res = self.client.post(finalize_url(upload_id))
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.recipe.refresh_from_db()
+        self.assertFalse(self.recipe.image)
+
+    def test_finalize_incomplete(self):
+        """Testa a recusa da finalização antes do último byte."""
+        data = image_bytes()
+        upload_id = self._create(data).data['id']
+        self._append(upload_id, data[:1024], 0)
+
+        res = self.client.post(finalize_url(upload_id))
+
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+
+    def test_invalid_image(self):
+        """Testa a recusa de arquivo que não é imagem."""
+        data = b'notanimage' * 10
+        upload_id = self._create(data).data['id']
+
+        res = self._append(upload_id, data, 0)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(RECIPE_IMAGE_MAX_SIZE=1000)
+    def test_size_limit(self):
+        """Testa o limite do tamanho total na criação."""
+        res = self._create(b'x' * 1001)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_other_user_recipe(self):
+        """Testa a recusa do upload para receita de outro usuário."""
+        other = get_user_model().objects.create_user(
+            'other@test.com', 'password@123')
+        self.recipe.user = other
+        self.recipe.save()
+
+        res = self._create(image_bytes())
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
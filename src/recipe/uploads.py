@@ -0,0 +1,276 @@
+"""
+Upload em partes (retomável) das imagens das receitas.
+
+O cliente cria o upload com o tamanho total, envia as partes em ordem
+com o cabeçalho Upload-Offset e finaliza. Cada parte é gravada em disco
+em blocos, com memória limitada, e atualiza o SHA-256 do arquivo. As
+dimensões são conferidas pelo cabeçalho da imagem assim que os bytes
+iniciais chegam, antes de qualquer decodificação completa.
+"""
+
+import hashlib
+import os
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from PIL import Image, UnidentifiedImageError
+from rest_framework import status
+
+from core.lru import LRUCache
+from core.models import IMAGE_STATUS_PENDING, ImageUpload
+from recipe import images
+
+BLOCK_SIZE = 64 * 1024
+# Sem identificar a imagem após esses bytes, o arquivo é recusado.
+MAX_HEADER_SIZE = 512 * 1024
+# Formatos aceitos e a extensão do arquivo gravado para cada um.
+ALLOWED_FORMATS = {'JPEG': '.jpg', 'PNG': '.png', 'WEBP': '.webp',
+                   'GIF': '.gif'}
+
+# Hash parcial de cada upload no processo: upload_id -> (offset, hash).
+# Em outro worker ou após expirar, o hash é refeito a partir do disco.
+_hashers = LRUCache(maxsize=1000, ttl=60 * 60)
+
+
+class UploadError(Exception):
+    """Erro do upload, com o status HTTP da resposta."""
+
+    def __init__(self, detail, status_code=status.HTTP_400_BAD_REQUEST):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+def check_image_header(file) -> tuple:
+    """Retorna (largura, altura) lidas do cabeçalho, validando limites.
+
+    Levanta UploadError para formatos e dimensões não permitidos e
+    propaga os erros do Pillow quando o cabeçalho está incompleto.
+    """
+    file.seek(0)
+    try:
+        image = Image.open(file)
+    except Image.DecompressionBombError as error:
+        raise UploadError(str(error)) from error
+
+    if image.format not in ALLOWED_FORMATS:
+        raise UploadError(_('Formato de imagem não suportado.'))
+
+    width, height = image.size
+    if (max(width, height) > settings.RECIPE_IMAGE_MAX_SIDE
+            or width * height > settings.RECIPE_IMAGE_MAX_PIXELS):
+        raise UploadError(_('Dimensões da imagem acima do limite.'))
+
+    return width, height
+
+
+def image_filename(filename, file) -> str:
+    """Retorna filename com a extensão do formato lido do cabeçalho.
+
+    A extensão enviada pelo cliente é descartada: ela define o tipo
+    (Content-Type) com que o arquivo é servido.
+    """
+    file.seek(0)
+    ext = ALLOWED_FORMATS[Image.open(file).format]
+
+    return os.path.splitext(os.path.basename(filename))[0] + ext
+
+
+def create_upload(user, **fields) -> ImageUpload:
+    """Cria o upload e o arquivo parcial vazio."""
+    upload = ImageUpload.objects.create(
+        user=user,
+        expires_at=timezone.now() + timedelta(
+            seconds=settings.RECIPE_IMAGE_UPLOAD_TTL),
+        **fields,
+    )
+    os.makedirs(settings.RECIPE_IMAGE_UPLOAD_DIR, exist_ok=True)
+    open(upload.path, 'wb').close()
+
+    return upload
+
+
+def delete_upload(upload) -> None:
+    """Remove o upload e o arquivo parcial."""
+    _hashers.pop(upload.id)
+    try:
+        os.remove(upload.path)
+    except FileNotFoundError:
+        pass
+    upload.delete()
+
+
+def clear_expired() -> int:
+    """Remove os uploads expirados e retorna a quantidade."""
+    expired = ImageUpload.objects.filter(expires_at__lte=timezone.now())
+    count = 0
+    for upload in expired.iterator():
+        delete_upload(upload)
+        count += 1
+
+    return count
+
+
+def _get_hasher(upload, file):
+    """Retorna o hash dos bytes confirmados do upload."""
+    cached = _hashers.get(upload.id)
+    if cached is not None and cached[0] == upload.offset:
+        return cached[1].copy()
+
+    hasher = hashlib.sha256()
+    file.seek(0)
+    remaining = upload.offset
+    while remaining:
+        block = file.read(min(BLOCK_SIZE, remaining))
+        if not block:
+            break
+        hasher.update(block)
+        remaining -= len(block)
+
+    return hasher
+
+
+def _lock(upload_id, user) -> ImageUpload:
+    """Retorna o upload válido do usuário, bloqueado até o commit."""
+    upload = ImageUpload.objects.select_for_update().filter(
+        pk=upload_id,
+        user=user,
+        expires_at__gt=timezone.now(),
+    ).first()
+    if upload is None:
+        raise UploadError(
+            _('Upload não encontrado.'), status.HTTP_404_NOT_FOUND)
+
+    return upload
+
+
+def _check_header(upload, file):
+    """Guarda as dimensões quando o cabeçalho já pode ser lido.
+
+    Retorna o UploadError que encerra o upload, ou None.
+    """
+    try:
+        upload.width, upload.height = check_image_header(file)
+    except UploadError as error:
+        return error
+    except (UnidentifiedImageError, SyntaxError, OSError):
+        if upload.offset >= min(upload.size, MAX_HEADER_SIZE):
+            return UploadError(_('Arquivo de imagem inválido.'))
+
+    return None
+
+
+def _check_file(upload, file):
+    """Valida o arquivo completo e retorna o UploadError, ou None."""
+    if upload.sha256:
+        digest = _get_hasher(upload, file).hexdigest()
+        if digest != upload.sha256:
+            return UploadError(_('SHA-256 diferente do informado.'))
+
+    try:
+        check_image_header(file)
+        file.seek(0)
+        Image.open(file).verify()
+    except UploadError as error:
+        return error
+    except (UnidentifiedImageError, SyntaxError, OSError):
+        return UploadError(_('Arquivo de imagem inválido.'))
+
+    return None
+
+
+def append_chunk(upload_id, user, stream, offset, length) -> ImageUpload:
+    """Grava a parte lida de stream a partir de offset e retorna o upload.
+
+    A parte é lida em blocos de BLOCK_SIZE; bytes de uma parte anterior
+    interrompida, além do offset confirmado, são descartados.
+    """
+    with transaction.atomic():
+        upload = _lock(upload_id, user)
+        if offset != upload.offset:
+            raise UploadError(
+                _('Upload-Offset diferente do offset atual (%d).')
+                % upload.offset,
+                status.HTTP_409_CONFLICT,
+            )
+        if length > settings.RECIPE_IMAGE_CHUNK_SIZE:
+            raise UploadError(
+                _('Parte acima de %d bytes.')
+                % settings.RECIPE_IMAGE_CHUNK_SIZE,
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        if offset + length > upload.size:
+            raise UploadError(
+                _('Parte além do tamanho do upload.'),
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        with open(upload.path, 'r+b') as file:
+            hasher = _get_hasher(upload, file)
+            file.truncate(upload.offset)
+            file.seek(upload.offset)
+            remaining = length
+            while remaining:
+                block = stream.read(min(BLOCK_SIZE, remaining))
+                if not block:
+                    file.truncate(upload.offset)
+                    raise UploadError(_('Parte incompleta.'))
+                file.write(block)
+                hasher.update(block)
+                remaining -= len(block)
+
+            upload.offset += length
+            error = None
+            if upload.width is None:
+                file.flush()
+                error = _check_header(upload, file)
+
+        if error is None:
+            upload.save(update_fields=['offset', 'width', 'height'])
+            _hashers.set(upload.id, (upload.offset, hasher))
+
+    if error is not None:
+        # Imagem recusada pelo cabeçalho: o upload é encerrado.
+        delete_upload(upload)
+        raise error
+
+    return upload
+
+
+def finalize_upload(upload_id, user):
+    """Valida o arquivo completo, grava a imagem e retorna a receita."""
+    with transaction.atomic():
+        upload = _lock(upload_id, user)
+        if upload.offset != upload.size:
+            raise UploadError(
+                _('Upload incompleto (%(offset)d de %(size)d bytes).')
+                % {'offset': upload.offset, 'size': upload.size},
+                status.HTTP_409_CONFLICT,
+            )
+
+        recipe = upload.recipe
+        with open(upload.path, 'rb') as file:
+            error = _check_file(upload, file)
+            if error is None:
+                name = image_filename(upload.filename, file)
+                file.seek(0)
+                recipe.image.save(name, File(file), save=False)
+
+        if error is None:
+            recipe.image_status = IMAGE_STATUS_PENDING
+            recipe.image_variants = {}
+            recipe.save(update_fields=[
+                'image', 'image_status', 'image_variants', 'updated_at'])
+            delete_upload(upload)
+            images.schedule_variants(recipe)
+
+    if error is not None:
+        delete_upload(upload)
+        raise error
+
+    return recipe
@@ -10,9 +10,11 @@ router = DefaultRouter()
 router.register('recipes', views.RecipeViewSet)
 router.register('tags', views.TagViewSet)
 router.register('ingredients', views.IngredientViewSet)
+router.register('image-uploads', views.ImageUploadViewSet)
 
 app_name = 'recipe'
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('media/<path:name>', views.RecipeMediaView.as_view(), name='media'),
 ]
@@ -1,9 +1,47 @@
 """Views para a rota de receitas da API."""
+import mimetypes
+import os
+
+from urllib.parse import quote
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+)
+from django.db.models import (
+    BooleanField,
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Cast, Collate, Upper
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    StreamingHttpResponse,
+)
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.utils.translation import gettext as _
 from rest_framework import viewsets, mixins, status
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.negotiation import BaseContentNegotiation
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
 
 from drf_spectacular.utils import (
     extend_schema,
@@ -13,11 +51,41 @@ from drf_spectacular.utils import (
 )
 
 from core.models import (
+    IMAGE_STATUS_PENDING,
+    SEARCH_CONFIG,
+    ImageUpload,
     Recipe,
+    RecipeMedia,
     Tag,
     Ingredient
 )
-from recipe import serializers
+from recipe import images, readers, serializers, services, uploads
+from recipe.cache import CachedListMixin
+from recipe.conditional import ConditionalMixin
+from recipe.export import NDJSONRenderer, gzip_stream, iter_ndjson
+from recipe.fieldsets import DynamicFieldsMixin, FIELDSET_PARAMETERS
+from recipe.importer import (
+    PARSERS,
+    RecipeImporter,
+    RecipeImportError,
+    guess_format,
+)
+from recipe.pagination import RecipeCursorPagination
+from user.authentication import (
+    CachedTokenAuthentication,
+    SignedTokenAuthentication,
+)
+
+# A relevância é inteira para servir de posição estável no cursor.
+RANK_SCALE = 1000000
+
+FILTER_MODES = ('any', 'all')
+
+BULK_STATUS = {
+    'create': 'created',
+    'update': 'updated',
+    'delete': 'deleted',
+}
 
 
 @extend_schema_view(
@@ -26,51 +94,192 @@ from recipe import serializers
             OpenApiParameter(
                 'tags',
                 OpenApiTypes.STR,
-                description='Lista de IDs da view Tag separados por ;'
+                description='Lista de IDs da view Tag separados por ; '
+                            '(IDs negativos excluem a Tag)'
+            ),
+            OpenApiParameter(
+                'tags_mode',
+                OpenApiTypes.STR,
+                enum=FILTER_MODES,
+                description='Receitas com qualquer (any) ou todas (all) '
+                            'as Tags.'
             ),
             OpenApiParameter(
                 'ingredients',
                 OpenApiTypes.STR,
-                description='Lista de IDs da view Ingredient separados por ;'
-            )
-        ]
-    )
+                description='Lista de IDs da view Ingredient separados por ; '
+                            '(IDs negativos excluem o ingrediente)'
+            ),
+            OpenApiParameter(
+                'ingredients_mode',
+                OpenApiTypes.STR,
+                enum=FILTER_MODES,
+                description='Receitas com qualquer (any) ou todos (all) '
+                            'os ingredientes.'
+            ),
+            OpenApiParameter(
+                'search',
+                OpenApiTypes.STR,
+                description='Busca textual no título e descrição, '
+                            'ordenada por relevância.'
+            ),
+            *FIELDSET_PARAMETERS,
+        ],
+        responses=serializers.RecipeSerializer,
+    ),
+    retrieve=extend_schema(
+        parameters=FIELDSET_PARAMETERS,
+        responses=serializers.RecipeDetailSerializer,
+    ),
 )
-class RecipeViewSet(viewsets.ModelViewSet):
+class RecipeViewSet(DynamicFieldsMixin,
+                    ConditionalMixin,
+                    CachedListMixin,
+                    viewsets.ModelViewSet):
     """View para administração da rota de receitas."""
     serializer_class = serializers.RecipeDetailSerializer
     queryset = Recipe.objects.all()
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [
+        CachedTokenAuthentication,
+        SignedTokenAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
+    pagination_class = RecipeCursorPagination
+    query_budget = {'list': 4, 'retrieve': 4}
+    expandable_fields = tuple(services.RELATED_MODELS)
 
     def _params_to_ints(self, qs: list[str]) -> list[int]:
         """Converte uma lista str para int."""
         return [int(str_id) for str_id in qs.split(',')]
 
+    @property
+    def cursor_ordering(self):
+        """Ordenação do cursor: pela relevância quando há busca textual."""
+        if self.request.query_params.get('search'):
+            return ('-rank', '-id')
+
+        return None
+
+    def _filter_related(self, queryset, field_name):
+        """Filtra pelos vínculos com semi-joins (EXISTS), sem DISTINCT.
+
+        IDs negativos excluem as receitas vinculadas; o modo all exige
+        todos os IDs positivos e o any (padrão), ao menos um.
+        """
+        ids = self._params_to_ints(self.request.query_params[field_name])
+        mode = self.request.query_params.get(f'{field_name}_mode', 'any')
+        if mode not in FILTER_MODES:
+            raise ValidationError({
+                f'{field_name}_mode': _('Use any ou all.'),
+            })
+
+        through, source, target = services.get_through(field_name)
+        links = through.objects.filter(**{source: OuterRef('pk')})
+        include = [attr_id for attr_id in ids if attr_id > 0]
+        exclude = [-attr_id for attr_id in ids if attr_id < 0]
+
+        if include and mode == 'all':
+            for attr_id in set(include):
+                queryset = queryset.filter(
+                    Exists(links.filter(**{target: attr_id})))
+        elif include:
+            queryset = queryset.filter(
+                Exists(links.filter(**{f'{target}__in': include})))
+
+        if exclude:
+            queryset = queryset.filter(
+                ~Exists(links.filter(**{f'{target}__in': exclude})))
+
+        return queryset
+
     def get_queryset(self):
         """Retorna as receitas do usuário autenticado."""
-        tags = self.request.query_params.get('tags')
-        ingredients = self.request.query_params.get('ingredients')
+        search = self.request.query_params.get('search')
         queryset = self.queryset
 
-        if tags:
-            tag_ids = self._params_to_ints(tags)
-            queryset = queryset.filter(tags__id__in=tag_ids)
+        for field_name in services.RELATED_MODELS:
+            if self.request.query_params.get(field_name):
+                queryset = self._filter_related(queryset, field_name)
 
-        if ingredients:
-            ingredient_ids = self._params_to_ints(ingredients)
-            queryset = queryset.filter(ingredients__id__in=ingredient_ids)
+        ordering = ['-id']
+        if search:
+            query = SearchQuery(
+                search,
+                config=SEARCH_CONFIG,
+                search_type='websearch',
+            )
+            queryset = queryset.filter(search_vector=query).annotate(
+                rank=Cast(
+                    SearchRank(F('search_vector'), query) * RANK_SCALE,
+                    IntegerField(),
+                ),
+            )
+            ordering = ['-rank', '-id']
 
-        return queryset.filter(
+        queryset = queryset.filter(
             user=self.request.user
-        ).order_by('-id').distinct()
+        ).order_by(*ordering)
+
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, 'values_fields'):
+            # Leitura rápida: linhas de values() só com as colunas pedidas;
+            # rank posiciona o cursor.
+            return queryset.values(
+                *serializer_class.get_values_fields(self.fieldset),
+                *(['rank'] if search else []),
+            )
+
+        return queryset.prefetch_related(*(
+            Prefetch(field_name, queryset=model.objects.order_by('id'))
+            for field_name, model in services.RELATED_MODELS.items()
+        ))
+
+    def get_detail_versions(self, queryset):
+        """Inclui o maior updated_at e o total das Tags e ingredientes.
+
+        Renomear um atributo muda o maior updated_at e deletá-lo, o total,
+        sem gravar nas receitas vinculadas.
+        """
+        annotations = {}
+        for field_name, model in services.RELATED_MODELS.items():
+            attrs = model.objects.filter(
+                recipe=OuterRef('pk'),
+            ).order_by().values('recipe')
+            annotations[f'{field_name}_updated_at'] = Subquery(
+                attrs.annotate(value=Max('updated_at')).values('value'))
+            annotations[f'{field_name}_count'] = Subquery(
+                attrs.annotate(value=Count('pk')).values('value'))
+
+        row = queryset.annotate(**annotations).values(
+            'updated_at', *annotations).first()
+        if row is None:
+            return None
+
+        updated_at = max(
+            value for name, value in row.items()
+            if name.endswith('updated_at') and value is not None
+        )
+
+        return updated_at, tuple(row.values())
 
     def get_serializer_class(self):
         """Retorna a classe serializer para a requizição."""
+        if self.request.method in SAFE_METHODS:
+            # Os formulários da API navegável (PUT/POST) usam o
+            # ModelSerializer.
+            if self.action == 'list':
+                return readers.RecipeReadSerializer
+            if self.action == 'retrieve':
+                return readers.RecipeDetailReadSerializer
+
         if self.action == 'list':
             return serializers.RecipeSerializer
         elif self.action == 'upload_image':
             return serializers.RecipeImageSerializer
+        elif self.action == 'bulk':
+            return serializers.RecipeBulkOperationSerializer
+        elif self.action == 'import_file':
+            return serializers.RecipeImportSerializer
 
         return self.serializer_class
 
@@ -85,11 +294,162 @@ class RecipeViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(recipe, data=request.data)
 
         if serializer.is_valid():
-            serializer.save()
+            serializer.save(
+                image_status=IMAGE_STATUS_PENDING,
+                image_variants={},
+            )
+            images.schedule_variants(recipe)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    def _validate_bulk_operation(self, operation, recipes, seen_ids):
+        """Valida uma operação do lote e retorna (validated_data, erros)."""
+        if operation['op'] == 'create':
+            serializer = serializers.RecipeDetailSerializer(
+                data=operation['data'],
+                context=self.get_serializer_context(),
+            )
+            if serializer.is_valid():
+                return serializer.validated_data, None
+            return None, serializer.errors
+
+        recipe = recipes.get(operation['id'])
+        if recipe is None:
+            return None, {'id': [_('Receita não encontrada.')]}
+        if recipe.id in seen_ids:
+            return None, {'id': [_('Receita repetida no lote.')]}
+        seen_ids.add(recipe.id)
+
+        if operation['op'] == 'delete':
+            return None, None
+
+        serializer = serializers.RecipeDetailSerializer(
+            recipe,
+            data=operation['data'],
+            partial=True,
+            context=self.get_serializer_context(),
+        )
+        if serializer.is_valid():
+            return serializer.validated_data, None
+        return None, serializer.errors
+
+    @action(methods=['POST'], detail=False, url_path='bulk')
+    def bulk(self, request):
+        """Rota para criar, atualizar e deletar receitas em lote."""
+        # O tamanho é conferido antes de validar os itens do lote.
+        if not isinstance(request.data, list):
+            return Response(
+                {'detail': _('Envie uma lista de operações.')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(request.data) > settings.RECIPE_BULK_MAX_OPERATIONS:
+            return Response(
+                {'detail': _('Máximo de %d operações por lote.')
+                 % settings.RECIPE_BULK_MAX_OPERATIONS},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        operations = serializer.validated_data
+
+        recipes = Recipe.objects.filter(user=request.user).in_bulk(
+            [operation['id'] for operation in operations
+             if 'id' in operation]
+        )
+        results, creates, updates, delete_ids = [], [], [], []
+        seen_ids = set()
+        for operation in operations:
+            data, errors = self._validate_bulk_operation(
+                operation, recipes, seen_ids)
+            result = {'op': operation['op'], 'id': operation.get('id')}
+            if errors:
+                result.update(status='invalid', errors=errors)
+            elif operation['op'] == 'create':
+                creates.append(data)
+            elif operation['op'] == 'update':
+                updates.append((recipes[operation['id']], data))
+            else:
+                delete_ids.append(operation['id'])
+            results.append(result)
+
+        if any(result.get('errors') for result in results):
+            for result in results:
+                result.setdefault('status', 'skipped')
+            return Response(results, status=status.HTTP_400_BAD_REQUEST)
+
+        created = iter(services.bulk_save_recipes(
+            request.user, creates, updates, delete_ids))
+        for result in results:
+            result['status'] = BULK_STATUS[result['op']]
+            if result['op'] == 'create':
+                result['id'] = next(created).id
+
+        return Response(results, status=status.HTTP_200_OK)
+
+    @action(methods=['POST'], detail=False, url_path='import')
+    def import_file(self, request):
+        """Rota para importar receitas de um arquivo CSV ou NDJSON."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        file_format = serializer.validated_data.get(
+            'format') or guess_format(upload.name)
+
+        importer = RecipeImporter(request.user)
+        try:
+            importer.run(
+                PARSERS[file_format](upload.file),
+                start=serializer.validated_data['start'],
+            )
+        except RecipeImportError as error:
+            return Response({
+                'detail': str(error),
+                'row': error.row,
+                'errors': error.errors,
+                'imported': importer.imported,
+                'resume_from': error.resume_from,
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'imported': importer.imported,
+            'next_row': importer.committed,
+            'rows_per_second': round(importer.rows_per_second, 1),
+        }, status=status.HTTP_200_OK)
+
+    @action(
+        methods=['GET'],
+        detail=False,
+        url_path='export',
+        renderer_classes=[NDJSONRenderer, JSONRenderer],
+    )
+    def export(self, request):
+        """Rota para exportar todas as receitas em NDJSON (streaming)."""
+        storage = Recipe._meta.get_field('image').storage
+
+        def build_url(name):
+            """Retorna a URL absoluta da imagem (ou None)."""
+            if not name:
+                return None
+            return request.build_absolute_uri(storage.url(name))
+
+        stream = iter_ndjson(request.user, build_url)
+        accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        compress = 'gzip' in accept_encoding
+        if compress:
+            stream = gzip_stream(stream)
+
+        response = StreamingHttpResponse(
+            stream, content_type=NDJSONRenderer.media_type)
+        response['Content-Disposition'] = (
+            'attachment; filename="recipes.ndjson"')
+        response['Vary'] = 'Accept-Encoding'
+        if compress:
+            response['Content-Encoding'] = 'gzip'
+
+        return response
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -99,40 +459,262 @@ class RecipeViewSet(viewsets.ModelViewSet):
                 OpenApiTypes.INT,
                 enum=(0, 1),
                 description='Filtro de itens atrelados a receitas.'
-            )
+            ),
+            OpenApiParameter(
+                'q',
+                OpenApiTypes.STR,
+                description='Autocomplete por prefixo ou similaridade, '
+                            'ordenado por relevância.'
+            ),
+            OpenApiParameter(
+                'limit',
+                OpenApiTypes.INT,
+                description='Máximo de itens retornados com o parâmetro q.'
+            ),
+            FIELDSET_PARAMETERS[0],
         ]
     )
 )
-class BaseRecipeAttrViewSet(mixins.DestroyModelMixin,
+class BaseRecipeAttrViewSet(DynamicFieldsMixin,
+                            ConditionalMixin,
+                            CachedListMixin,
+                            mixins.DestroyModelMixin,
                             mixins.UpdateModelMixin,
                             mixins.ListModelMixin,
                             viewsets.GenericViewSet):
     """Viewset base para os atributos da receita."""
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [
+        CachedTokenAuthentication,
+        SignedTokenAuthentication,
+    ]
     permission_classes = [IsAuthenticated]
+    query_budget = {'list': 2}
 
     def get_queryset(self):
         """Retorna o queryset do usuário autenticado."""
         assigned_only = bool(
             int(self.request.query_params.get('assigned_only', 0))
         )
+        search = self.request.query_params.get('q')
         queryset = self.queryset
 
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+            through, _source, target = services.get_through(
+                self.recipe_field)
+            queryset = queryset.filter(Exists(
+                through.objects.filter(**{target: OuterRef('pk')})))
 
-        return queryset.filter(
-            user=self.request.user
-        ).order_by('-name').distinct()
+        queryset = queryset.filter(user=self.request.user)
+        if self.fieldset:
+            # O autocomplete ordena a UNION pelo nome.
+            queryset = queryset.only(
+                *self.fieldset, *(['name'] if search else []))
+        if search and self.action == 'list':
+            return self._autocomplete(queryset, search)
+
+        return queryset.order_by('-name')
+
+    def _autocomplete(self, queryset, search):
+        """Retorna os itens por prefixo e, em seguida, por similaridade."""
+        params = serializers.AttrSearchSerializer(
+            data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        limit = min(
+            params.validated_data.get(
+                'limit', settings.RECIPE_ATTR_SEARCH_LIMIT),
+            settings.RECIPE_ATTR_SEARCH_MAX_LIMIT,
+        )
+        # istartswith gera UPPER(name) LIKE 'Q%', coberto pelo índice
+        # (user, UPPER(name)) do modelo. Com o prefixo e a similaridade em
+        # um OR o planner prefere o seq scan, por isso a UNION.
+        prefix = Q(name__istartswith=search)
+        # Com limit prefixos os similares ficariam fora da resposta: o
+        # Postgres avalia o subquery uma vez e pula a busca trigram, a parte
+        # cara (similarity() de cada candidato do índice). Na ordem do
+        # índice de prefixo, o subquery lê só as primeiras limit entradas.
+        last_prefix = Subquery(queryset.filter(prefix).order_by(
+            Collate(Upper('name'), 'C')).values('pk')[limit - 1:limit])
+        queryset = queryset.annotate(
+            similarity=TrigramSimilarity('name', search),
+        ).order_by('-similarity', 'name')
+        by_prefix = queryset.filter(prefix).annotate(
+            is_prefix=Value(True, output_field=BooleanField()),
+        )
+        similar = queryset.alias(last_prefix=last_prefix).filter(
+            last_prefix__isnull=True, name__trigram_similar=search,
+        ).exclude(prefix).annotate(
+            is_prefix=Value(False, output_field=BooleanField()),
+        )
+
+        return by_prefix[:limit].union(similar[:limit], all=True).order_by(
+            '-is_prefix', '-similarity', 'name')[:limit]
 
 
 class TagViewSet(BaseRecipeAttrViewSet):
     """View para administação da rota de Tag."""
     serializer_class = serializers.TagSerializer
     queryset = Tag.objects.all()
+    recipe_field = 'tags'
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
     """View para administração da rota de ingredientes."""
     serializer_class = serializers.IngredientSerializer
     queryset = Ingredient.objects.all()
+    recipe_field = 'ingredients'
+
+
+@extend_schema_view(
+    partial_update=extend_schema(
+        request={'application/offset+octet-stream': OpenApiTypes.BINARY},
+        parameters=[
+            OpenApiParameter(
+                'Upload-Offset',
+                OpenApiTypes.INT,
+                location=OpenApiParameter.HEADER,
+                required=True,
+                description='Offset atual do upload, onde a parte começa.'
+            ),
+        ],
+        description='Envia a próxima parte do arquivo no corpo.',
+    ),
+    finalize=extend_schema(
+        request=None,
+        responses=serializers.RecipeImageSerializer,
+    ),
+)
+class ImageUploadViewSet(mixins.CreateModelMixin,
+                         mixins.RetrieveModelMixin,
+                         mixins.DestroyModelMixin,
+                         viewsets.GenericViewSet):
+    """View para o upload da imagem da receita em partes (retomável)."""
+    serializer_class = serializers.ImageUploadSerializer
+    queryset = ImageUpload.objects.all()
+    authentication_classes = [
+        CachedTokenAuthentication,
+        SignedTokenAuthentication,
+    ]
+    permission_classes = [IsAuthenticated]
+    http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+
+    def get_queryset(self):
+        """Retorna os uploads válidos do usuário autenticado."""
+        return self.queryset.filter(
+            user=self.request.user,
+            expires_at__gt=timezone.now(),
+        )
+
+    def perform_create(self, serializer):
+        """Cria o upload e o arquivo parcial."""
+        serializer.instance = uploads.create_upload(
+            self.request.user, **serializer.validated_data)
+
+    def perform_destroy(self, instance):
+        """Cancela o upload, removendo o arquivo parcial."""
+        uploads.delete_upload(instance)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Inclui o offset atual no cabeçalho Upload-Offset."""
+        response = super().finalize_response(
+            request, response, *args, **kwargs)
+        if isinstance(response.data, dict) and 'offset' in response.data:
+            response['Upload-Offset'] = response.data['offset']
+
+        return response
+
+    def _upload_error(self, error):
+        """Retorna a resposta do erro de upload."""
+        return Response({'detail': error.detail}, status=error.status_code)
+
+    def partial_update(self, request, pk=None):
+        """Rota para enviar uma parte do arquivo a partir do offset."""
+        try:
+            offset = int(request.META['HTTP_UPLOAD_OFFSET'])
+            length = int(request.META['CONTENT_LENGTH'])
+        except (KeyError, ValueError):
+            return Response(
+                {'detail': _('Cabeçalhos Upload-Offset e Content-Length '
+                             'obrigatórios.')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            # O corpo é lido direto do stream, sem os parsers do DRF.
+            upload = uploads.append_chunk(
+                pk, request.user, request.stream, offset, length)
+        except uploads.UploadError as error:
+            return self._upload_error(error)
+
+        return Response(self.get_serializer(upload).data)
+
+    @action(methods=['POST'], detail=True, url_path='finalize')
+    def finalize(self, request, pk=None):
+        """Rota para concluir o upload e gravar a imagem da receita."""
+        try:
+            recipe = uploads.finalize_upload(pk, request.user)
+        except uploads.UploadError as error:
+            return self._upload_error(error)
+
+        serializer = serializers.RecipeImageSerializer(
+            recipe, context=self.get_serializer_context())
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class IgnoreClientContentNegotiation(BaseContentNegotiation):
+    """Ignora o Accept: a resposta é o arquivo, não um renderer."""
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+@extend_schema(responses={(200, 'application/octet-stream'): bytes})
+class RecipeMediaView(APIView):
+    """View para as imagens das receitas do usuário autenticado.
+
+    A permissão é conferida no Django; com MEDIA_ACCEL_REDIRECT o arquivo
+    é enviado pelo nginx (X-Accel-Redirect), sem ocupar o worker.
+    """
+    authentication_classes = [
+        CachedTokenAuthentication,
+        SignedTokenAuthentication,
+    ]
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = IgnoreClientContentNegotiation
+
+    def _is_owner(self, user, name) -> bool:
+        """Retorna se alguma receita do usuário usa o arquivo."""
+        return RecipeMedia.objects.filter(
+            name=name,
+            recipe__user=user,
+        ).exists()
+
+    def get(self, request, name):
+        """Retorna o arquivo, ou a resposta 304 do ETag."""
+        storage = Recipe._meta.get_field('image').storage
+        if not self._is_owner(request.user, name) or not storage.exists(name):
+            raise Http404
+
+        # O nome é o SHA-256 do conteúdo (core.storage): ETag imutável.
+        etag = quote_etag(os.path.splitext(os.path.basename(name))[0])
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if settings.MEDIA_ACCEL_REDIRECT:
+                response = HttpResponse(
+                    content_type=mimetypes.guess_type(name)[0])
+                response['X-Accel-Redirect'] = (
+                    settings.MEDIA_ACCEL_PREFIX + quote(name))
+            else:
+                response = FileResponse(storage.open(name))
+
+        response['ETag'] = etag
+        patch_cache_control(
+            response,
+            private=True,
+            max_age=settings.MEDIA_CACHE_MAX_AGE,
+            immutable=True,
+        )
+
+        return response
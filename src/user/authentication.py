@@ -0,0 +1,153 @@
+"""
+Autenticação por token com cache em memória do worker.
+
+Os pares token -> usuário (e, para os access tokens assinados, id ->
+usuário) ficam em LRUCaches por processo, com a época do usuário no
+momento da leitura. Exclusões de tokens e alterações de autenticação do
+usuário incrementam a época dele no cache do Django, e as entradas com
+uma época anterior deixam de valer: a revogação vale para todos os
+workers na requisição seguinte, sem descartar os demais usuários.
+"""
+
+import copy
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext as _
+from drf_spectacular.extensions import OpenApiAuthenticationExtension
+from rest_framework.authentication import (
+    BaseAuthentication,
+    TokenAuthentication,
+    get_authorization_header,
+)
+from rest_framework.exceptions import AuthenticationFailed
+
+from core import metrics
+from core.lru import LRUCache
+from user.tokens import InvalidToken, read_access_token
+
+EPOCH_KEY_PREFIX = 'auth-token-cache:epoch'
+
+token_cache = LRUCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL,
+)
+user_cache = LRUCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL,
+)
+
+
+def _epoch_key(user_id) -> str:
+    return f'{EPOCH_KEY_PREFIX}:{user_id}'
+
+
+def get_epoch(user_id) -> int:
+    """Retorna a época atual do cache de autenticação do usuário."""
+    key = _epoch_key(user_id)
+    epoch = cache.get(key)
+    if epoch is None:
+        # Iniciada pelo relógio: se a época for removida do cache, a nova
+        # é sempre maior que as anteriores e nunca valida entradas antigas.
+        cache.add(key, time.time_ns(), timeout=None)
+        epoch = cache.get(key)
+
+    return epoch
+
+
+def bump_epoch(user_id) -> None:
+    """Incrementa a época do usuário em todos os workers."""
+    try:
+        cache.incr(_epoch_key(user_id))
+    except ValueError:
+        cache.add(_epoch_key(user_id), time.time_ns(), timeout=None)
+
+
+def invalidate(user_id) -> None:
+    """Invalida os tokens em cache do usuário, agora e após o commit.
+
+    O segundo incremento descarta o usuário lido por requisições
+    concorrentes antes de a transação ser gravada.
+    """
+    user_cache.pop(user_id)
+    bump_epoch(user_id)
+    transaction.on_commit(lambda: bump_epoch(user_id))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication sem a query de Token e User a cada requisição."""
+
+    def authenticate_credentials(self, key):
+        """Retorna (usuário, token) do cache ou do banco de dados."""
+        cached = token_cache.get(key)
+        if cached is not None:
+            user, token, epoch = cached
+            if epoch == get_epoch(user.pk):
+                metrics.increment('auth.token_cache.hit')
+                # Cópias: a view pode alterar request.user sem afetar o cache.
+                return copy.copy(user), token
+
+        metrics.increment('auth.token_cache.miss')
+        user, token = super().authenticate_credentials(key)
+        token_cache.set(key, (user, token, get_epoch(user.pk)))
+
+        return copy.copy(user), token
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """Autenticação pelos access tokens assinados (Bearer).
+
+    A assinatura e a validade são verificadas sem o banco; o usuário vem
+    do cache do worker e precisa ter a mesma token_version do token.
+    """
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        """Retorna (usuário, payload) ou None se não for um Bearer."""
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed(_('Invalid token header.'))
+
+        try:
+            payload = read_access_token(auth[1].decode())
+        except (InvalidToken, UnicodeError):
+            raise AuthenticationFailed(_('Invalid token.'))
+
+        user = self._get_user(payload['uid'])
+        if (user is None or not user.is_active
+                or user.token_version != payload['ver']):
+            raise AuthenticationFailed(_('Invalid token.'))
+
+        return copy.copy(user), payload
+
+    def _get_user(self, user_id):
+        """Retorna o usuário do cache do worker ou do banco de dados."""
+        epoch = get_epoch(user_id)
+        cached = user_cache.get(user_id)
+        if cached is not None and cached[1] == epoch:
+            metrics.increment('auth.user_cache.hit')
+            return cached[0]
+
+        metrics.increment('auth.user_cache.miss')
+        user = get_user_model().objects.filter(pk=user_id).first()
+        if user is not None:
+            user_cache.set(user_id, (user, epoch))
+
+        return user
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
+class SignedTokenScheme(OpenApiAuthenticationExtension):
+    """Documenta o Bearer dos access tokens no schema OpenAPI."""
+    target_class = 'user.authentication.SignedTokenAuthentication'
+    name = 'bearerAuth'
+
+    def get_security_definition(self, auto_schema):
+        return {'type': 'http', 'scheme': 'bearer'}
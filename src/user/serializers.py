@@ -23,6 +23,8 @@ class UserSerializer(serializers.ModelSerializer):
 
         if password:
             user.set_password(password)
+            # Revoga os access e refresh tokens emitidos até aqui.
+            user.token_version += 1
             user.save()
         return user
 
@@ -50,3 +52,15 @@ class AuthTokenSerializer(serializers.Serializer):
 
         attrs['user'] = user
         return attrs
+
+
+class RefreshTokenSerializer(serializers.Serializer):
+    """Serializer para a troca do refresh token."""
+    refresh = serializers.CharField(trim_whitespace=False)
+
+
+class TokenPairSerializer(serializers.Serializer):
+    """Serializer do par de tokens emitido."""
+    access = serializers.CharField()
+    refresh = serializers.CharField()
+    expires_in = serializers.IntegerField()
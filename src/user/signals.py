@@ -0,0 +1,53 @@
+"""Sinais que invalidam o cache de autenticação por token."""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_init, post_save
+from rest_framework.authtoken.models import Token
+
+from user import authentication
+
+# Campos que decidem a autenticação: alterar outros (nome, last_login)
+# não invalida o cache.
+AUTH_FIELDS = ('is_active', 'password', 'token_version')
+
+
+def _auth_state(instance) -> tuple:
+    return tuple(getattr(instance, name) for name in AUTH_FIELDS)
+
+
+def remember_auth_state(sender, instance, **kwargs):
+    """Guarda os campos de autenticação do usuário carregado."""
+    if not set(AUTH_FIELDS) & instance.get_deferred_fields():
+        instance._auth_state = _auth_state(instance)
+
+
+def invalidate_user_tokens(sender, instance, created=False,
+                           update_fields=None, **kwargs):
+    """Invalida o cache do usuário ao alterar a sua autenticação."""
+    if created or (update_fields is not None
+                   and not set(AUTH_FIELDS) & set(update_fields)):
+        return
+    if set(AUTH_FIELDS) & instance.get_deferred_fields():
+        authentication.invalidate(instance.pk)
+        return
+
+    state = _auth_state(instance)
+    if getattr(instance, '_auth_state', None) != state:
+        authentication.invalidate(instance.pk)
+        instance._auth_state = state
+
+
+def invalidate_deleted_user(sender, instance, **kwargs):
+    """Invalida o cache do usuário deletado."""
+    authentication.invalidate(instance.pk)
+
+
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Invalida o cache do dono do token deletado."""
+    authentication.invalidate(instance.user_id)
+
+
+post_init.connect(remember_auth_state, sender=get_user_model())
+post_save.connect(invalidate_user_tokens, sender=get_user_model())
+post_delete.connect(invalidate_deleted_user, sender=get_user_model())
+post_delete.connect(invalidate_deleted_token, sender=Token)
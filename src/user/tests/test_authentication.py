@@ -0,0 +1,117 @@
+""" Testes do cache de autenticação por token. """
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from core import metrics
+from user.authentication import bump_epoch, token_cache
+
+ME_URL = reverse('user:me')
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Testes da CachedTokenAuthentication."""
+
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        metrics.reset()
+        self.user = get_user_model().objects.create_user(
+            email='test@test.com',
+            password='testpass123',
+            name='Test',
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_cached_token_skips_queries(self):
+        """Testa a segunda requisição autenticada sem queries."""
+        self.client.get(ME_URL)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['email'], self.user.email)
+        self.assertEqual(metrics.hit_ratios()['auth.token_cache'], 0.5)
+
+    def test_deleted_token_rejected(self):
+        """Testa a recusa do token deletado após estar em cache."""
+        self.client.get(ME_URL)
+
+        self.token.delete()
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_inactive_user_rejected(self):
+        """Testa a recusa do usuário desativado após estar em cache."""
+        self.client.get(ME_URL)
+
+        self.user.is_active = False
+        self.user.save()
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_update_not_stale(self):
+        """Testa os dados do usuário atualizados após a alteração."""
+        self.client.get(ME_URL)
+
+        self.client.patch(ME_URL, {'name': 'Novo Nome'})
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.data['name'], 'Novo Nome')
+
+    def test_invalidation_from_other_worker(self):
+        """Testa a limpeza do cache local ao mudar a época compartilhada."""
+        self.client.get(ME_URL)
+        self.assertEqual(len(token_cache), 1)
+
+        bump_epoch(self.user.id)
+        with self.assertNumQueries(1):
+            self.client.get(ME_URL)
+
+    def test_other_user_change_keeps_cache(self):
+        """Testa o cache mantido ao alterar a autenticação de outro usuário."""
+        other = get_user_model().objects.create_user(
+            email='other@test.com',
+            password='testpass123',
+        )
+        self.client.get(ME_URL)
+
+        other.set_password('newpass123')
+        other.save()
+        other.delete()
+        with self.assertNumQueries(0):
+            self.client.get(ME_URL)
+
+    def test_non_auth_fields_keep_cache(self):
+        """Testa o cache mantido ao gravar campos fora da autenticação."""
+        self.client.get(ME_URL)
+
+        user = get_user_model().objects.get(pk=self.user.pk)
+        user.name = 'Admin'
+        user.save()
+        user.last_login = timezone.now()
+        user.save(update_fields=['last_login'])
+        with self.assertNumQueries(0):
+            self.client.get(ME_URL)
+
+    def test_password_change_invalidates_cache(self):
+        """Testa a releitura do usuário após a troca de senha."""
+        self.client.get(ME_URL)
+
+        user = get_user_model().objects.get(pk=self.user.pk)
+        user.set_password('newpass123')
+        user.save()
+        with self.assertNumQueries(1):
+            self.client.get(ME_URL)
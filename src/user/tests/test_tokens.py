@@ -0,0 +1,110 @@
+""" Testes dos access tokens assinados e do refresh. """
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import RefreshToken
+from user.authentication import token_cache, user_cache
+
+ACCESS_URL = reverse('user:token-access')
+REFRESH_URL = reverse('user:token-refresh')
+REVOKE_URL = reverse('user:token-revoke')
+ME_URL = reverse('user:me')
+
+
+class SignedTokenTests(TestCase):
+    """Testes do fluxo de access e refresh tokens."""
+
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        user_cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email='test@test.com',
+            password='testpass123',
+            name='Test',
+        )
+        self.client = APIClient()
+        self.pair = self.client.post(ACCESS_URL, {
+            'email': 'test@test.com',
+            'password': 'testpass123',
+        }).data
+
+    def _me(self, access):
+        """Retorna a rota me autenticada pelo access token."""
+        return APIClient().get(ME_URL, HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_access_token_authenticates(self):
+        """Testa a autenticação sem queries com o usuário em cache."""
+        self._me(self.pair['access'])
+
+        with self.assertNumQueries(0):
+            res = self._me(self.pair['access'])
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['email'], 'test@test.com')
+
+    def test_invalid_credentials(self):
+        """Testa a emissão recusada com a senha errada."""
+        res = self.client.post(ACCESS_URL, {
+            'email': 'test@test.com',
+            'password': 'errada',
+        })
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_tampered_token_rejected(self):
+        """Testa a recusa de um access token alterado."""
+        res = self._me(self.pair['access'][:-1] + 'x')
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(res['WWW-Authenticate'], 'Token')
+
+    def test_expired_token_rejected(self):
+        """Testa a recusa de um access token expirado."""
+        with override_settings(ACCESS_TOKEN_TTL=-1):
+            res = self._me(self.pair['access'])
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_rotates(self):
+        """Testa a troca do refresh token, de uso único."""
+        res = self.client.post(REFRESH_URL, {'refresh': self.pair['refresh']})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res.data['refresh'], self.pair['refresh'])
+        self.assertEqual(self._me(res.data['access']).status_code,
+                         status.HTTP_200_OK)
+
+        res = self.client.post(REFRESH_URL, {'refresh': self.pair['refresh']})
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_revoke_tokens(self):
+        """Testa a revogação dos access e refresh tokens emitidos."""
+        self._me(self.pair['access'])
+
+        res = APIClient().post(
+            REVOKE_URL, HTTP_AUTHORIZATION=f'Bearer {self.pair["access"]}')
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self._me(self.pair['access']).status_code,
+                         status.HTTP_401_UNAUTHORIZED)
+        res = self.client.post(REFRESH_URL, {'refresh': self.pair['refresh']})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(RefreshToken.objects.filter(user=self.user).exists())
+
+    def test_password_change_revokes(self):
+        """Testa a revogação dos tokens ao trocar a senha."""
+        APIClient().patch(
+            ME_URL, {'password': 'novasenha123'},
+            HTTP_AUTHORIZATION=f'Bearer {self.pair["access"]}')
+
+        res = self._me(self.pair['access'])
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
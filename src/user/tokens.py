@@ -0,0 +1,103 @@
+"""
+Access tokens assinados e refresh tokens do usuário.
+
+O access token é curto e assinado (HMAC com a SECRET_KEY) com o id e a
+token_version do usuário: a verificação não consulta o banco. O refresh
+token é longo, aleatório e guardado apenas pelo hash; cada uso o troca
+por um novo par. Incrementar token_version revoga os dois tipos.
+"""
+
+import hashlib
+import secrets
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import RefreshToken
+
+ACCESS_TOKEN_SALT = 'user.tokens.access'
+
+
+class InvalidToken(Exception):
+    """Token inválido, expirado ou revogado."""
+
+
+def _hash(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def create_access_token(user) -> str:
+    """Retorna um access token assinado para o usuário."""
+    return signing.dumps(
+        {'uid': user.id, 'ver': user.token_version},
+        salt=ACCESS_TOKEN_SALT,
+    )
+
+
+def read_access_token(token: str) -> dict:
+    """Retorna o payload do access token, validando assinatura e idade."""
+    try:
+        return signing.loads(
+            token,
+            salt=ACCESS_TOKEN_SALT,
+            max_age=settings.ACCESS_TOKEN_TTL,
+        )
+    except signing.BadSignature as error:
+        raise InvalidToken(str(error)) from error
+
+
+def issue_tokens(user) -> dict:
+    """Cria e retorna um par de access e refresh tokens."""
+    key = secrets.token_urlsafe(32)
+    RefreshToken.objects.create(
+        user=user,
+        key_hash=_hash(key),
+        token_version=user.token_version,
+        expires_at=timezone.now() + timedelta(
+            seconds=settings.REFRESH_TOKEN_TTL),
+    )
+
+    return {
+        'access': create_access_token(user),
+        'refresh': key,
+        'expires_in': settings.ACCESS_TOKEN_TTL,
+    }
+
+
+def rotate_refresh_token(key: str) -> dict:
+    """Troca o refresh token por um novo par, invalidando o usado."""
+    with transaction.atomic():
+        refresh = RefreshToken.objects.select_related(
+            'user',
+        ).select_for_update(
+            of=('self',),
+        ).filter(key_hash=_hash(key)).first()
+        if refresh is None:
+            raise InvalidToken('Refresh token inválido.')
+
+        # Uso único: o token é removido mesmo quando expirado ou revogado.
+        refresh.delete()
+        user = refresh.user
+        valid = (
+            refresh.expires_at > timezone.now()
+            and refresh.token_version == user.token_version
+            and user.is_active
+        )
+
+    if not valid:
+        raise InvalidToken('Refresh token expirado ou revogado.')
+
+    return issue_tokens(user)
+
+
+def revoke_tokens(user) -> None:
+    """Revoga os access e refresh tokens emitidos para o usuário."""
+    user.token_version = F('token_version') + 1
+    user.save(update_fields=['token_version'])
+    user.refresh_from_db(fields=['token_version'])
+    RefreshToken.objects.filter(user=user).delete()
@@ -1,9 +1,23 @@
 """Views para a rota User da API."""
 
-from rest_framework import generics, authentication, permissions
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, permissions, status
 from rest_framework.authtoken.views import ObtainAuthToken
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.response import Response
 from rest_framework.settings import api_settings
-from user.serializers import UserSerializer, AuthTokenSerializer
+from rest_framework.views import APIView
+from user import authentication, tokens
+from user.authentication import (
+    CachedTokenAuthentication,
+    SignedTokenAuthentication,
+)
+from user.serializers import (
+    AuthTokenSerializer,
+    RefreshTokenSerializer,
+    TokenPairSerializer,
+    UserSerializer,
+)
 
 
 class CreateUserView(generics.CreateAPIView):
@@ -20,9 +34,76 @@ class CreateTokenView(ObtainAuthToken):
 class ManageUserView(generics.RetrieveUpdateAPIView):
     """Administra a autenticação do usuário."""
     serializer_class = UserSerializer
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [
+        CachedTokenAuthentication,
+        SignedTokenAuthentication,
+    ]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
         """Busca e retorna o usuário autenticado."""
         return self.request.user
+
+    def perform_update(self, serializer):
+        """Atualiza o usuário e o descarta do cache de autenticação."""
+        serializer.save()
+        # request.user vem do cache: sem isso, o nome novo só apareceria
+        # após o TTL. Vale apenas para este usuário.
+        authentication.invalidate(serializer.instance.pk)
+
+
+class CreateAccessTokenView(APIView):
+    """Cria um par de access e refresh tokens para o usuário."""
+    serializer_class = AuthTokenSerializer
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES
+
+    @extend_schema(request=AuthTokenSerializer, responses=TokenPairSerializer)
+    def post(self, request):
+        """Valida as credenciais e retorna os tokens."""
+        serializer = AuthTokenSerializer(
+            data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+
+        return Response(tokens.issue_tokens(serializer.validated_data['user']))
+
+
+class RefreshAccessTokenView(APIView):
+    """Troca o refresh token por um novo par de tokens."""
+    serializer_class = RefreshTokenSerializer
+    authentication_classes = []
+
+    def get_authenticate_header(self, request):
+        """Responde 401 (e não 403) ao refresh token inválido."""
+        return SignedTokenAuthentication.keyword
+
+    @extend_schema(
+        request=RefreshTokenSerializer,
+        responses=TokenPairSerializer,
+    )
+    def post(self, request):
+        """Valida o refresh token e retorna os novos tokens."""
+        serializer = RefreshTokenSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            pair = tokens.rotate_refresh_token(
+                serializer.validated_data['refresh'])
+        except tokens.InvalidToken as error:
+            raise AuthenticationFailed(str(error))
+
+        return Response(pair)
+
+
+class RevokeTokensView(APIView):
+    """Revoga os access e refresh tokens do usuário autenticado."""
+    authentication_classes = [
+        CachedTokenAuthentication,
+        SignedTokenAuthentication,
+    ]
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(request=None, responses={204: None})
+    def post(self, request):
+        """Incrementa a token_version do usuário."""
+        tokens.revoke_tokens(request.user)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)